@@ -0,0 +1,6 @@
+# benchmarks/__init__.py
+"""
+Offline benchmarks for the StreamFlow Framework.
+Run from the repository root, e.g. `python -m benchmarks.startup`, or the
+whole suite with baselines: `python -m benchmarks run|compare`.
+"""
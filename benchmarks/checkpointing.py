@@ -0,0 +1,97 @@
+# benchmarks/checkpointing.py
+"""
+Checkpoint Overhead: runs the same file -> JSON Lines -> file pipeline with and
+without checkpointing and reports the relative cost per checkpoint interval.
+
+Uses a generated temporary file, so it runs offline.
+
+Usage:
+    python -m benchmarks.checkpointing [--records 200000] [--interval 10000] [--runs 3]
+"""
+import argparse
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.app import StreamClient
+from src.app.domain.models.packet import PayloadSubject
+from src.app.ports.output.middleware_processor import MapProcessor
+from src.infrastructure.processors import JsonLinesDecoder
+
+
+class Encode(MapProcessor):
+    name = "encode"
+    input_subject = PayloadSubject.DICT
+    output_subject = PayloadSubject.BYTES
+
+    def transform(self, payload: Any) -> Any:
+        return (json.dumps(payload) + "\n").encode()
+
+
+def time_run(client: StreamClient, workdir: Path, interval: Optional[int]) -> Dict[str, Any]:
+    pipeline = (
+        client.pipeline("posix://bench/input.jsonl", chunk_size=64 * 1024)
+        .pipe(JsonLinesDecoder())
+        .pipe(Encode())
+        .write("posix://bench/output.jsonl")
+    )
+    if interval is not None:
+        pipeline.checkpoint(workdir / "bench.ckpt", interval=interval)
+
+    orchestrator = pipeline.build()
+    start = time.perf_counter()
+    orchestrator.run()
+    elapsed = time.perf_counter() - start
+    stats = orchestrator.checkpoint_stats
+    return {
+        "seconds": elapsed,
+        "checkpoints": stats.count if stats else 0,
+        "checkpoint_seconds": stats.seconds if stats else 0.0,
+    }
+
+
+def measure(records: int = 200000, interval: int = 10000, runs: int = 3) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="streamflow-bench-") as directory:
+        workdir = Path(directory)
+        with open(workdir / "input.jsonl", "w") as handle:
+            for index in range(records):
+                handle.write(json.dumps({"id": index, "group": index % 97, "value": index * 0.5}) + "\n")
+
+        client = StreamClient()
+        client.add_resource("bench", "posix", str(workdir))
+        try:
+            plain = [time_run(client, workdir, None) for _ in range(runs)]
+            checkpointed = [time_run(client, workdir, interval) for _ in range(runs)]
+        finally:
+            client.close()
+
+    baseline = statistics.median(run["seconds"] for run in plain)
+    with_checkpoints = statistics.median(run["seconds"] for run in checkpointed)
+    last = checkpointed[-1]
+    return {
+        "records": records,
+        "interval": interval,
+        "baseline_s": round(baseline, 4),
+        "checkpointed_s": round(with_checkpoints, 4),
+        "checkpoints": last["checkpoints"],
+        "ms_per_checkpoint": round(last["checkpoint_seconds"] / max(1, last["checkpoints"]) * 1000, 3),
+        "overhead_pct": round((with_checkpoints / baseline - 1) * 100, 2),
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=200000, help="JSON lines in the generated input.")
+    parser.add_argument("--interval", type=int, default=10000, help="Source Packets between checkpoints.")
+    parser.add_argument("--runs", type=int, default=3, help="Repetitions (median is reported).")
+    args = parser.parse_args(argv)
+
+    print(json.dumps(measure(args.records, args.interval, args.runs), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
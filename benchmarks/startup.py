@@ -0,0 +1,79 @@
+# benchmarks/startup.py
+"""
+Import-Time Budget: measures 'import src.app' + StreamClient() in fresh interpreters.
+
+Fails (exit code 1) when the median exceeds the budget or when a deferred 
+dependency (e.g. httpx) leaks into the startup path.
+
+Usage:
+    python -m benchmarks.startup [--budget-ms 100] [--runs 7]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that must only be imported on first use of their protocol
+DEFERRED_MODULES = ("httpx", "importlib.metadata", "concurrent.futures", "psutil")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from src.app import StreamClient
+StreamClient()
+elapsed_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({"elapsed_ms": elapsed_ms, "loaded": [m for m in %r if m in sys.modules]}))
+""" % (DEFERRED_MODULES,)
+
+
+def measure(runs: int = 7) -> Dict[str, Any]:
+    """Runs the probe in 'runs' fresh interpreters and summarizes the timings."""
+    samples: List[float] = []
+    leaked: set = set()
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        samples.append(result["elapsed_ms"])
+        leaked.update(result["loaded"])
+
+    return {
+        "median_ms": statistics.median(samples),
+        "min_ms": min(samples),
+        "max_ms": max(samples),
+        "leaked_modules": sorted(leaked),
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=100.0, help="Maximum median startup time.")
+    parser.add_argument("--runs", type=int, default=7, help="Number of fresh interpreters.")
+    args = parser.parse_args(argv)
+
+    result = measure(args.runs)
+    print(json.dumps(result, indent=2))
+
+    if result["leaked_modules"]:
+        print(f"[FAIL] Deferred modules imported at startup: {result['leaked_modules']}")
+        return 1
+    if result["median_ms"] > args.budget_ms:
+        print(f"[FAIL] Startup {result['median_ms']:.1f} ms exceeds budget {args.budget_ms:.1f} ms")
+        return 1
+
+    print(f"[OK] Startup {result['median_ms']:.1f} ms within budget {args.budget_ms:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,432 @@
+# benchmarks/suite.py
+"""
+Benchmark Suite: reproducible, offline benchmarks of the core I/O paths with
+JSON baselines and a regression check.
+
+Everything runs against generated local files and a stand-in HTTP server on
+127.0.0.1 (no network access). Groups:
+- packet:     Packet construction and spawn()
+- handle:     get_handle() resolution and open/close cycles (unpooled, pooled)
+- posix:      PosixFileStream read throughput per FileReadMode and chunk size,
+              sink write throughput per chunk size
+- http:       HttpStream read throughput per HttpReadMode
+- middleware: per-stage overhead of a Map/Filter chain (unfused, fused)
+- startup:    import + bootstrap time (see benchmarks.startup)
+
+Every metric is the median of '--runs' repetitions after one warm-up run.
+
+Usage:
+    python -m benchmarks run [--only posix http] [--size-mb 16] [--runs 5] [--save NAME | --output PATH]
+    python -m benchmarks compare BASELINE [CURRENT] [--threshold 10]
+
+BASELINE/CURRENT are baseline names (benchmarks/baselines/NAME.json) or paths.
+Without CURRENT, the suite is run now with the baseline's settings. 'compare'
+exits with code 1 when a metric is worse than the baseline by more than
+'--threshold' percent.
+"""
+import argparse
+import contextlib
+import functools
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+
+KIB = 1024
+CHUNK_SIZES = (4 * KIB, 64 * KIB, 1024 * KIB)
+HTTP_CHUNK_SIZE = 64 * KIB
+
+# Metric = {"value": float, "unit": str, "better": "higher" | "lower"}
+Metric = Dict[str, Any]
+Case = Callable[['Workspace'], Dict[str, Metric]]
+
+CASES: Dict[str, Case] = {}
+
+
+def case(group: str) -> Callable[[Case], Case]:
+    """Registers a benchmark group (run in registration order)."""
+    def register(function: Case) -> Case:
+        CASES[group] = function
+        return function
+    return register
+
+
+# --- FIXTURES ---
+
+class Workspace:
+    """
+    Generated inputs shared by all groups: a deterministic ASCII JSON-lines
+    file (readable in every FileReadMode), a StreamClient with the workspace
+    registered as 'bench', and the base URL of the local HTTP server.
+    """
+    def __init__(self, root: Path, size_mb: int, runs: int, http_url: str) -> None:
+        # Deferred: 'python -m benchmarks --help' stays instant
+        from src.app import StreamClient
+
+        self.root = root
+        self.runs = runs
+        self.http_url = http_url
+        self.data = generate_lines(size_mb * 1024 * 1024)
+        self.size = len(self.data)
+        (root / "input.jsonl").write_bytes(self.data)
+
+        self.client = StreamClient({"log_level": "NONE"})
+        self.client.add_resource("bench", "posix", str(root))
+        self.file_uri = "posix://bench/input.jsonl"
+        self.sink_uri = "posix://bench/output.bin"
+
+    def close(self) -> None:
+        self.client.close()
+
+
+def generate_lines(size: int) -> bytes:
+    """Deterministic JSON-lines content of (at least) 'size' bytes."""
+    tags = ("alpha", "beta", "gamma", "delta")
+    lines: List[str] = []
+    total = index = 0
+    while total < size:
+        line = f'{{"id": {index}, "value": {index * 7919 % 1000 / 1000:.3f}, "tag": "{tags[index % 4]}"}}\n'
+        lines.append(line)
+        total += len(line)
+        index += 1
+    return "".join(lines).encode("ascii")
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@contextlib.contextmanager
+def local_server(directory: Path) -> Iterator[str]:
+    """Serves 'directory' on an ephemeral 127.0.0.1 port; yields the base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(_QuietHandler, directory=str(directory)))
+    thread = threading.Thread(target=server.serve_forever, name="benchmark-http", daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+# --- MEASUREMENT ---
+
+def median_seconds(action: Callable[[], Any], runs: int) -> float:
+    """Median wall time of 'action' over 'runs' repetitions, after one warm-up."""
+    action()
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        action()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def per_op(action: Callable[[], Any], operations: int, runs: int, unit: str = "ns/op") -> Metric:
+    scale = 1e9 if unit == "ns/op" else 1e6
+    return metric(median_seconds(action, runs) / operations * scale, unit, "lower")
+
+
+def throughput(action: Callable[[], Any], size: int, runs: int) -> Metric:
+    return metric(size / median_seconds(action, runs) / 1e6, "MB/s", "higher")
+
+
+def metric(value: float, unit: str, better: str) -> Metric:
+    return {"value": round(value, 3), "unit": unit, "better": better}
+
+
+def drain(handle: Any) -> int:
+    """Opens, reads to the end and closes a handle; returns the Packet count."""
+    with handle:
+        count = 0
+        for _ in handle.read():
+            count += 1
+    return count
+
+
+def chunk_label(size: int) -> str:
+    return f"{size // KIB}k"
+
+
+# --- CASES ---
+
+@case("packet")
+def packet_cases(workspace: Workspace) -> Dict[str, Metric]:
+    from src.app.domain.models.packet import FlowSignal, Packet, PayloadSubject, StreamContext
+
+    operations = 20000
+    context = StreamContext(origin="bench://memory", current="bench://memory", trace_id="suite-bench")
+    parent = Packet(payload=b"x", context=context, subject=PayloadSubject.BYTES, signal=FlowSignal.STREAM_DATA)
+
+    def construct() -> None:
+        for _ in range(operations):
+            Packet(payload=b"x", context=context, subject=PayloadSubject.BYTES, signal=FlowSignal.STREAM_DATA)
+
+    def spawn() -> None:
+        for _ in range(operations):
+            parent.spawn(b"y")
+
+    return {
+        "packet.construct": per_op(construct, operations, workspace.runs),
+        "packet.spawn": per_op(spawn, operations, workspace.runs),
+    }
+
+
+@case("handle")
+def handle_cases(workspace: Workspace) -> Dict[str, Metric]:
+    client, runs = workspace.client, workspace.runs
+    operations = 500
+    http_uri = f"{workspace.http_url}/input.jsonl"
+
+    def resolve(uri: str) -> Callable[[], None]:
+        def action() -> None:
+            for _ in range(operations):
+                client.get_handle(uri)
+        return action
+
+    def cycle(pooled: bool) -> Callable[[], None]:
+        def action() -> None:
+            for _ in range(operations):
+                with client.get_handle(workspace.file_uri, pooled=pooled):
+                    pass
+        return action
+
+    return {
+        "handle.resolve.posix": per_op(resolve(workspace.file_uri), operations, runs, "us/op"),
+        "handle.resolve.http": per_op(resolve(http_uri), operations, runs, "us/op"),
+        "handle.cycle.unpooled": per_op(cycle(False), operations, runs, "us/op"),
+        "handle.cycle.pooled": per_op(cycle(True), operations, runs, "us/op"),
+    }
+
+
+@case("posix")
+def posix_cases(workspace: Workspace) -> Dict[str, Metric]:
+    from src.infrastructure.adapters.posix_file.enums import FileReadMode
+
+    client, runs, size = workspace.client, workspace.runs, workspace.size
+    results: Dict[str, Metric] = {}
+
+    def read(mode: FileReadMode, chunk_size: int) -> Callable[[], int]:
+        file_mode = "rb" if mode is FileReadMode.BYTES else "r"
+        return lambda: drain(client.get_handle(workspace.file_uri, read_mode=mode, file_mode=file_mode, chunk_size=chunk_size))
+
+    for chunk_size in CHUNK_SIZES:
+        for mode in (FileReadMode.BYTES, FileReadMode.TEXT):
+            results[f"posix.read.{mode}.{chunk_label(chunk_size)}"] = throughput(read(mode, chunk_size), size, runs)
+    # LINES ignores chunk_size (one Packet per line)
+    results["posix.read.lines"] = throughput(read(FileReadMode.LINES, CHUNK_SIZES[0]), size, runs)
+
+    for chunk_size in CHUNK_SIZES:
+        chunks = [workspace.data[offset:offset + chunk_size] for offset in range(0, size, chunk_size)]
+
+        def write(chunks: List[bytes] = chunks) -> None:
+            # The contract prints a notice when it resets read_mode for write modes
+            with contextlib.redirect_stdout(io.StringIO()):
+                handle = client.get_handle(workspace.sink_uri, as_sink=True, file_mode="wb")
+            with handle:
+                for chunk in chunks:
+                    handle.write(chunk)
+
+        results[f"posix.write.{chunk_label(chunk_size)}"] = throughput(write, size, runs)
+    return results
+
+
+@case("http")
+def http_cases(workspace: Workspace) -> Dict[str, Metric]:
+    from src.infrastructure.adapters.http.enums import HttpReadMode
+
+    client, runs = workspace.client, workspace.runs
+    url = f"{workspace.http_url}/input.jsonl"
+    results: Dict[str, Metric] = {}
+    for mode in HttpReadMode:
+        read = lambda mode=mode: drain(client.get_handle(url, read_mode=mode, chunk_size=HTTP_CHUNK_SIZE))
+        results[f"http.read.{mode}"] = throughput(read, workspace.size, runs)
+    return results
+
+
+@case("middleware")
+def middleware_cases(workspace: Workspace) -> Dict[str, Metric]:
+    from benchmarks.fusion import build_chain, build_packets, time_chain
+    from src.app.use_cases.pipeline import fuse
+
+    stages, packets = 10, 20000
+    chain = build_chain(stages)
+    data = build_packets(packets)
+    operations = stages * packets
+    return {
+        "middleware.chain.unfused": per_op(lambda: time_chain(chain, data), operations, workspace.runs),
+        "middleware.chain.fused": per_op(lambda: time_chain(fuse(chain), data), operations, workspace.runs),
+    }
+
+
+@case("startup")
+def startup_cases(workspace: Workspace) -> Dict[str, Metric]:
+    from benchmarks.startup import measure
+
+    return {"startup.import": metric(measure(max(workspace.runs, 3))["median_ms"], "ms", "lower")}
+
+
+# --- RUN & COMPARE ---
+
+def run_suite(groups: Optional[List[str]] = None, size_mb: int = 16, runs: int = 5) -> Dict[str, Any]:
+    """Runs the selected groups (all by default) and returns a baseline document."""
+    selected = list(CASES) if not groups else groups
+    unknown = sorted(set(selected) - set(CASES))
+    if unknown:
+        raise ValueError(f"Unknown benchmark groups: {unknown}. Available: {list(CASES)}")
+
+    results: Dict[str, Metric] = {}
+    with tempfile.TemporaryDirectory(prefix="streamflow-bench-") as directory:
+        root = Path(directory)
+        with local_server(root) as http_url:
+            workspace = Workspace(root, size_mb, runs, http_url)
+            try:
+                for group in CASES:
+                    if group in selected:
+                        results.update(CASES[group](workspace))
+            finally:
+                workspace.close()
+
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "groups": [group for group in CASES if group in selected],
+            "size_mb": size_mb,
+            "runs": runs,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 10.0) -> List[Dict[str, Any]]:
+    """
+    Compares two baseline documents metric by metric.
+    'change' is the relative difference in percent (positive: current is better);
+    a metric worse by more than 'threshold' percent is a 'regression'.
+    """
+    rows: List[Dict[str, Any]] = []
+    before, after = baseline["results"], current["results"]
+    for name in list(before) + [name for name in after if name not in before]:
+        old, new = before.get(name), after.get(name)
+        if old is None or new is None:
+            rows.append({"name": name, "baseline": old and old["value"], "current": new and new["value"],
+                         "change": None, "status": "new" if old is None else "missing"})
+            continue
+
+        change = (new["value"] - old["value"]) / old["value"] * 100 if old["value"] else 0.0
+        if old["better"] == "lower":
+            change = -change
+        status = "regression" if change < -threshold else "improved" if change > threshold else "ok"
+        rows.append({"name": name, "baseline": old["value"], "current": new["value"], "unit": old["unit"],
+                     "change": round(change, 1), "status": status})
+    return rows
+
+
+def load(reference: str) -> Dict[str, Any]:
+    """Loads a baseline by name (benchmarks/baselines/NAME.json) or path."""
+    path = Path(reference)
+    if not path.suffix:
+        path = BASELINE_DIR / f"{reference}.json"
+    with open(path, "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def save(document: Dict[str, Any], path: Path) -> Path:
+    """Atomic write: an interrupted run never leaves a truncated baseline."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(path.name + ".tmp")
+    with open(temporary, "w", encoding="utf-8") as handle:
+        json.dump(document, handle, indent=2)
+        handle.write("\n")
+    os.replace(temporary, path)
+    return path
+
+
+# --- CLI ---
+
+def _print_results(document: Dict[str, Any]) -> None:
+    for name, result in document["results"].items():
+        print(f"{name:<32} {result['value']:>12.3f} {result['unit']}")
+
+
+def _print_comparison(rows: List[Dict[str, Any]]) -> None:
+    for row in rows:
+        if row["change"] is None:
+            print(f"{row['name']:<32} {'':>12} {'':>12} {'':>8}  {row['status']}")
+            continue
+        print(f"{row['name']:<32} {row['baseline']:>12.3f} {row['current']:>12.3f} {row['change']:>+7.1f}%  {row['status']}")
+
+
+def _environment_drift(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[Tuple[str, Any, Any]]:
+    keys = ("python", "platform", "machine", "cpus", "size_mb")
+    return [(key, baseline["meta"].get(key), current["meta"].get(key))
+            for key in keys if baseline["meta"].get(key) != current["meta"].get(key)]
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run the suite and print (or store) the results.")
+    run.add_argument("--only", nargs="+", choices=list(CASES), help="Groups to run (default: all).")
+    run.add_argument("--size-mb", type=int, default=16, help="Size of the generated input file.")
+    run.add_argument("--runs", type=int, default=5, help="Repetitions per metric (median is reported).")
+    target = run.add_mutually_exclusive_group()
+    target.add_argument("--save", metavar="NAME", help="Store as benchmarks/baselines/NAME.json.")
+    target.add_argument("--output", metavar="PATH", help="Store the results at PATH.")
+
+    check = commands.add_parser("compare", help="Flag regressions against a stored baseline.")
+    check.add_argument("baseline", help="Baseline name or path.")
+    check.add_argument("current", nargs="?", help="Results to check (default: run the suite now).")
+    check.add_argument("--threshold", type=float, default=10.0, help="Allowed slowdown in percent.")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        document = run_suite(args.only, args.size_mb, args.runs)
+        _print_results(document)
+        if args.save or args.output:
+            path = save(document, Path(args.output) if args.output else BASELINE_DIR / f"{args.save}.json")
+            print(f"[OK] Results stored at {path}")
+        return 0
+
+    baseline = load(args.baseline)
+    if args.current:
+        current = load(args.current)
+    else:
+        meta = baseline["meta"]
+        current = run_suite(meta["groups"], meta["size_mb"], meta["runs"])
+
+    for key, old, new in _environment_drift(baseline, current):
+        print(f"[WARNING] {key} differs from the baseline: {old!r} -> {new!r}")
+    rows = compare(baseline, current, args.threshold)
+    _print_comparison(rows)
+
+    regressions = [row["name"] for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"[FAIL] {len(regressions)} metric(s) regressed beyond {args.threshold:g}%: {regressions}")
+        return 1
+    print(f"[OK] No regression beyond {args.threshold:g}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
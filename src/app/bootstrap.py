@@ -6,12 +6,18 @@ from src.app.domain.services.resource_catalog import ResourceCatalog
 from src.app.domain.services.resource_factory import ResourceFactory
 from src.app.registry.streams import StreamRegistry
 from src.app.use_cases.manager import StreamManager
+from src.app.use_cases.handle_pool import HandlePool
+from src.app.use_cases.telemetry import Telemetry
+from src.app.use_cases.tracing import Tracer
+from src.app.use_cases.memory import MemoryGovernor
 
 # Infrastructure Imports
 from src.infrastructure.adapters.posix_file.adapter import PosixFileStream
 from src.infrastructure.adapters.posix_file.boundary import PosixResourceBoundary
 from src.infrastructure.adapters.posix_file.policy import PosixFilePolicy
-from src.infrastructure.adapters.http.adapter import HttpStream
+
+# Deferred Infrastructure: imported on first use (keeps 'httpx' out of startup)
+HTTP_ADAPTER = "src.infrastructure.adapters.http.adapter:HttpStream"
 
 class Bootstrap:
     """
@@ -31,7 +37,9 @@ class Bootstrap:
 
         # 2. REGISTRY: Central blueprint storage for Adapters
         # We register 'posix' and 'file' as supported protocols for local IO.
-        registry = StreamRegistry()
+        # Third-party 'streamflow.adapters' entry points are scanned on the first 
+        # unknown protocol, so startup never pays for metadata discovery.
+        registry = StreamRegistry(discover_entry_points=True)
         posix_policy = PosixFilePolicy()
         
         # Governed Protocol
@@ -48,22 +56,23 @@ class Bootstrap:
             policy=posix_policy
         )
 
-        # HTTP Protocols
+        # HTTP Protocols (Lazy)
         registry.register(
             protocol="http",
-            adapter_cls=HttpStream,
+            adapter_cls=HTTP_ADAPTER,
             policy=None
         )
         registry.register(
             protocol="https",
-            adapter_cls=HttpStream,
+            adapter_cls=HTTP_ADAPTER,
             policy=None
         )
         
         # 3. RESOURCE SERVICES: The High-Resolution Identity Stack
         # - Catalog: Stores internal keys and their physical anchors
         # - Factory: Promotes strings to StreamLocation objects
-        catalog = ResourceCatalog()
+        # - Resolutions are memoized in a bounded LRU owned by the Catalog
+        catalog = ResourceCatalog(cache_size=app_config.resolution_cache_size)
         
         # Register the Boundary for the 'posix' protocol
         catalog.register(
@@ -79,12 +88,52 @@ class Bootstrap:
         # 4. RESOLVER: The Waterfall Engine for settings merging
         resolver = SettingsResolver()
 
-        # 5. DEPENDENCY INJECTION: Construct the Orchestrator
+        # 5. POOL: Idle adapters for opt-in 'pooled' handles
+        pool = HandlePool(
+            max_idle=app_config.pool_max_idle,
+            ttl=app_config.pool_ttl
+        )
+
+        # 6. TELEMETRY: Per-handle and per-stage metrics, the 'streamflow' logger
+        telemetry = Telemetry(
+            enabled=app_config.enable_telemetry,
+            sample_every=app_config.telemetry_sample_every,
+            max_series=app_config.telemetry_max_series,
+            log_level=app_config.log_level
+        )
+
+        # 7. TRACING: Opt-in span export (AppConfig.trace_path)
+        tracer = None
+        if app_config.trace_path is not None:
+            tracer = Tracer(
+                path=app_config.trace_path,
+                sample_every=app_config.trace_sample_every,
+                batch_size=app_config.trace_batch_size,
+                buffer_size=app_config.trace_buffer_size,
+                flush_seconds=app_config.trace_flush_seconds
+            )
+
+        # 8. MEMORY: Process-wide budget; idle pooled adapters are dropped under pressure
+        memory = None
+        if app_config.memory_budget is not None:
+            memory = MemoryGovernor(
+                budget=app_config.memory_budget,
+                high_water=app_config.memory_high_water,
+                watch_rss=app_config.memory_watch_rss,
+                max_throttle_seconds=app_config.memory_max_throttle_seconds
+            )
+            memory.add_reclaimer(pool.clear)
+
+        # 9. DEPENDENCY INJECTION: Construct the Orchestrator
         # We inject all collaborators into the StreamManager.
         return StreamManager(
             registry=registry,
             factory=factory,
             catalog=catalog,
             app_config=app_config,
-            resolver=resolver
+            resolver=resolver,
+            pool=pool,
+            telemetry=telemetry,
+            tracer=tracer,
+            memory=memory
         )
@@ -1,6 +1,7 @@
 # src/app/domain/models/app_config.py
 from enum import Enum
 from dataclasses import dataclass
+from typing import Optional
 
 class Environment(str, Enum):
     DEV = "DEV"
@@ -17,4 +18,18 @@ class AppConfig:
     env:Environment = Environment.DEV
     log_level: LogLevel = LogLevel.INFO
     chunk_size: int = 1024
-    enable_telemetry: bool = True
\ No newline at end of file
+    enable_telemetry: bool = True
+    telemetry_sample_every: int = 16
+    telemetry_max_series: int = 1024
+    trace_path: Optional[str] = None
+    trace_sample_every: int = 64
+    trace_batch_size: int = 512
+    trace_buffer_size: int = 65536
+    trace_flush_seconds: float = 1.0
+    memory_budget: Optional[int] = 200 * 1024 * 1024
+    memory_high_water: float = 0.8
+    memory_watch_rss: bool = True
+    memory_max_throttle_seconds: float = 1.0
+    resolution_cache_size: int = 4096
+    pool_max_idle: int = 16
+    pool_ttl: float = 300.0
\ No newline at end of file
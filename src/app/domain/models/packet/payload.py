@@ -13,4 +13,6 @@ class PayloadSubject:
     JSON    = PayloadType("document:json")
     DICT    = PayloadType("object:python-dict")
     CHUNK   = PayloadType("stream:chunk")
+    RECORDS = PayloadType("collection:records")  # list of dicts (row batch)
+    COLUMNS = PayloadType("collection:columns")  # dict of field -> values (columnar batch)
     VOID    = PayloadType("system:void")
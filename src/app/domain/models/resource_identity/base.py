@@ -7,6 +7,9 @@ class ResourceIdentity(ABC):
     The Abstract Base for all data identities in the system.
     Ensures that every resource, resolved or logical, has a Key.
     """
+    # Keeps str-based identities free of a per-instance __dict__
+    __slots__ = ()
+
     @property
     @abstractmethod
     def key(self) -> ResourceKey:
@@ -1,4 +1,5 @@
 # src/app/domain/models/resource_identity/logical_uri.py
+import sys
 from urllib.parse import urlparse
 from src.app.domain.models.resource_identity.base import ResourceIdentity
 from src.app.domain.models.resource_identity.types import ResourceKey
@@ -9,22 +10,33 @@ class LogicalURI(str, ResourceIdentity):
     - Modified to also accept user registered protocols for resolution
     - e.g. add_resource("posix://...") allows for resolve("posix://key")
     - Uses RFC 3986 standards
+    - Parsed once at construction; components are stored in slots
     """
+    __slots__ = ("_protocol", "_key", "_path", "_query")
+
     def __new__(cls, value: str):
         if "://" not in value:
             # 
             raise ValueError(f"LogicalURI requires a scheme; e.g. '://...' and got: {value}")
-        return super().__new__(cls, value)
+        instance = super().__new__(cls, value)
+
+        # Single parse; the scheme is interned for cheap protocol dispatch
+        parsed = urlparse(value)
+        instance._protocol = sys.intern(parsed.scheme)
+        instance._key = ResourceKey(parsed.netloc)
+        instance._path = parsed.path.lstrip("/")
+        instance._query = parsed.query
+        return instance
 
     @property
     def key(self) -> ResourceKey:
         # registry://scans/file.csv -> scans
-        return ResourceKey(urlparse(self).netloc)
+        return self._key
     
     @property
     def protocol(self) -> str:
         """Extracts the scheme (e.g. registry, posix, file, https...)"""
-        return urlparse(self).scheme
+        return self._protocol
     
     @property
     def path(self) -> str:
@@ -33,4 +45,9 @@ class LogicalURI(str, ResourceIdentity):
         - i.e. sub-path 
         - from 'file://path/to/file' --> to 'to/file/'
         """
-        return urlparse(self).path.lstrip("/")
\ No newline at end of file
+        return self._path
+
+    @property
+    def query(self) -> str:
+        """Extracts the query string (without the leading '?')"""
+        return self._query
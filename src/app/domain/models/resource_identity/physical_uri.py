@@ -1,4 +1,5 @@
 # src/app/domain/models/resource_identity/physical_uri.py
+import sys
 from src.app.domain.models.resource_identity.base import ResourceIdentity
 from src.app.domain.models.resource_identity.types import ResourceKey
 
@@ -6,17 +7,41 @@ class PhysicalURI(str, ResourceIdentity):
     """
     A direct-access coordinate (https://, s3://).
     Inherits from str for compatibility with network clients.
+    Parsed once at construction; components are stored in slots.
     """
+    __slots__ = ("_protocol", "_address", "_key", "_query")
+
     def __new__(cls, value: str):
         if "://" not in value:
             raise ValueError(f"PhysicalURI requires a scheme. Got: {value}")
-        return super().__new__(cls, value)
+        instance = super().__new__(cls, value)
+
+        # Single split; the scheme is interned for cheap protocol dispatch
+        scheme, _, address = value.partition("://")
+        instance._protocol = sys.intern(scheme)
+        instance._address = address
+        instance._key = ResourceKey(address.split("/", 1)[0])
+        instance._query = address.partition("?")[2]
+        return instance
 
     @property
     def key(self) -> ResourceKey:
         # For physical URIs, the 'key' is often the domain or bucket
-        return ResourceKey(self.split("://")[1].split("/")[0])
+        return self._key
 
     @property
     def protocol(self) -> str:
-        return self.split("://")[0]
\ No newline at end of file
+        return self._protocol
+
+    @property
+    def address(self) -> str:
+        """
+        Everything after the scheme separator.
+        - e.g. 'file:///srv/data/a.csv' --> '/srv/data/a.csv'
+        """
+        return self._address
+
+    @property
+    def query(self) -> str:
+        """Extracts the query string (without the leading '?')"""
+        return self._query
@@ -3,4 +3,4 @@ from src.app.domain.models.resource_identity.physical_uri import PhysicalURI
 
 class RemoteURL(PhysicalURI):
     """Specific implementation for HTTP/S3 transports."""
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file
@@ -0,0 +1,17 @@
+# src/app/domain/models/settings_signature.py
+from typing import Any, FrozenSet, Mapping, Optional
+
+
+def settings_signature(settings: Mapping[str, Any]) -> Optional[FrozenSet]:
+    """
+    Hashable fingerprint of a settings bag, or None if any value is unhashable.
+    - The value's type is included so that 1, 1.0 and True never collide
+    - Shared by the SettingsResolver (merge memoization) and the StreamContract
+      spec (validated-instance memoization)
+    """
+    try:
+        signature = frozenset((k, type(v), v) for k, v in settings.items())
+        hash(signature)
+    except TypeError:
+        return None
+    return signature
@@ -1,11 +1,15 @@
 # src/app/domain/models/streams/stream_handle.py
-from typing import Iterator, Any, TYPE_CHECKING
+import time
+from typing import Iterator, Any, Optional, TYPE_CHECKING
 from src.app.domain.models.streams.stream_capacity import StreamCapacity
 from src.app.domain.models.streams.stream_context import StreamContext
 from src.app.domain.models.packet.base import Packet
+from src.app.domain.models.telemetry.stage_metrics import StageMetrics, payload_size
 
 if TYPE_CHECKING:
     from src.app.ports.output.datastream import DataStream
+    from src.app.use_cases.tracing import HandleTrace
+    from src.app.use_cases.memory import Reservation
 
 class StreamHandle:
     """
@@ -13,13 +17,27 @@ class StreamHandle:
     - Provides introspection
     - Manages the lifecycle of a stream
     - Packet Factory
+    - Telemetry: counts and samples reads/writes into 'metrics' (when given)
+    - Tracing: records open/read/write/close spans into 'trace' (when given)
+    - Memory: holds its read-ahead chunk in 'reservation' while open (when given)
 
     """
-    def __init__(self, adapter:'DataStream', capacity:StreamCapacity, context:StreamContext) -> None:
+    def __init__(
+            self,
+            adapter:'DataStream',
+            capacity:StreamCapacity,
+            context:StreamContext,
+            metrics:Optional[StageMetrics] = None,
+            trace:Optional['HandleTrace'] = None,
+            reservation:Optional['Reservation'] = None
+    ) -> None:
         # Define Props
         self._adapter   = adapter   # Worker
         self.capacity   = capacity  # Introspector
         self.context    = context   # Passport
+        self.metrics    = metrics   # Telemetry (None: uninstrumented)
+        self.trace      = trace     # Tracing (None: untraced)
+        self.reservation = reservation  # Memory budget (None: unaccounted)
         self.uri        = adapter.uri
 
     # --- PROPERTIES ---
@@ -39,24 +57,82 @@ class StreamHandle:
         if not self.is_open:
             raise IOError(f"Attempted to read from a closed stream: {self.uri}")
         
-        yield from self._adapter.read()
+        packets = self._adapter.read()
+        if self.metrics is not None:
+            packets = self.metrics.observe(packets)
+        if self.trace is not None:
+            packets = self.trace.read(packets)
+        yield from packets
 
     def write(self, payload: Any) -> None:
         """
         Guards writing with the capacity check.
         Wraps raw payload in a Packet before passing to adapter.
+        - Packets (e.g. from a Pipeline) are forwarded as-is to keep their lineage
         """
         if not self.capacity.is_writable:
             raise PermissionError(f"Stream is read-only: {self.uri}")
         
-        packet = Packet(payload=payload, context=self.context)
-        self._adapter.write(packet)
+        packet = payload if isinstance(payload, Packet) else Packet(payload=payload, context=self.context)
+        if self.trace is None:
+            self._write(packet)
+        else:
+            self.trace.write(self._write, packet)
+
+    def tell(self) -> Optional[Any]:
+        """Opaque stream position for checkpoints (None when unsupported)."""
+        return self._adapter.tell()
+
+    def seek(self, position: Any) -> bool:
+        """Resumes at a position from tell() (before or after open). False when unsupported."""
+        return self._adapter.seek(position)
 
     # --- CONTEXT MANAGER ---
 
     def __enter__(self) -> 'StreamHandle':
-        self._adapter.open()
+        if self.trace is None:
+            self._open()
+        else:
+            self.trace.open(self._open)
+        if self.reservation is not None:
+            # A fixed buffer: recorded even beyond the budget
+            self.reservation.resize(self._adapter.chunk_size, force=True)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            if self.trace is None:
+                self._release(exc_type)
+            else:
+                self.trace.close(lambda: self._release(exc_type), exc_val)
+        finally:
+            if self.reservation is not None:
+                self.reservation.release()
+
+    # --- Private Helpers ---
+
+    def _open(self) -> None:
+        self._adapter.open()
+
+    def _release(self, exc_type: Any) -> None:
+        """Ends the handle's use of the adapter (plain handles close it)."""
         self._adapter.close()
+
+    def _write(self, packet: Packet) -> None:
+        metrics = self.metrics
+        if metrics is None:
+            self._adapter.write(packet)
+            return
+
+        try:
+            if metrics.tick():
+                started = time.perf_counter_ns()
+                self._adapter.write(packet)
+                metrics.latency.record(time.perf_counter_ns() - started)
+            else:
+                self._adapter.write(packet)
+        except Exception:
+            metrics.errors += 1
+            raise
+        metrics.packets_in += 1
+        metrics.bytes_in += payload_size(packet.payload)
@@ -0,0 +1,5 @@
+from src.app.domain.models.telemetry.histogram import LatencyHistogram
+from src.app.domain.models.telemetry.span import Span, otel_trace_id
+from src.app.domain.models.telemetry.stage_metrics import StageMetrics, payload_size
+
+__all__ = ["LatencyHistogram", "Span", "StageMetrics", "otel_trace_id", "payload_size"]
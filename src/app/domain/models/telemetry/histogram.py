@@ -0,0 +1,103 @@
+# src/app/domain/models/telemetry/histogram.py
+from typing import Dict, List, Sequence
+
+
+class LatencyHistogram:
+    """
+    HDR-style latency histogram over fixed, log-linear buckets (nanoseconds).
+
+    - Values below 2**SUB_BITS get one bucket each
+    - Every further power of two is split into 2**(SUB_BITS - 1) linear sub-buckets,
+      so a bucket never spans more than 1/16th (6.25%) of its value
+    - Values are clamped at MAX_VALUE (~18 minutes)
+
+    record() is an index computation plus a list increment: no allocation,
+    no sorting, constant memory (BUCKETS counters) whatever the traffic.
+    """
+    SUB_BITS = 5
+    MAX_VALUE = 2 ** 40 - 1
+    BUCKETS = ((MAX_VALUE.bit_length() - SUB_BITS) << (SUB_BITS - 1)) + (1 << SUB_BITS)
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * self.BUCKETS
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    # --- RECORDING ---
+
+    def record(self, nanoseconds: int, count: int = 1) -> None:
+        """Adds 'count' observations of 'nanoseconds' (one sampled batch may stand for many Packets)."""
+        value = nanoseconds if nanoseconds < self.MAX_VALUE else self.MAX_VALUE
+        if value < 0:
+            value = 0
+        self.counts[self.bucket_index(value)] += count
+        self.count += count
+        self.total += value * count
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    # --- QUERIES ---
+
+    def quantile(self, q: float) -> int:
+        """Upper bound (ns) of the bucket holding the q-th observation (0 when empty)."""
+        if not self.count:
+            return 0
+        rank = max(1, round(q * self.count))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self.bucket_upper(index), self.max)
+        return self.max
+
+    def cumulative(self, bounds: Sequence[int]) -> List[int]:
+        """Observations <= each bound (ns, ascending), as needed for Prometheus 'le' buckets."""
+        result: List[int] = []
+        seen = 0
+        index = 0
+        for bound in bounds:
+            while index < self.BUCKETS and self.bucket_upper(index) <= bound:
+                seen += self.counts[index]
+                index += 1
+            result.append(seen)
+        return result
+
+    def summary(self) -> Dict[str, float]:
+        """Sample count, mean and percentiles in microseconds."""
+        return {
+            "samples": self.count,
+            "mean_us": round(self.total / self.count / 1000, 3) if self.count else 0.0,
+            "p50_us": self.quantile(0.50) / 1000,
+            "p90_us": self.quantile(0.90) / 1000,
+            "p99_us": self.quantile(0.99) / 1000,
+            "max_us": self.max / 1000,
+        }
+
+    # --- BUCKET MATH ---
+
+    @classmethod
+    def bucket_index(cls, value: int) -> int:
+        shift = value.bit_length() - cls.SUB_BITS
+        if shift <= 0:
+            return value
+        return (shift << (cls.SUB_BITS - 1)) + (value >> shift)
+
+    @classmethod
+    def bucket_upper(cls, index: int) -> int:
+        """Largest value (inclusive) that falls into the bucket."""
+        if index < (1 << cls.SUB_BITS):
+            return index
+        shift = (index >> (cls.SUB_BITS - 1)) - 1
+        mantissa = index - (shift << (cls.SUB_BITS - 1))
+        return ((mantissa + 1) << shift) - 1
@@ -0,0 +1,109 @@
+# src/app/domain/models/telemetry/span.py
+import hashlib
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+# OpenTelemetry SpanKind (OTLP enum values)
+INTERNAL = 1
+CLIENT = 3
+
+# OpenTelemetry StatusCode
+STATUS_ERROR = 2
+
+_HEX = frozenset("0123456789abcdef")
+
+
+def otel_trace_id(trace_id: str) -> str:
+    """
+    Maps a StreamContext.trace_id to a 32-hex-digit OpenTelemetry trace id.
+    Hex ids (such as the Manager's truncated UUIDs) are zero-padded, so they
+    remain recognizable; any other string is hashed.
+    """
+    digits = trace_id.replace("-", "").lower()
+    if digits and len(digits) <= 32 and set(digits) <= _HEX:
+        return digits.rjust(32, "0")
+    return hashlib.blake2b(trace_id.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def new_span_id() -> str:
+    """A random, non-zero 16-hex-digit span id."""
+    return f"{random.getrandbits(64) or 1:016x}"
+
+
+class Span:
+    """
+    One timed operation within a trace (open, read, a middleware stage...).
+
+    Mutable until finish(); serialized with to_otlp() into the OTLP/JSON span
+    layout (hex ids, unix-nanosecond timestamps as strings, typed attributes).
+    """
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "kind", "attributes", "start_ns", "end_ns", "error")
+
+    def __init__(
+            self,
+            trace_id: str,
+            name: str,
+            parent_id: Optional[str] = None,
+            kind: int = INTERNAL,
+            attributes: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        :param trace_id: OpenTelemetry trace id (see otel_trace_id()).
+        :param name: Operation name.
+        :param parent_id: span_id of the enclosing span (None: root span).
+        :param kind: INTERNAL for stages, CLIENT for adapter I/O.
+        :param attributes: Initial attributes (str, int, float or bool values).
+        """
+        self.trace_id = trace_id
+        self.span_id = new_span_id()
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.attributes = attributes if attributes is not None else {}
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.error: Optional[str] = None
+
+    # --- RECORDING ---
+
+    def finish(self, error: Optional[BaseException] = None) -> 'Span':
+        """Stamps the end time; an exception marks the span as failed."""
+        self.end_ns = time.time_ns()
+        if error is not None and not isinstance(error, GeneratorExit):
+            self.error = f"{type(error).__name__}: {error}"
+        return self
+
+    # --- EXPORT ---
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span: Dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": otlp_attributes(self.attributes),
+        }
+        if self.parent_id is not None:
+            span["parentSpanId"] = self.parent_id
+        if self.error is not None:
+            span["status"] = {"code": STATUS_ERROR, "message": self.error}
+        return span
+
+
+def otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """{key: value} -> OTLP KeyValue list (int64 values are encoded as strings)."""
+    result = []
+    for key, value in attributes.items():
+        if isinstance(value, bool):
+            typed = {"boolValue": value}
+        elif isinstance(value, int):
+            typed = {"intValue": str(value)}
+        elif isinstance(value, float):
+            typed = {"doubleValue": value}
+        else:
+            typed = {"stringValue": str(value)}
+        result.append({"key": key, "value": typed})
+    return result
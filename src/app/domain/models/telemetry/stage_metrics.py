@@ -0,0 +1,125 @@
+# src/app/domain/models/telemetry/stage_metrics.py
+import time
+from typing import Any, Dict, Iterable, Iterator
+
+from src.app.domain.models.packet.base import Packet
+from src.app.domain.models.telemetry.histogram import LatencyHistogram
+
+# Payload types whose len() is their size in bytes (or characters)
+SIZED_PAYLOADS = frozenset((bytes, bytearray, str))
+
+# Component kinds
+ADAPTER = "adapter"
+STAGE = "stage"
+
+
+def payload_size(payload: Any) -> int:
+    """Size of a raw payload (0 for structured payloads such as dicts)."""
+    return len(payload) if type(payload) in SIZED_PAYLOADS else 0
+
+
+class StageMetrics:
+    """
+    Telemetry of one component (adapter or middleware stage) within one trace.
+
+    - Counters: Packets and bytes in/out, errors
+    - Latency: every 'sample_every'-th operation is timed into a LatencyHistogram
+
+    Single writer: the component's hot loop pre-aggregates in locals and
+    publishes with add(), so readers (snapshots, exports) may lag by one block
+    of Packets but never block the writer.
+    """
+    __slots__ = (
+        "trace_id", "name", "kind", "sample_every", "latency",
+        "packets_in", "packets_out", "bytes_in", "bytes_out", "errors", "_countdown"
+    )
+
+    def __init__(self, trace_id: str, name: str, kind: str = STAGE, sample_every: int = 16) -> None:
+        """
+        :param trace_id: Passport of the stream the component belongs to.
+        :param name: Adapter URI or stage name.
+        :param kind: 'adapter' or 'stage'.
+        :param sample_every: Time one operation out of this many (1 times all of them).
+        """
+        if sample_every < 1:
+            raise ValueError(f"sample_every must be >= 1, got: {sample_every}")
+        self.trace_id = trace_id
+        self.name = name
+        self.kind = kind
+        self.sample_every = sample_every
+        self.latency = LatencyHistogram()
+        self.packets_in = 0
+        self.packets_out = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.errors = 0
+        self._countdown = sample_every
+
+    # --- RECORDING ---
+
+    def add(self, packets_in: int = 0, packets_out: int = 0, bytes_in: int = 0, bytes_out: int = 0, errors: int = 0) -> None:
+        """Publishes a block of pre-aggregated counts."""
+        self.packets_in += packets_in
+        self.packets_out += packets_out
+        self.bytes_in += bytes_in
+        self.bytes_out += bytes_out
+        self.errors += errors
+
+    def tick(self) -> bool:
+        """True once every 'sample_every' calls: the caller should time this operation."""
+        self._countdown -= 1
+        if self._countdown:
+            return False
+        self._countdown = self.sample_every
+        return True
+
+    def observe(self, packets: Iterable[Packet]) -> Iterator[Packet]:
+        """
+        Passes Packets through, counting them as output and timing how long the
+        upstream iterator takes to produce every 'sample_every'-th one.
+        """
+        every = self.sample_every
+        clock = time.perf_counter_ns
+        record = self.latency.record
+        countdown = every
+        count = size = 0
+        started = clock()
+        try:
+            for packet in packets:
+                if started:
+                    record(clock() - started)
+                    started = 0
+                count += 1
+                payload = packet.payload
+                if type(payload) in SIZED_PAYLOADS:
+                    size += len(payload)
+                countdown -= 1
+                if not countdown:
+                    # Publish with each sample: cheap enough at 1/sample_every
+                    countdown = every
+                    self.add(packets_out=count, bytes_out=size)
+                    count = size = 0
+                    yield packet
+                    started = clock()
+                    continue
+                yield packet
+        except GeneratorExit:
+            raise
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            self.add(packets_out=count, bytes_out=size)
+
+    # --- EXPORT ---
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "packets_in": self.packets_in,
+            "packets_out": self.packets_out,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "errors": self.errors,
+            "latency": self.latency.summary(),
+        }
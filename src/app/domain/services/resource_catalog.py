@@ -1,4 +1,6 @@
-from typing import Dict, Any, TypeVar
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Any, Optional, Tuple, TypeVar
 
 # Updated Imports: Sourced from the new identity package
 from src.app.domain.models.resource_identity import (
@@ -16,8 +18,13 @@ class ResourceCatalog:
     The Domain Service responsible for resource discovery and security.
     Acts as the Librarian for the 'registry://' internal protocol.
     """
-    def __init__(self):
+    def __init__(self, cache_size: int = 4096):
+        """
+        :param cache_size: Maximum number of resolved URIs kept in the LRU 
+            resolution cache (0 disables caching).
+        """
         # Maps ResourceKey (e.g. "scans") -> Physical Anchor (e.g. Path("/srv/data/scans"))
+        # - Anchors are stored in their canonical form (see ResourceBoundary.canonicalize)
         self._anchors: Dict[ResourceKey, Any] = {}
         
         # Maps Protocol String (e.g. "posix") -> ResourceBoundary Implementation
@@ -26,24 +33,43 @@ class ResourceCatalog:
         # Maps ResourceKey -> Protocol String
         self._key_protocols: Dict[ResourceKey, str] = {}
 
+        # Bounded LRU: URI String -> (ResourceKey, LogicalURI, Boundary, Anchor)
+        # - Memoizes parsing and metadata look-ups only: the Boundary check runs on
+        #   every hit, since the filesystem under the anchor may change (e.g. a swapped symlink)
+        self._cache_size = cache_size
+        self._resolution_cache: "OrderedDict[str, Tuple[ResourceKey, LogicalURI, ResourceBoundary[Any], Any]]" = OrderedDict()
+        self._cache_lock = Lock()
+
     def register(self, protocol: str, boundary: ResourceBoundary[Any]) -> None:
         """Registers a security guard to a specific protocol."""
         self._boundaries[protocol] = boundary
+        
+        # A new guard may judge previously resolved paths differently
+        self.clear_cache()
 
     def add_anchor(self, key: ResourceKey, protocol: str, anchor: Any) -> None:
         """Associates a nickname (key) with a protocol and a physical root."""
         if protocol not in self._boundaries:
             raise ValueError(f"No Boundary registered for protocol: {protocol}")
 
-        self._anchors[key] = anchor
+        # Canonicalize once here instead of on every resolution
+        self._anchors[key] = self._boundaries[protocol].canonicalize(anchor)
         self._key_protocols[key] = protocol
 
+        # Invalidate every cached resolution that was computed against this key
+        self._invalidate_key(key)
+
     # --- Core Logic Methods ---
 
     def resolve_uri(self, uri: LogicalURI) -> StreamLocation:
         """
         Translates a LogicalURI into a secured PhysicalPath (ValidatedPath).
         """
+        # 0. Fast Path: Previously parsed resolution (still re-checked by the Boundary)
+        cached = self.get_cached(str(uri))
+        if cached is not None:
+            return cached
+
         # 1. Extract Key from the Smart Value Object
         key = ResourceKey(uri.key)
 
@@ -53,15 +79,35 @@ class ResourceCatalog:
 
         # 3. Delegate to Boundary for path calculation and security checks
         boundary = self._boundaries[protocol]
-        resolved_path = boundary.resolve(uri, anchor)
+        resolved_path = self._secure(uri, key, boundary, anchor)
 
-        # 4. BRANDING: Bind the key to the physical path before returning
-        # This satisfies the ResourceIdentity contract for ValidatedPath
-        if isinstance(resolved_path, PhysicalPath):
-            return resolved_path.bind_key(key)
+        # 4. MEMOIZE: Only reached once the Boundary has accepted the path
+        self._remember(str(uri), (key, uri, boundary, anchor))
 
         return resolved_path
     
+    def get_cached(self, uri: str) -> Optional[StreamLocation]:
+        """
+        Returns the secured location for a previously resolved URI, or None.
+        - Used by ResourceFactory to skip URI parsing entirely on a hit
+        - The Boundary check is re-run: a hit never returns a path that now escapes its anchor
+        """
+        if not self._cache_size:
+            return None
+
+        with self._cache_lock:
+            entry = self._resolution_cache.get(uri)
+            if entry is None:
+                return None
+            self._resolution_cache.move_to_end(uri)
+
+        key, logical_uri, boundary, anchor = entry
+        return self._secure(logical_uri, key, boundary, anchor)
+
+    def clear_cache(self) -> None:
+        """Drops every memoized resolution."""
+        with self._cache_lock:
+            self._resolution_cache.clear()
 
     # --- HELPER & METADATA METHODS ---
 
@@ -87,4 +133,33 @@ class ResourceCatalog:
         anchor = self._anchors.get(key)
         if anchor is None:
             raise KeyError(f"Metadata Error: Anchor for ResourceKey '{key}' not found!")
-        return anchor
\ No newline at end of file
+        return anchor
+
+    @staticmethod
+    def _secure(uri: LogicalURI, key: ResourceKey, boundary: ResourceBoundary[Any], anchor: Any) -> StreamLocation:
+        """Runs the Boundary (path calculation + containment check) and brands the result with its key."""
+        resolved_path = boundary.resolve(uri, anchor)
+
+        # BRANDING: Bind the key to the physical path before returning
+        # This satisfies the ResourceIdentity contract for ValidatedPath
+        if isinstance(resolved_path, PhysicalPath):
+            resolved_path = resolved_path.bind_key(key)
+        return resolved_path
+
+    def _remember(self, uri: str, entry: Tuple[ResourceKey, LogicalURI, ResourceBoundary[Any], Any]) -> None:
+        """Stores a resolution that passed the Boundary, evicting the least recently used entry."""
+        if not self._cache_size:
+            return
+
+        with self._cache_lock:
+            self._resolution_cache[uri] = entry
+            self._resolution_cache.move_to_end(uri)
+            while len(self._resolution_cache) > self._cache_size:
+                self._resolution_cache.popitem(last=False)
+
+    def _invalidate_key(self, key: ResourceKey) -> None:
+        """Removes all cached resolutions that belong to a ResourceKey."""
+        with self._cache_lock:
+            stale = [uri for uri, entry in self._resolution_cache.items() if entry[0] == key]
+            for uri in stale:
+                del self._resolution_cache[uri]
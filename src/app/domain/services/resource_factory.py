@@ -28,10 +28,16 @@ class ResourceFactory:
         The central decision engine for type-safe stream locations.
         
         Logic:
+            0. Cache: Returns a memoized catalog resolution, re-checked by its Boundary.
             1. Logical Branch: Promotes to LogicalURI -> Catalog resolve -> PhysicalPath.
             2. Physical Branch: Promotes to PhysicalURI (Direct Access).
             3. Firewall: Rejects unanchored/naked strings.
         """
+        # 0. MEMOIZED: Previously resolved catalog URIs skip parsing (not the Boundary check)
+        cached = self._catalog.get_cached(uri)
+        if cached is not None:
+            return cached
+
         # 1. GOVERNED / INTERNAL (Identity-led)
         # Ensure protocol is present
         if "://" not in uri:
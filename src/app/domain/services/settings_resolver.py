@@ -1,7 +1,10 @@
 # src/app/domain/services/settings_resolver.py
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, Optional
 from dataclasses import asdict
+from functools import lru_cache
 from src.app.domain.models.app_config import AppConfig
+from src.app.domain.models.settings_signature import settings_signature
 
 class SettingsResolver:
     """
@@ -9,7 +12,7 @@ class SettingsResolver:
     Responsibility: Merges Global Defaults with execution-time Overrides.
     """
     @staticmethod
-    def resolve(app_config:AppConfig, overrides:Dict[str, Any]) -> Dict[str,Any]:
+    def resolve(app_config:AppConfig, overrides:Dict[str, Any]) -> Mapping[str,Any]:
         """
         Calculates the final - ephemeral - 'Messy Bag' of settings Dict.
         
@@ -18,10 +21,35 @@ class SettingsResolver:
         
         Note: Tier 2 (Protocol Defaults) are handled by the DataStream 
         via the dataclass default values during hydration.
+
+        Note: The result is read-only. Merges for hashable overrides are 
+        memoized per (AppConfig, overrides) signature.
         """
-        # 1. Convert AppConfig to a Dict
-        base_global_settings = asdict(app_config)
+        signature = SettingsResolver.signature(overrides)
+        if signature is not None:
+            return _merged(app_config, signature)
+
+        # Unhashable overrides (e.g. dict headers) are merged on every call
+        return MappingProxyType({**_baseline(app_config), **overrides})
+
+    @staticmethod
+    def signature(overrides: Mapping[str, Any]) -> Optional[FrozenSet]:
+        """Hashable fingerprint of a set of overrides, or None if any value is unhashable."""
+        return settings_signature(overrides)
+
+
+# --- MEMOIZATION HELPERS ---
+
+@lru_cache(maxsize=16)
+def _baseline(app_config: AppConfig) -> Mapping[str, Any]:
+    """Tier 1: AppConfig converted to a Dict once per (frozen) config."""
+    return MappingProxyType(asdict(app_config))
+
 
-        # 2. Lyaer on the Overrides
-        # keys in 'b' overwrite keys in 'b': {**a, **b}
-        return {**base_global_settings, **overrides}
\ No newline at end of file
+@lru_cache(maxsize=256)
+def _merged(app_config: AppConfig, signature: FrozenSet) -> Mapping[str, Any]:
+    """Tier 1 + Tier 3, memoized per (config, overrides) signature."""
+    # 2. Layer on the Overrides
+    # keys in 'b' overwrite keys in 'a': {**a, **b}
+    overrides = {k: v for k, _, v in signature}
+    return MappingProxyType({**_baseline(app_config), **overrides})
@@ -37,8 +37,9 @@ class ResourceBoundary(ABC, Generic[T]):
         Args:
             uri (LogicalURI): The smart Value Object representing a 'registry://' 
                 identity (e.g., registry://scans/01.xml).
-            anchor (T): The physical 'home' or 'root' coordinate that serves as 
-                the boundary (e.g., Path("/srv/data/scans")).
+            anchor (T): The canonical 'home' or 'root' coordinate that serves as 
+                the boundary (e.g., Path("/srv/data/scans")), as produced by 
+                `canonicalize()`.
 
         Returns:
             PhysicalPath: A fully-realized, secured physical path object 
@@ -51,6 +52,22 @@ class ResourceBoundary(ABC, Generic[T]):
         """
         pass
 
+    def canonicalize(self, anchor: T) -> T:
+        """
+        Normalizes an anchor once, at registration time.
+
+        The ResourceCatalog stores the returned value and hands it to every 
+        subsequent `resolve()` call, so implementations can keep expensive 
+        normalization (e.g. realpath syscalls) out of the hot path.
+
+        Args:
+            anchor (T): The raw anchor supplied by the user.
+
+        Returns:
+            T: The canonical anchor. The default implementation is the identity.
+        """
+        return anchor
+
     @abstractmethod
     def is_safe(self, physical_resource: PhysicalPath, anchor: T) -> bool:
         """
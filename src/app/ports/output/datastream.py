@@ -1,7 +1,6 @@
 # src/app/ports/output/datastream.py
-from dataclasses import fields
 from abc import ABC, abstractmethod
-from typing import Type, Iterator, Optional, TypeVar, Generic
+from typing import Any, Type, Iterator, Optional, TypeVar, Generic
 from src.app.ports.output.stream_policy import StreamPolicy
 from src.app.ports.output.stream_contract import StreamContract
 from src.app.domain.models.streams.stream_context import StreamContext
@@ -36,12 +35,10 @@ class DataStream(ABC, Generic[T]):
         self._policy    = policy
 
         # 1. Filter: Prevent 'Unexpected Keyword' crashes from Global Config
-        valid_fields = {f.name for f in fields(self._settings_contract)}
-        filtered = {k: v for k, v in settings.items() if k in valid_fields}
-
         # 2. Hydrate: Triggers __init__ AND the base __post_init__ type-check
+        # - Both run against the contract's pre-compiled ContractSpec
         try:
-            self._settings: T = self._settings_contract(**filtered)
+            self._settings: T = self._settings_contract.spec().hydrate(settings)
         except (TypeError, ValueError) as e:
             raise ValueError(f"Stream Initialization Failed: {e}")
 
@@ -93,6 +90,41 @@ class DataStream(ABC, Generic[T]):
     
     @abstractmethod
     def close(self): pass
+
+    def reset(self) -> bool:
+        """
+        Prepares an OPEN stream for reuse by a new consumer (see HandlePool).
+        
+        Default implementation: not reusable.
+        Adapters that can rewind (seekable files) or re-issue their request 
+        (network clients) override this and return True.
+        """
+        return False
+
+    def tell(self) -> Optional[Any]:
+        """
+        Current position, as an opaque value accepted by seek() (see Checkpoint).
+        - Readers: the position right after the last yielded Packet
+        - Writers: the committed position (buffers flushed to the OS and disk)
+
+        Default implementation: positions unsupported (None).
+        """
+        return None
+
+    def seek(self, position: Any) -> bool:
+        """
+        Resumes the stream at a position previously returned by tell().
+        May be called before open(): the position is then applied on open.
+        - Readers continue after the last checkpointed Packet
+        - Writers discard anything written past the position and append from there
+
+        Default implementation: not resumable (False).
+        """
+        return False
+
+    def bind_context(self, context: StreamContext) -> None:
+        """Re-stamps the adapter with a new Passport (e.g. on pool checkout)."""
+        self._context = context
     
     @classmethod
     @abstractmethod
@@ -1,6 +1,6 @@
 # src/app/ports/output/middleware_processor.py
 from abc import ABC, abstractmethod
-from typing import Iterator
+from typing import Any, Iterator, List
 
 from src.app.domain.models.packet import Packet, PayloadType
 
@@ -50,6 +50,23 @@ class MiddlewareProcessor(ABC):
         """
         pass
 
+    def process_batch(self, packets: List[Packet]) -> Iterator[Packet]:
+        """
+        Optional vectorized entry point.
+
+        Receives a batch of consecutive Packets (never containing a STREAM_END
+        except as its last element) and yields their derivatives. Override it to
+        replace per-record Python work with bulk operations (a single 're' pass
+        over joined buffers, 'struct.iter_unpack', 'array' arithmetic, ...).
+        The Orchestrator calls it when running with 'batch_size'; the default
+        falls back to process() for every Packet.
+
+        :param packets: Consecutive units of work, in stream order.
+        :yield: Transformed or filtered Packets.
+        """
+        for packet in packets:
+            yield from self.process(packet)
+
     @abstractmethod
     def flush(self) -> Iterator[Packet]:
         """
@@ -63,6 +80,43 @@ class MiddlewareProcessor(ABC):
         """
         yield from []
 
+    @property
+    def checkpointable(self) -> bool:
+        """
+        Capability flag: False when snapshot() cannot capture the state (e.g. it
+        spans the whole input or lives on other processes). A checkpointed
+        PipelineOrchestrator rejects such stages in validate(), before running.
+        """
+        return True
+
+    def snapshot(self) -> Any:
+        """
+        Optional checkpoint hook: returns the state needed to resume (picklable).
+
+        Called between Packets, once everything received so far has been
+        processed. Stateless processors keep the default (None); processors
+        that buffer across Packets must return their buffers and counters.
+        """
+        return None
+
+    def restore(self, state: Any) -> None:
+        """
+        Optional checkpoint hook: reinstates a snapshot() after open().
+
+        :param state: The value returned by snapshot() at the last checkpoint.
+        """
+        pass
+
+    def bind_memory(self, governor: Any) -> None:
+        """
+        Optional hook: receives the process-wide MemoryGovernor before open().
+
+        Processors that buffer across Packets reserve their buffers against it
+        and spill (or shrink) early while it reports pressure. The default
+        ignores it.
+        """
+        pass
+
     def open(self) -> None:
         """
         Initializes external resources (e.g., database connections, file handles).
@@ -90,3 +144,63 @@ class MiddlewareProcessor(ABC):
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Ensures 'close()' is called even if an error occurs."""
         self.close()
+
+
+class MapProcessor(MiddlewareProcessor):
+    """
+    A stateless 1:1 transformation over the payload.
+
+    Implement 'transform()' instead of 'process()'. Declaring the stage as a map
+    lets the Orchestrator fuse consecutive Map/Filter stages into a single loop
+    that only spawns the final derivative Packet.
+    """
+
+    @abstractmethod
+    def transform(self, payload: Any) -> Any:
+        """
+        Pure function from input payload to output payload.
+        Must not depend on previously seen packets.
+        """
+        pass
+
+    def process(self, packet: Packet) -> Iterator[Packet]:
+        yield packet.spawn(self.transform(packet.payload), subject=self.output_subject)
+
+    def process_batch(self, packets: List[Packet]) -> Iterator[Packet]:
+        transform, subject = self.transform, self.output_subject
+        for packet in packets:
+            yield packet.spawn(transform(packet.payload), subject=subject)
+
+    def flush(self) -> Iterator[Packet]:
+        yield from []
+
+
+class FilterProcessor(MiddlewareProcessor):
+    """
+    A stateless 1:1 / 1:0 predicate over the payload.
+
+    Implement 'accept()' instead of 'process()'. Accepted packets pass through
+    unchanged (no derivative is spawned), so input and output subjects are equal.
+    """
+
+    @abstractmethod
+    def accept(self, payload: Any) -> bool:
+        """Returns True to keep the packet, False to drop it."""
+        pass
+
+    @property
+    def output_subject(self) -> PayloadType:
+        return self.input_subject
+
+    def process(self, packet: Packet) -> Iterator[Packet]:
+        if self.accept(packet.payload):
+            yield packet
+
+    def process_batch(self, packets: List[Packet]) -> Iterator[Packet]:
+        accept = self.accept
+        for packet in packets:
+            if accept(packet.payload):
+                yield packet
+
+    def flush(self) -> Iterator[Packet]:
+        yield from []
@@ -1,8 +1,35 @@
 # src/app/ports/output/stream_contract.py
-from typing import Any, get_origin, Union
+from typing import Any, Dict, FrozenSet, Optional, Tuple, Type, get_origin, Union
 import typing
 from abc import ABC
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from functools import cache, lru_cache
+from src.app.domain.models.settings_signature import settings_signature
+
+@dataclass(frozen=True)
+class ContractSpec:
+    """
+    The pre-compiled form of a StreamContract class.
+    - Built once per contract class (see StreamContract.spec)
+    - Holds the accepted field names and the concrete isinstance checks
+    """
+    contract_cls: Type["StreamContract"]
+    field_names: FrozenSet[str]
+    # (field_name, declared_type, accepted_types)
+    checks: Tuple[Tuple[str, Any, Tuple[type, ...]], ...]
+
+    def hydrate(self, settings: Dict[str, Any]) -> "StreamContract":
+        """
+        Filters the 'Messy Bag' down to the contract's fields and instantiates it.
+        Identical, hashable settings reuse the previously validated instance.
+        """
+        filtered = {k: v for k, v in settings.items() if k in self.field_names}
+
+        signature = settings_signature(filtered)
+        if signature is None:
+            return self.contract_cls(**filtered)
+        return _hydrate_cached(self.contract_cls, signature)
+
 
 @dataclass(frozen=True)
 class StreamContract(ABC):
@@ -16,28 +43,58 @@ class StreamContract(ABC):
     
     def __post_init__(self):
         """Universal Type Guard for all Contracts."""
-        for field_name, field_type in self.__annotations__.items():
+        for field_name, field_type, accepted in type(self).spec().checks:
             value = getattr(self, field_name)
-            
-            # 1. Robust check for Any and 'Special Forms' (Union, Optional, etc.)
-            # We check the object, its string name, and its origin.
-            if (
-                field_type is Any or 
-                field_type is typing.TypeVar or
-                str(field_type).endswith("Any") or
-                get_origin(field_type) in (Union, list, dict, tuple) or
-                str(type(field_type)).lower().find("specialform") != -1
-            ):
-                continue
-
-            # 2. Flexible Numeric Check
-            if field_type is float and isinstance(value, (int, float)):
-                continue
-
-            # 3. Final Safety: Only run isinstance if field_type is a concrete class
-            if isinstance(field_type, type):
-                if not isinstance(value, field_type):
-                    raise TypeError(
-                        f"Contract Violation: '{field_name}' expects {field_type}, "
-                        f"but got {type(value).__name__} ('{value}')"
-                    )
+            if not isinstance(value, accepted):
+                raise TypeError(
+                    f"Contract Violation: '{field_name}' expects {field_type}, "
+                    f"but got {type(value).__name__} ('{value}')"
+                )
+
+    @classmethod
+    def spec(cls) -> ContractSpec:
+        """Returns the cached, pre-compiled validator for this contract class."""
+        return _compile(cls)
+
+
+# --- COMPILATION HELPERS ---
+
+@cache
+def _compile(contract_cls: Type[StreamContract]) -> ContractSpec:
+    """
+    Translates the contract's annotations into concrete isinstance checks.
+    Runs once per contract class instead of once per instantiation.
+    """
+    checks = []
+    for field_name, field_type in contract_cls.__annotations__.items():
+        # 1. Robust check for Any and 'Special Forms' (Union, Optional, etc.)
+        # We check the object, its string name, and its origin.
+        if (
+            field_type is Any or 
+            field_type is typing.TypeVar or
+            str(field_type).endswith("Any") or
+            get_origin(field_type) in (Union, list, dict, tuple) or
+            str(type(field_type)).lower().find("specialform") != -1
+        ):
+            continue
+
+        # 2. Flexible Numeric Check
+        if field_type is float:
+            checks.append((field_name, field_type, (int, float)))
+            continue
+
+        # 3. Final Safety: Only run isinstance if field_type is a concrete class
+        if isinstance(field_type, type):
+            checks.append((field_name, field_type, (field_type,)))
+
+    return ContractSpec(
+        contract_cls=contract_cls,
+        field_names=frozenset(f.name for f in fields(contract_cls)),
+        checks=tuple(checks)
+    )
+
+
+@lru_cache(maxsize=256)
+def _hydrate_cached(contract_cls: Type[StreamContract], signature: FrozenSet) -> StreamContract:
+    """Validated contract instances, keyed by (contract class, settings signature)."""
+    return contract_cls(**{k: v for k, _, v in signature})
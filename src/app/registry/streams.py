@@ -1,31 +1,135 @@
 # src/app/registry/streams.py
-from typing import Type, Optional
+import sys
+from importlib import import_module
+from threading import Lock
+from typing import Any, Callable, Type, Optional, Union
 from dataclasses import dataclass
 from src.app.ports.output.datastream import DataStream
 from src.app.ports.output.stream_policy import StreamPolicy
 
+# Entry-point group scanned by StreamRegistry.discover()
+ADAPTER_ENTRY_POINT_GROUP = "streamflow.adapters"
+
 @dataclass(frozen=True)
 class ProtocolRegistration:
     adapter_cls: Type[DataStream]
     policy: Optional[StreamPolicy] = None
 
+@dataclass(frozen=True)
+class LazyRegistration:
+    """
+    A deferred blueprint.
+    The adapter module is only imported on the first get_registration() call.
+    - 'loader' returns either a DataStream subclass or a full ProtocolRegistration
+    """
+    loader: Callable[[], Any]
+    origin: str
+    policy: Optional[StreamPolicy] = None
+
+    def load(self) -> ProtocolRegistration:
+        target = self.loader()
+        if isinstance(target, ProtocolRegistration):
+            return target
+        if isinstance(target, type) and issubclass(target, DataStream):
+            return ProtocolRegistration(adapter_cls=target, policy=self.policy)
+        raise TypeError(
+            f"Lazy registration '{self.origin}' must resolve to a DataStream subclass "
+            f"or a ProtocolRegistration, got: {target!r}"
+        )
+
 class StreamRegistry:
-    def __init__(self):
-        self._protocols: dict[str, ProtocolRegistration] = {}
+    def __init__(self, discover_entry_points: bool = False):
+        """
+        :param discover_entry_points: Scan the 'streamflow.adapters' entry-point group 
+            the first time an unknown protocol is requested.
+        """
+        self._protocols: dict[str, Union[ProtocolRegistration, LazyRegistration]] = {}
+        self._load_lock = Lock()
+        self._pending_discovery = discover_entry_points
 
-    def register(self, protocol: str, adapter_cls: Type[DataStream], policy: Optional[StreamPolicy] = None):
-        """Stores the blueprint. No settings passed here."""
-        self._protocols[protocol] = ProtocolRegistration(
+    def register(
+            self, 
+            protocol: str, 
+            adapter_cls: Union[Type[DataStream], str], 
+            policy: Optional[StreamPolicy] = None
+    ):
+        """
+        Stores the blueprint. No settings passed here.
+        - 'adapter_cls' may be a dotted import path ('package.module:Class'); 
+          the import is then deferred until the protocol is first used.
+        """
+        # Interned keys match the interned schemes of parsed URIs by identity
+        if isinstance(adapter_cls, str):
+            self._protocols[sys.intern(protocol)] = LazyRegistration(
+                loader=lambda path=adapter_cls: _import_object(path),
+                origin=adapter_cls,
+                policy=policy
+            )
+            return
+
+        self._protocols[sys.intern(protocol)] = ProtocolRegistration(
             adapter_cls=adapter_cls, 
             policy=policy
         )
 
+    def discover(self, group: str = ADAPTER_ENTRY_POINT_GROUP) -> None:
+        """
+        Registers third-party adapters advertised as package entry points.
+        - Entry point name: the protocol (e.g. 's3')
+        - Entry point target: a DataStream subclass or a ProtocolRegistration
+        Explicit registrations take precedence; no adapter is imported here.
+        """
+        # Scanning distribution metadata is costly; keep it off the import path
+        from importlib.metadata import entry_points
+
+        for entry_point in entry_points(group=group):
+            if entry_point.name in self._protocols:
+                continue
+            self._protocols[sys.intern(entry_point.name)] = LazyRegistration(
+                loader=entry_point.load,
+                origin=entry_point.value
+            )
+
     def get_registration(self, protocol: str) -> ProtocolRegistration:
         """Retrieves the blueprint for the Manager."""
-        if protocol not in self._protocols:
+        if not self.is_supported(protocol):
             raise ValueError(f"No adapter registered for protocol: {protocol}")
-        return self._protocols[protocol]
+
+        registration = self._protocols[protocol]
+        if isinstance(registration, LazyRegistration):
+            registration = self._resolve_lazy(protocol)
+        return registration
     
     def is_supported(self, protocol:str) -> bool:
         """Helper to check if a protocol has a registered adapter"""
-        return protocol in self._protocols
\ No newline at end of file
+        if protocol in self._protocols:
+            return True
+
+        # First miss: consult package entry points (once)
+        if self._pending_discovery:
+            self._pending_discovery = False
+            self.discover()
+            return protocol in self._protocols
+        return False
+
+    # --- Private Helpers ---
+
+    def _resolve_lazy(self, protocol: str) -> ProtocolRegistration:
+        """Imports a deferred adapter once and swaps in the concrete blueprint."""
+        with self._load_lock:
+            registration = self._protocols[protocol]
+            if isinstance(registration, LazyRegistration):
+                registration = registration.load()
+                self._protocols[protocol] = registration
+            return registration
+
+
+def _import_object(path: str) -> Any:
+    """Imports 'package.module:attr' (or 'package.module.attr')."""
+    if ":" in path:
+        module_name, _, attribute = path.partition(":")
+    else:
+        module_name, _, attribute = path.rpartition(".")
+    if not module_name or not attribute:
+        raise ValueError(f"Invalid import path: '{path}'. Expected 'package.module:Class'")
+    return getattr(import_module(module_name), attribute)
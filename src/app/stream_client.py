@@ -1,6 +1,6 @@
 # src/app/stream_client.py
 
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, Iterable
 
 class StreamClient:
     """
@@ -22,17 +22,56 @@ class StreamClient:
         self, 
         uri: str, 
         as_sink: bool = False, 
+        pooled: bool = False,
+        profile: Any = None,
         **settings
     ) -> Any:
         """
         Requests a Smart Handle from the Orchestrator.
+        :param pooled: Reuse an idle, already-open adapter for the same resource.
+        :param profile: A Profiler, or a report path, timing this handle's I/O.
         """
-        return self._manager.get_handle(uri, as_sink=as_sink, **settings)
+        return self._manager.get_handle(uri, as_sink=as_sink, pooled=pooled, profile=profile, **settings)
 
     def read(self, uri: str) -> Any:
         """Convenience: Read entire stream contents as Packets."""
         return self._manager.read(uri)
 
+    def read_many(
+        self, 
+        uris: Iterable[str], 
+        max_concurrency: int = 8, 
+        ordered: bool = False, 
+        **settings
+    ) -> Any:
+        """
+        Convenience: Read several streams concurrently as one iterator of Packets.
+        Use 'packet.context.trace_id' to tell the sources apart.
+        """
+        return self._manager.read_many(
+            uris, 
+            max_concurrency=max_concurrency, 
+            ordered=ordered, 
+            **settings
+        )
+
+    def pipeline(self, uri: str, **settings) -> Any:
+        """
+        Starts a Fluent Pipeline from a source URI.
+        e.g. client.pipeline(src).pipe(MyFilter()).write(dst).run()
+        """
+        # Deferred: the pipeline runtime is only loaded by jobs that use it
+        from src.app.use_cases.pipeline import Pipeline
+        return Pipeline(self._manager, uri, **settings)
+
+    def graph(self, queue_size: int = 64) -> Any:
+        """
+        Starts a DAG Pipeline (multi-source merge, join, routing).
+        e.g. client.graph().source("a", src_a).source("b", src_b).merge("ab", ["a", "b"]).sink("out", "ab", dst).run()
+        """
+        from src.app.use_cases.pipeline import PipelineGraph
+        return PipelineGraph(self._manager, queue_size=queue_size)
+
     def write(self, uri: str, data: Any) -> None:
         """Convenience: Write data to a stream via a Packet."""
         self._manager.write(uri, data)
@@ -53,3 +92,26 @@ class StreamClient:
         under a logical name (key).
         """
         self._manager.add_resource(key, protocol, anchor)
+
+    def metrics(self, trace_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Telemetry snapshot keyed by trace_id: counters, latency percentiles and
+        queue depths of every adapter and pipeline stage (empty when disabled).
+        """
+        return self._manager.telemetry.snapshot(trace_id)
+
+    def export_metrics(self, path: str) -> Any:
+        """Writes the telemetry to a local file in Prometheus text format."""
+        return self._manager.telemetry.export(path)
+
+    def memory(self) -> Dict[str, Any]:
+        """
+        Memory budget accounting: reserved, buffered and resident bytes, pressure
+        level and backpressure counters (empty when the budget is disabled).
+        """
+        governor = self._manager.memory
+        return governor.usage() if governor is not None else {}
+
+    def close(self) -> None:
+        """Releases pooled resources (idle adapters) and exports pending trace spans."""
+        self._manager.close()
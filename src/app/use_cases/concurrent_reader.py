@@ -0,0 +1,153 @@
+# src/app/use_cases/concurrent_reader.py
+import queue
+from dataclasses import dataclass
+from threading import Event
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Optional
+
+from src.app.domain.models.packet import Packet
+from src.app.domain.models.streams import StreamHandle
+from src.app.use_cases.memory import estimate_item
+
+if TYPE_CHECKING:
+    from src.app.use_cases.memory import MemoryGovernor
+
+@dataclass(frozen=True)
+class _SourceDone:
+    """Marker: a source has been fully drained."""
+    index: int
+
+@dataclass(frozen=True)
+class _SourceFailed:
+    """Marker: a source raised; the error is re-raised on the consumer side."""
+    index: int
+    error: BaseException
+
+
+class ConcurrentReader:
+    """
+    Fan-In Engine: reads several resources at once and merges their Packets 
+    into a single iterator.
+
+    - Every handle is opened and drained on a worker thread. All adapters perform 
+      blocking I/O that releases the GIL (file reads, httpx), so a thread pool 
+      serves local and network protocols alike.
+    - Backpressure: workers block on bounded queues, so at most 
+      'max_concurrency * queue_size' packets are buffered. With a 'memory'
+      governor, workers also wait while the process is over its memory budget.
+    - Packets are passed through untouched; 'packet.context.trace_id' and 
+      'packet.context.origin' identify the source handle.
+    """
+    def __init__(
+            self, 
+            open_handle: Callable[[str], StreamHandle], 
+            max_concurrency: int = 8, 
+            queue_size: int = 64,
+            memory: Optional['MemoryGovernor'] = None
+    ) -> None:
+        """
+        :param open_handle: Factory that turns a URI into a (read) StreamHandle.
+        :param max_concurrency: Maximum number of handles open at the same time.
+        :param queue_size: Bounded queue depth (per source when ordered).
+        :param memory: Process-wide memory budget throttling the workers (None: unbounded).
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got: {max_concurrency}")
+        if queue_size < 1:
+            raise ValueError(f"queue_size must be >= 1, got: {queue_size}")
+
+        self._open_handle = open_handle
+        self._max_concurrency = max_concurrency
+        self._queue_size = queue_size
+        self._memory = memory
+
+    def read(self, uris: Iterable[str], ordered: bool = False) -> Iterator[Packet]:
+        """
+        Yields the Packets of every URI.
+
+        :param ordered: False yields packets as soon as any source produces them.
+            True yields all packets of uris[0], then uris[1], ... while still 
+            reading ahead concurrently.
+        """
+        # Deferred: concurrent.futures (and logging) stay off the startup path
+        from concurrent.futures import ThreadPoolExecutor
+
+        uris = list(uris)
+        if not uris:
+            return
+
+        stop = Event()
+        shared = queue.Queue(maxsize=self._queue_size)
+        queues: List[queue.Queue] = (
+            [queue.Queue(maxsize=self._queue_size) for _ in uris] if ordered else [shared] * len(uris)
+        )
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self._max_concurrency, len(uris)),
+            thread_name_prefix="streamflow-read"
+        )
+        try:
+            # FIFO submission keeps the lowest pending index running (no deadlock when ordered)
+            for index, uri in enumerate(uris):
+                executor.submit(self._drain, index, uri, queues[index], stop)
+
+            if ordered:
+                for index in range(len(uris)):
+                    yield from self._consume(queues[index], remaining=1)
+            else:
+                yield from self._consume(shared, remaining=len(uris))
+        finally:
+            # Early exit or error: unblock producers and let the pool wind down
+            stop.set()
+            for pending in queues:
+                self._discard(pending)
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    # --- Private Helpers ---
+
+    def _drain(self, index: int, uri: str, out: queue.Queue, stop: Event) -> None:
+        """Worker: opens one handle and pushes its packets downstream."""
+        if stop.is_set():
+            return
+        try:
+            with self._open_handle(uri) as stream:
+                # Queued bytes, estimated from the packet in hand (only evaluated under pressure)
+                held = lambda: out.qsize() * estimate_item(packet)
+                for packet in stream.read():
+                    if self._memory is not None:
+                        self._memory.throttle(out.qsize, stop, held=held)
+                    if not self._put(out, packet, stop):
+                        return
+            self._put(out, _SourceDone(index), stop)
+        except BaseException as e:
+            self._put(out, _SourceFailed(index, e), stop)
+
+    def _consume(self, source: queue.Queue, remaining: int) -> Iterator[Packet]:
+        """Consumer: yields packets until 'remaining' sources reported completion."""
+        while remaining:
+            item = source.get()
+            if isinstance(item, _SourceDone):
+                remaining -= 1
+            elif isinstance(item, _SourceFailed):
+                raise item.error
+            else:
+                yield item
+
+    @staticmethod
+    def _put(out: queue.Queue, item: object, stop: Event) -> bool:
+        """Blocking put that gives up once the consumer has gone away."""
+        while not stop.is_set():
+            try:
+                out.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    @staticmethod
+    def _discard(source: queue.Queue) -> None:
+        """Empties a queue so that blocked producers can observe the stop flag."""
+        try:
+            while True:
+                source.get_nowait()
+        except queue.Empty:
+            pass
@@ -0,0 +1,173 @@
+# src/app/use_cases/handle_pool.py
+import time
+from collections import deque
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Deque, Dict, Hashable, Optional, Tuple, TYPE_CHECKING
+
+from src.app.domain.models.streams import StreamHandle, StreamContext
+from src.app.domain.models.telemetry import StageMetrics
+
+if TYPE_CHECKING:
+    from src.app.ports.output.datastream import DataStream
+    from src.app.registry.streams import ProtocolRegistration
+    from src.app.use_cases.tracing import HandleTrace
+    from src.app.use_cases.memory import Reservation
+
+# (Location String, Settings Signature, Sink Flag)
+PoolKey = Tuple[str, Hashable, bool]
+
+@dataclass
+class PooledAdapter:
+    """An open adapter parked in the pool, plus its age bookkeeping."""
+    adapter: 'DataStream'
+    created_at: float
+    idle_since: float = 0.0
+    registration: Optional['ProtocolRegistration'] = None  # Blueprint the adapter was built from
+
+
+class HandlePool:
+    """
+    Keeps idle, already-open adapters for repeated opens of the same resource.
+    
+    - Keyed by (location, settings signature, sink flag)
+    - Adapters are rewound via DataStream.reset() before being parked
+    - Limits: 'max_idle' parked adapters in total, 'ttl' seconds of lifetime
+    """
+    def __init__(self, max_idle: int = 16, ttl: float = 300.0) -> None:
+        """
+        :param max_idle: Maximum number of idle adapters kept open (0 disables pooling).
+        :param ttl: Maximum lifetime (seconds) of a pooled adapter since its creation.
+        """
+        self._max_idle = max_idle
+        self._ttl = ttl
+        self._idle: Dict[PoolKey, Deque[PooledAdapter]] = {}
+        self._idle_count = 0
+        self._lock = Lock()
+
+    # --- PROPERTIES ---
+
+    @property
+    def idle_count(self) -> int:
+        """Number of adapters currently parked."""
+        return self._idle_count
+
+    # --- ACTION METHODS ---
+
+    def acquire(self, key: PoolKey) -> Optional[PooledAdapter]:
+        """Pops a live idle adapter for the key, closing any that outlived the TTL."""
+        expired = []
+        entry = None
+        now = time.monotonic()
+
+        with self._lock:
+            bucket = self._idle.get(key)
+            while bucket:
+                candidate = bucket.pop()
+                self._idle_count -= 1
+                if now - candidate.created_at <= self._ttl:
+                    entry = candidate
+                    break
+                expired.append(candidate)
+            if bucket is not None and not bucket:
+                del self._idle[key]
+
+        # Close outside of the lock; closing may block on I/O
+        for stale in expired:
+            stale.adapter.close()
+        return entry
+
+    def release(self, key: PoolKey, entry: PooledAdapter) -> None:
+        """
+        Parks an adapter for reuse, or closes it if it cannot be rewound, 
+        is past its TTL, or the pool is full.
+        """
+        now = time.monotonic()
+        if (
+            not self._max_idle
+            or now - entry.created_at > self._ttl
+            or not entry.adapter.reset()
+        ):
+            entry.adapter.close()
+            return
+
+        evicted = None
+        with self._lock:
+            if self._idle_count >= self._max_idle:
+                evicted = self._evict_oldest()
+            entry.idle_since = now
+            self._idle.setdefault(key, deque()).append(entry)
+            self._idle_count += 1
+
+        if evicted is not None:
+            evicted.adapter.close()
+
+    def clear(self) -> None:
+        """Closes every idle adapter."""
+        with self._lock:
+            entries = [entry for bucket in self._idle.values() for entry in bucket]
+            self._idle.clear()
+            self._idle_count = 0
+
+        for entry in entries:
+            entry.adapter.close()
+
+    # --- Private Helpers ---
+
+    def _evict_oldest(self) -> Optional[PooledAdapter]:
+        """Removes the adapter that has been idle the longest (caller holds the lock)."""
+        oldest_key = None
+        for key, bucket in self._idle.items():
+            if oldest_key is None or bucket[0].idle_since < self._idle[oldest_key][0].idle_since:
+                oldest_key = key
+        if oldest_key is None:
+            return None
+
+        bucket = self._idle[oldest_key]
+        evicted = bucket.popleft()
+        if not bucket:
+            del self._idle[oldest_key]
+        self._idle_count -= 1
+        return evicted
+
+
+class PooledStreamHandle(StreamHandle):
+    """
+    A StreamHandle whose adapter returns to the HandlePool on exit
+    instead of being closed.
+    """
+    def __init__(
+            self, 
+            pool: HandlePool, 
+            key: PoolKey, 
+            entry: PooledAdapter, 
+            context: StreamContext,
+            metrics: Optional[StageMetrics] = None,
+            trace: Optional['HandleTrace'] = None,
+            reservation: Optional['Reservation'] = None
+    ) -> None:
+        super().__init__(
+            adapter=entry.adapter,
+            capacity=entry.adapter.capacity,
+            context=context,
+            metrics=metrics,
+            trace=trace,
+            reservation=reservation
+        )
+        self._pool = pool
+        self._key = key
+        self._entry = entry
+
+    # --- Private Helpers ---
+
+    def _open(self) -> None:
+        # Pooled adapters are already open; only fresh ones hit the OS
+        if not self._adapter.is_open:
+            self._adapter.open()
+
+    def _release(self, exc_type: Any) -> None:
+        # A failed stream may be in an undefined position: never recycle it
+        if exc_type is not None:
+            self._adapter.close()
+            return
+        self._pool.release(self._key, self._entry)
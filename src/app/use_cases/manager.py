@@ -1,4 +1,5 @@
-from typing import Any, Dict, Optional, Iterator
+import time
+from typing import Any, Dict, Optional, Iterable, Iterator, Tuple
 from uuid import uuid4
 
 # Domain Imports
@@ -12,7 +13,13 @@ from src.app.domain.services.resource_factory import ResourceFactory
 from src.app.domain.services.resource_catalog import ResourceCatalog
 from src.app.domain.services.settings_resolver import SettingsResolver
 from src.app.ports.output.datastream import DataStream
-from src.app.registry.streams import StreamRegistry
+from src.app.registry.streams import ProtocolRegistration, StreamRegistry
+from src.app.use_cases.handle_pool import HandlePool, PooledAdapter, PooledStreamHandle
+from src.app.use_cases.concurrent_reader import ConcurrentReader
+from src.app.use_cases.telemetry import Telemetry
+from src.app.use_cases.tracing import HandleTrace, Tracer
+from src.app.use_cases.memory import MemoryGovernor, Reservation
+from src.app.domain.models.telemetry.stage_metrics import ADAPTER
 
 class StreamManager:
     """
@@ -27,7 +34,11 @@ class StreamManager:
         factory: ResourceFactory, 
         catalog: ResourceCatalog,
         app_config: AppConfig, 
-        resolver: SettingsResolver
+        resolver: SettingsResolver,
+        pool: Optional[HandlePool] = None,
+        telemetry: Optional[Telemetry] = None,
+        tracer: Optional[Tracer] = None,
+        memory: Optional[MemoryGovernor] = None
     ) -> None:
         """
         :param registry: Catalog of blueprints (Adapter Classes and Policies).
@@ -35,47 +46,113 @@ class StreamManager:
         :param catalog: Librarian that provides protocol metadata for internal keys.
         :param app_config: Global settings (Tier 1).
         :param resolver: The Waterfall Engine for settings resolution.
+        :param pool: Optional store of idle adapters for 'pooled' handles.
+        :param telemetry: Metrics registry; every handle records into its own series.
+        :param tracer: Span recorder; every handle records into its own trace (None: untraced).
+        :param memory: Memory budget; open handles reserve their read-ahead chunk and
+            new handles get smaller chunks under pressure (None: unbounded).
         """
         self._registry = registry
         self._factory = factory
         self._catalog = catalog
         self._app_config = app_config
         self._resolver = resolver
+        self._pool = pool
+        self._telemetry = telemetry or Telemetry(enabled=False, log_level=app_config.log_level)
+        self._tracer = tracer
+        self._memory = memory
+
+    # --- PROPERTIES ---
+
+    @property
+    def telemetry(self) -> Telemetry:
+        return self._telemetry
+
+    @property
+    def tracer(self) -> Optional[Tracer]:
+        return self._tracer
+
+    @property
+    def memory(self) -> Optional[MemoryGovernor]:
+        return self._memory
 
     def get_handle(
         self,
         uri: str,
         as_sink: bool = False,
+        pooled: bool = False,
+        profile: Any = None,
         **overrides
     ) -> StreamHandle:
         """
         Requests a Smart Handle for a resource.
         This is the primary entry point for context-aware I/O.
+
+        :param pooled: Opt-in reuse of an idle, already-open adapter for the same 
+            (location, settings, as_sink). The handle returns its adapter to the 
+            pool on exit instead of closing it.
+        :param profile: Opt-in Profiler (or report path) charging the adapter's
+            open/read/write/close time. Profiled handles are never pooled.
         """
         # 1. CLASSIFY & RESOLVE: String -> StreamLocation
         location: StreamLocation = self._factory.build(uri)
 
-        # 2. IDENTIFY: Determine the protocol
-        protocol = self._get_protocol_for_location(location)
+        # 1b. POOL: Reuse an idle adapter where allowed
+        if pooled and self._pool is not None and profile is None:
+            signature = self._resolver.signature(overrides)
+            if signature is not None:
+                return self._checkout(uri, location, as_sink, overrides, (str(location), signature, as_sink))
 
-        # 3. DISCOVER: Get the Blueprint
-        blueprint = self._registry.get_registration(protocol)
+        adapter, context = self._instantiate(uri, location, as_sink, overrides)
+
+        # 7b. PROFILE: Deferred import, unprofiled handles never pay for it
+        if profile is not None:
+            from src.app.use_cases.profiling import Profiler
+            profiler = profile if isinstance(profile, Profiler) else Profiler(profile)
+            adapter = profiler.wrap_stream(adapter, uri)
+
+        # 8. NEGOTIATE: Wrap in a Smart Handle
+        return StreamHandle(
+            adapter=adapter,
+            capacity=adapter.capacity,
+            context=context,
+            metrics=self._telemetry.series(context.trace_id, uri, ADAPTER),
+            trace=self._trace(context, uri),
+            reservation=self._reserve(uri)
+        )
+
+    # --- Private Helpers ---
+
+    def _instantiate(
+        self,
+        uri: str,
+        location: StreamLocation,
+        as_sink: bool,
+        overrides: Dict[str, Any],
+        blueprint: Optional[ProtocolRegistration] = None
+    ) -> Tuple[DataStream, StreamContext]:
+        """
+        Runs the policy, context and settings steps and builds the Adapter.
+
+        :param blueprint: Registration already authorized for the location (None: look it up).
+        """
+        # 2-4. IDENTIFY, DISCOVER & POLICY CHECK
+        if blueprint is None:
+            blueprint = self._authorize(location)
 
-        # 4. POLICY CHECK: Contextual Guard
-        if blueprint.policy:
-            blueprint.policy.validate_access(location)
-        
         # 5. CONTEXT CREATION: The Passport
         # We generate a unique trace_id for this specific stream lifecycle.
-        context = StreamContext(
-            origin=uri,
-            current=str(location),
-            trace_id=str(uuid4())[:12]
-        )
+        context = self._new_context(uri, location)
 
         # 6. CALCULATE: Settings Waterfall
         settings = self._resolver.resolve(self._app_config, overrides)
 
+        # 6b. MEMORY: Under pressure, new handles read smaller chunks
+        if self._memory is not None and "chunk_size" in settings:
+            chunk_size = self._memory.chunk_size(settings["chunk_size"])
+            if chunk_size != settings["chunk_size"]:
+                settings = {**settings, "chunk_size": chunk_size}
+
         # 7. INSTANTIATE: Context-Aware Adapter
         adapter = blueprint.adapter_cls(
             uri=location,
@@ -84,15 +161,74 @@ class StreamManager:
             policy=blueprint.policy,
             **settings
         )
+        return adapter, context
 
-        # 8. NEGOTIATE: Wrap in a Smart Handle
-        return StreamHandle(
-            adapter=adapter,
-            capacity=adapter.capacity,
-            context=context
+    def _checkout(
+        self,
+        uri: str,
+        location: StreamLocation,
+        as_sink: bool,
+        overrides: Dict[str, Any],
+        key: Tuple[str, Any, bool]
+    ) -> PooledStreamHandle:
+        """
+        Hands out a pooled adapter (or a fresh one destined for the pool).
+        Every checkout receives its own Passport and trace_id.
+
+        The policy check runs on every checkout, hits included: an idle adapter
+        is only reused while its protocol's registration is unchanged.
+        """
+        blueprint = self._authorize(location)
+        entry = self._pool.acquire(key)
+
+        if entry is not None and entry.registration != blueprint:
+            # Re-registered protocol: the parked adapter follows the old blueprint
+            entry.adapter.close()
+            entry = None
+
+        if entry is None:
+            adapter, context = self._instantiate(uri, location, as_sink, overrides, blueprint)
+            entry = PooledAdapter(adapter=adapter, created_at=time.monotonic(), registration=blueprint)
+        else:
+            context = self._new_context(uri, location)
+            entry.adapter.bind_context(context)
+
+        return PooledStreamHandle(
+            pool=self._pool,
+            key=key,
+            entry=entry,
+            context=context,
+            metrics=self._telemetry.series(context.trace_id, uri, ADAPTER),
+            trace=self._trace(context, uri),
+            reservation=self._reserve(uri)
         )
 
-    # --- Private Helpers ---
+    def _authorize(self, location: StreamLocation) -> ProtocolRegistration:
+        """Looks up the Blueprint of the location's protocol and runs its policy check."""
+        # 2. IDENTIFY: Determine the protocol
+        protocol = self._get_protocol_for_location(location)
+
+        # 3. DISCOVER: Get the Blueprint
+        blueprint = self._registry.get_registration(protocol)
+
+        # 4. POLICY CHECK: Contextual Guard
+        if blueprint.policy:
+            blueprint.policy.validate_access(location)
+        return blueprint
+
+    def _trace(self, context: StreamContext, uri: str) -> Optional[HandleTrace]:
+        return self._tracer.handle(context, uri) if self._tracer is not None else None
+
+    def _reserve(self, uri: str) -> Optional[Reservation]:
+        return self._memory.reserve(uri) if self._memory is not None else None
+
+    def _new_context(self, uri: str, location: StreamLocation) -> StreamContext:
+        """Issues a fresh Passport with a unique trace_id."""
+        return StreamContext(
+            origin=uri,
+            current=str(location),
+            trace_id=str(uuid4())[:12]
+        )
 
     def _get_protocol_for_location(self, location: StreamLocation) -> str:
         """
@@ -116,6 +252,26 @@ class StreamManager:
         with handle as stream:
             yield from stream.read()
 
+    def read_many(
+        self,
+        uris: Iterable[str],
+        max_concurrency: int = 8,
+        ordered: bool = False,
+        queue_size: int = 64,
+        **overrides
+    ) -> Iterator[Packet]:
+        """
+        Reads several URIs concurrently and merges their Packets into one iterator.
+        Each packet keeps the Passport (trace_id) of the handle that produced it.
+        """
+        reader = ConcurrentReader(
+            open_handle=lambda uri: self.get_handle(uri, as_sink=False, **overrides),
+            max_concurrency=max_concurrency,
+            queue_size=queue_size,
+            memory=self._memory
+        )
+        yield from reader.read(uris, ordered=ordered)
+
     def write(self, uri: str, data: Any) -> None:
         """
         Convenience method to write data to a stream.
@@ -155,6 +311,13 @@ class StreamManager:
 
     # --- Configuration Methods ---
 
+    def close(self) -> None:
+        """Closes every idle adapter held by the HandlePool and exports pending spans."""
+        if self._pool is not None:
+            self._pool.clear()
+        if self._tracer is not None:
+            self._tracer.flush()
+
     def add_resource(self, key: str, protocol: str, anchor: Any) -> None:
         """Registers a physical anchor in the Resource Catalog."""
         if protocol == "posix" and isinstance(anchor, str):
@@ -0,0 +1,277 @@
+# src/app/use_cases/memory.py
+import sys
+import time
+from threading import Event, Lock
+from typing import Any, Callable, Dict, List, Optional
+
+# Pressure levels
+NORMAL = "normal"
+HIGH = "high"           # >= high_water: shrink chunks, spill early, drop caches
+CRITICAL = "critical"   # >= budget: throttle producers
+
+# Polling interval bounds of a throttled producer (seconds)
+THROTTLE_MIN_POLL = 0.0001
+THROTTLE_MAX_POLL = 0.005
+
+# Smallest fraction of the budget a queue must hold before its producer is throttled
+THROTTLE_MIN_SHARE = 0.05
+
+# Shallow per-Packet overhead (object, identity, context reference)
+PACKET_OVERHEAD = 400
+
+BytesProvider = Callable[[], int]
+
+
+def estimate_item(item: Any) -> int:
+    """Cheap estimate (bytes) of a queued Packet, or of a batch from its first Packet."""
+    if isinstance(item, list):
+        return len(item) * estimate_item(item[0]) if item else 0
+    payload = getattr(item, "payload", item)
+    if isinstance(payload, dict):
+        return PACKET_OVERHEAD + sys.getsizeof(payload) + sum(sys.getsizeof(value) for value in payload.values())
+    return PACKET_OVERHEAD + sys.getsizeof(payload)
+
+
+class Reservation:
+    """Bytes held by one component against the MemoryGovernor budget."""
+    __slots__ = ("name", "size", "_governor")
+
+    def __init__(self, governor: 'MemoryGovernor', name: str) -> None:
+        self.name = name
+        self.size = 0
+        self._governor = governor
+
+    def resize(self, size: int, force: bool = False) -> bool:
+        """
+        Sets the reserved size. Growth that would exceed the budget is denied
+        (returns False, size unchanged) unless 'force' is set: fixed buffers that
+        cannot shrink (e.g. a read-ahead chunk) are always recorded.
+        """
+        return self._governor._resize(self, size, force)
+
+    def release(self) -> None:
+        self._governor._resize(self, 0, True)
+
+
+class MemoryGovernor:
+    """
+    Process-wide memory budget (wired by the Bootstrap from AppConfig.memory_budget).
+
+    Accounting:
+    - Reservations: explicit byte counts held by components (handle read-ahead
+      chunks, ExternalSort buffers); growth beyond the budget is denied, and
+      elastic buffers respond by spilling
+    - Watched buffers: running queues report their estimated bytes, sampled
+      only when the pressure is refreshed (no hot-path cost)
+    - RSS growth: the resident set size of the process (psutil) above its value
+      at the first refresh, which also covers memory nobody reserved. The host
+      application's own footprint is not charged to the budget
+
+    Pressure = max(accounted, RSS growth) / budget, refreshed at most every 'poll_seconds':
+    - HIGH (>= high_water): new handles get smaller chunks, spilling buffers
+      spill early and reclaimers (caches such as idle pooled adapters) run
+    - CRITICAL (>= 1.0): producers feeding a queue that holds at least
+      THROTTLE_MIN_SHARE of the budget wait for it to drain, for at most
+      'max_throttle_seconds' per item so that a stuck consumer never deadlocks
+      a run. Small queues are never throttled: holding them back frees nothing
+    """
+    def __init__(
+            self,
+            budget: int,
+            high_water: float = 0.8,
+            watch_rss: bool = True,
+            poll_seconds: float = 0.05,
+            min_chunk_size: int = 4096,
+            max_throttle_seconds: float = 1.0
+    ) -> None:
+        """
+        :param budget: Memory ceiling in bytes.
+        :param high_water: Fraction of the budget at which pressure becomes HIGH.
+        :param watch_rss: Include the RSS growth of the process (psutil) in the pressure.
+        :param poll_seconds: Minimum interval between two pressure refreshes.
+        :param min_chunk_size: Smallest chunk size handed to new handles under pressure.
+        :param max_throttle_seconds: Longest wait of one throttled put.
+        """
+        if budget < 1:
+            raise ValueError(f"memory budget must be >= 1 byte, got: {budget}")
+        if not 0 < high_water <= 1:
+            raise ValueError(f"memory high_water must be in (0, 1], got: {high_water}")
+        self._budget = budget
+        self._high_water = high_water
+        self._watch_rss = watch_rss
+        self._poll_seconds = poll_seconds
+        self._min_chunk_size = min_chunk_size
+        self._max_throttle_seconds = max_throttle_seconds
+
+        self._reserved = 0
+        self._providers: List[BytesProvider] = []
+        self._reclaimers: List[Callable[[], Any]] = []
+        self._lock = Lock()
+        self._refreshing = Lock()
+        self._process = None
+        self._rss_baseline: Optional[int] = None
+        self._next_poll = 0.0
+        self._level = NORMAL
+        self._usage: Dict[str, int] = {"reserved": 0, "buffered": 0, "rss": 0, "rss_baseline": 0}
+
+        self.denied = 0
+        self.shrunk_chunks = 0
+        self.forced_spills = 0
+        self.throttled = 0
+        self.throttle_seconds = 0.0
+        self.reclaims = 0
+
+    # --- PROPERTIES ---
+
+    @property
+    def budget(self) -> int:
+        return self._budget
+
+    @property
+    def reserved(self) -> int:
+        return self._reserved
+
+    @property
+    def level(self) -> str:
+        """NORMAL, HIGH or CRITICAL (refreshed at most every 'poll_seconds')."""
+        if time.monotonic() >= self._next_poll:
+            self._refresh()
+        return self._level
+
+    @property
+    def pressured(self) -> bool:
+        """True at HIGH or CRITICAL: elastic buffers should spill now."""
+        return self.level is not NORMAL
+
+    # --- REGISTRATION ---
+
+    def reserve(self, name: str, size: int = 0, force: bool = False) -> Reservation:
+        """Opens a Reservation for a component (see Reservation.resize())."""
+        reservation = Reservation(self, name)
+        if size:
+            reservation.resize(size, force)
+        return reservation
+
+    def watch(self, provider: BytesProvider) -> None:
+        """Registers a callable returning the bytes currently buffered by a running component."""
+        with self._lock:
+            self._providers.append(provider)
+
+    def unwatch(self, provider: BytesProvider) -> None:
+        with self._lock:
+            if provider in self._providers:
+                self._providers.remove(provider)
+
+    def add_reclaimer(self, reclaim: Callable[[], Any]) -> None:
+        """Registers a cache-dropping callback, run whenever pressure rises to HIGH."""
+        with self._lock:
+            self._reclaimers.append(reclaim)
+
+    # --- BACKPRESSURE ---
+
+    def chunk_size(self, requested: int) -> int:
+        """The chunk size a new handle may use: a quarter under HIGH, the minimum under CRITICAL."""
+        level = self.level
+        if level is NORMAL or requested <= self._min_chunk_size:
+            return requested
+        granted = self._min_chunk_size if level is CRITICAL else max(self._min_chunk_size, requested // 4)
+        self.shrunk_chunks += 1
+        return granted
+
+    def throttle(self, pending: Callable[[], int], stop: Optional[Event] = None, held: Optional[BytesProvider] = None) -> None:
+        """
+        Producer side of a queue: while the budget is exceeded and the queue still
+        holds items ('pending' > 0), waits for the consumer to drain it.
+
+        :param pending: Items currently queued.
+        :param stop: Ends the wait early when set.
+        :param held: Estimated bytes currently queued; below THROTTLE_MIN_SHARE
+            of the budget, the producer is not held back (None: always eligible).
+        """
+        if self.level is not CRITICAL or not pending():
+            return
+        if held is not None and held() < self._budget * THROTTLE_MIN_SHARE:
+            return
+        started = time.monotonic()
+        deadline = started + self._max_throttle_seconds
+        self.throttled += 1
+        # Consumers usually catch up within microseconds: back off from a short poll
+        delay = THROTTLE_MIN_POLL
+        while self.level is CRITICAL and pending() and time.monotonic() < deadline:
+            if stop is not None:
+                if stop.wait(delay):
+                    break
+            else:
+                time.sleep(delay)
+            delay = min(delay * 2, THROTTLE_MAX_POLL)
+        self.throttle_seconds += time.monotonic() - started
+
+    # --- EXPORT ---
+
+    def usage(self) -> Dict[str, Any]:
+        """Current accounting (bytes), pressure level and backpressure counters."""
+        level = self.level
+        return {
+            "budget": self._budget,
+            **self._usage,
+            "reserved": self._reserved,
+            "level": level,
+            "denied": self.denied,
+            "shrunk_chunks": self.shrunk_chunks,
+            "forced_spills": self.forced_spills,
+            "throttled": self.throttled,
+            "throttle_seconds": round(self.throttle_seconds, 3),
+            "reclaims": self.reclaims,
+        }
+
+    # --- Private Helpers ---
+
+    def _resize(self, reservation: Reservation, size: int, force: bool) -> bool:
+        with self._lock:
+            growth = size - reservation.size
+            if growth > 0 and not force and self._reserved + growth > self._budget:
+                self.denied += 1
+                return False
+            reservation.size = size
+            self._reserved += growth
+        return True
+
+    def _refresh(self) -> None:
+        # One thread refreshes; the others keep using the current level
+        if not self._refreshing.acquire(blocking=False):
+            return
+        try:
+            with self._lock:
+                providers = list(self._providers)
+            buffered = sum(provider() for provider in providers)
+            rss = self._rss()
+            if self._rss_baseline is None:
+                self._rss_baseline = rss
+            accounted = self._reserved + buffered
+            pressure = max(accounted, rss - self._rss_baseline) / self._budget
+
+            previous = self._level
+            self._level = CRITICAL if pressure >= 1.0 else HIGH if pressure >= self._high_water else NORMAL
+            self._usage = {"reserved": self._reserved, "buffered": buffered, "rss": rss, "rss_baseline": self._rss_baseline}
+            self._next_poll = time.monotonic() + self._poll_seconds
+        finally:
+            self._refreshing.release()
+
+        if previous is NORMAL and self._level is not NORMAL:
+            self._reclaim()
+
+    def _reclaim(self) -> None:
+        with self._lock:
+            reclaimers = list(self._reclaimers)
+        for reclaim in reclaimers:
+            reclaim()
+        self.reclaims += 1
+
+    def _rss(self) -> int:
+        if not self._watch_rss:
+            return 0
+        if self._process is None:
+            # Deferred: 'psutil' stays off the startup path
+            import psutil
+            self._process = psutil.Process()
+        return self._process.memory_info().rss
@@ -0,0 +1,41 @@
+# src/app/use_cases/pipeline/__init__.py
+from src.app.use_cases.pipeline.errors import PipelineError
+from src.app.use_cases.pipeline.channels import Cancelled, Channel, SpillingChannel
+from src.app.use_cases.pipeline.checkpoint import Checkpoint, Checkpointer, CheckpointStats, CheckpointStore
+from src.app.use_cases.pipeline.dead_letter import DeadLetterQueue, ErrorPolicy, GuardedProcessor
+from src.app.use_cases.pipeline.workers import WorkerError, WorkerPool
+from src.app.use_cases.pipeline.executors import PartitionedProcessor, PooledProcessor, ProcessPoolProcessor
+from src.app.use_cases.pipeline.fusion import FusedProcessor, fuse
+from src.app.use_cases.pipeline.orchestrator import PipelineOrchestrator
+from src.app.use_cases.pipeline.tee import Tee, TeeBranch
+from src.app.use_cases.pipeline.join import HashJoin, merge_dicts
+from src.app.use_cases.pipeline.graph import PipelineGraph
+from src.app.use_cases.pipeline.builder import Pipeline
+
+__all__ = [
+    "PipelineError",
+    "Cancelled",
+    "Channel",
+    "SpillingChannel",
+    "Checkpoint",
+    "Checkpointer",
+    "CheckpointStats",
+    "CheckpointStore",
+    "DeadLetterQueue",
+    "ErrorPolicy",
+    "GuardedProcessor",
+    "WorkerError",
+    "WorkerPool",
+    "PooledProcessor",
+    "ProcessPoolProcessor",
+    "PartitionedProcessor",
+    "FusedProcessor",
+    "fuse",
+    "PipelineOrchestrator",
+    "Tee",
+    "TeeBranch",
+    "HashJoin",
+    "merge_dicts",
+    "PipelineGraph",
+    "Pipeline",
+]
@@ -0,0 +1,248 @@
+# src/app/use_cases/pipeline/builder.py
+import os
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union, TYPE_CHECKING
+
+from src.app.domain.models.packet import Packet
+from src.app.ports.output.middleware_processor import MiddlewareProcessor
+from src.app.use_cases.pipeline.checkpoint import CheckpointStore
+from src.app.use_cases.pipeline.dead_letter import DeadLetterQueue, ErrorPolicy, GuardedProcessor
+from src.app.use_cases.pipeline.executors import KeyFunction, PartitionedProcessor, ProcessPoolProcessor
+from src.app.use_cases.pipeline.orchestrator import PipelineOrchestrator
+from src.app.use_cases.pipeline.tee import BLOCK, Tee, TeeBranch
+from src.app.use_cases.pipeline.workers import ProcessorFactory
+from src.app.use_cases.profiling import Profiler
+
+if TYPE_CHECKING:
+    from src.app.use_cases.manager import StreamManager
+
+
+class Pipeline:
+    """
+    The Fluent Builder behind StreamClient.pipeline().
+
+    Collects a 'Cold' configuration (URIs + processors). No resource is opened 
+    until run() or stream() is called, at which point the StreamManager provides 
+    the handles and a PipelineOrchestrator executes the chain.
+    """
+    def __init__(self, manager: 'StreamManager', source_uri: str, **source_settings) -> None:
+        self._manager = manager
+        self._source_uri = source_uri
+        self._source_settings: Dict[str, Any] = source_settings
+        self._processors: List[MiddlewareProcessor] = []
+        self._policies: List[Optional[Dict[str, Any]]] = []
+        self._default_policy = ErrorPolicy()
+        self._dead_letter: Optional[Dict[str, Any]] = None
+        self._sink_uri: Optional[str] = None
+        self._sink_settings: Dict[str, Any] = {}
+        self._branches: List[Dict[str, Any]] = []
+        self._checkpoint: Optional[Dict[str, Any]] = None
+        self._profiler: Optional[Profiler] = None
+
+    # --- FLUENT API ---
+
+    def pipe(
+            self,
+            processor: MiddlewareProcessor,
+            on_error: Optional[str] = None,
+            retries: int = 0,
+            backoff: float = 0.0
+    ) -> 'Pipeline':
+        """
+        Appends a processor to the chain.
+        'on_error' ('fail', 'skip' or 'dead_letter', after 'retries' extra attempts)
+        overrides the pipeline-wide policy set with on_error() for this stage;
+        with only 'retries', the stage retries, then applies the pipeline-wide action.
+        """
+        if not isinstance(processor, MiddlewareProcessor):
+            raise TypeError(f"pipe() expects a MiddlewareProcessor, got: {type(processor).__name__}")
+        self._processors.append(processor)
+        self._policies.append({"action": on_error, "retries": retries, "backoff": backoff} if on_error or retries else None)
+        return self
+
+    def parallel(self, factory: ProcessorFactory, workers: Optional[int] = None, **options) -> 'Pipeline':
+        """
+        Appends a CPU-bound processor executed on a pool of worker processes.
+        'factory' must be picklable (typically the processor class itself).
+        Options are forwarded to ProcessPoolProcessor (batch_size, ordered, ...).
+        """
+        return self.pipe(ProcessPoolProcessor(factory, workers=workers, **options))
+
+    def partition(self, factory: ProcessorFactory, key: KeyFunction, partitions: Optional[int] = None, **options) -> 'Pipeline':
+        """
+        Appends a stateful processor executed as N key-partitioned instances.
+        Packets with the same key(payload) always reach the same instance.
+        Options are forwarded to PartitionedProcessor (executor, batch_size, ...).
+        """
+        return self.pipe(PartitionedProcessor(factory, key, partitions=partitions, **options))
+
+    def write(self, uri: str, **sink_settings) -> 'Pipeline':
+        """Terminal operation: declares the sink URI."""
+        self._sink_uri = uri
+        self._sink_settings = sink_settings
+        return self
+
+    def tee(
+            self,
+            uri: Optional[str] = None,
+            processors: Sequence[MiddlewareProcessor] = (),
+            name: Optional[str] = None,
+            policy: str = BLOCK,
+            buffer_size: int = 64,
+            spill_dir: Optional[str] = None,
+            **sink_settings
+    ) -> 'Pipeline':
+        """
+        Adds a fan-out branch: the chain output is read once and broadcast to every
+        branch (its own processors, then its own sink URI), each on its own thread.
+        A sink declared with write() becomes one more branch named 'sink'.
+        """
+        self._branches.append({
+            "name": name or f"branch-{len(self._branches)}",
+            "uri": uri,
+            "sink_settings": sink_settings,
+            "processors": tuple(processors),
+            "policy": policy,
+            "buffer_size": buffer_size,
+            "spill_dir": spill_dir,
+        })
+        return self
+
+    def on_error(self, action: str, retries: int = 0, backoff: float = 0.0) -> 'Pipeline':
+        """
+        Default error policy for every stage without its own and for sink writes:
+        'fail' (default), 'skip' or 'dead_letter', after 'retries' extra attempts.
+        """
+        self._default_policy = ErrorPolicy(action, retries, backoff)
+        return self
+
+    def dead_letter(
+            self,
+            uri: str,
+            batch_size: int = 100,
+            buffer_size: int = 1000,
+            spill_dir: Optional[str] = None,
+            **sink_settings
+    ) -> 'Pipeline':
+        """
+        Declares the sink URI of dead-lettered Packets (JSON Lines with lineage and
+        exception), written in batches of 'batch_size'; past 'buffer_size' pending
+        records, the queue spills to disk under 'spill_dir'.
+        """
+        self._dead_letter = {
+            "uri": uri,
+            "sink_settings": sink_settings,
+            "batch_size": batch_size,
+            "buffer_size": buffer_size,
+            "spill_dir": spill_dir,
+        }
+        return self
+
+    def checkpoint(self, path: Union[str, os.PathLike], interval: int = 10_000, min_seconds: float = 0.0) -> 'Pipeline':
+        """
+        Enables checkpointing to a local file: every 'interval' source Packets (and
+        at most once per 'min_seconds'), run() persists a consistent checkpoint, and
+        a rerun after a crash resumes from it. The file is removed once a run completes.
+        """
+        self._checkpoint = {"path": path, "interval": interval, "min_seconds": min_seconds}
+        return self
+
+    def profile(
+            self,
+            report_path: Optional[Union[str, os.PathLike]] = None,
+            cprofile: bool = False,
+            tracemalloc: bool = False
+    ) -> 'Pipeline':
+        """
+        Profiles the source, the sink(s) and every stage: wall and CPU time per
+        operation, plus optional cProfile stats and tracemalloc allocations.
+        When the run ends, a collapsed-stack (flamegraph) file is written to
+        'report_path' with a JSON summary next to it; see orchestrator.profiler.
+        """
+        self._profiler = Profiler(report_path, cprofile=cprofile, tracemalloc=tracemalloc)
+        return self
+
+    # --- EXECUTION ---
+
+    def build(self, threaded: bool = False, queue_size: int = 64, fuse: bool = True, batch_size: Optional[int] = None) -> PipelineOrchestrator:
+        """Requests the handles and returns a validated (not yet running) orchestrator."""
+        profile = self._profiler
+        source = self._manager.get_handle(self._source_uri, profile=profile, **self._source_settings)
+        sink = None
+        if self._sink_uri is not None and not self._branches:
+            sink = self._manager.get_handle(self._sink_uri, as_sink=True, profile=profile, **self._sink_settings)
+
+        dead_letters = None
+        if self._dead_letter is not None:
+            spec = self._dead_letter
+            dead_letters = DeadLetterQueue(
+                self._manager.get_handle(spec["uri"], as_sink=True, **spec["sink_settings"]),
+                batch_size=spec["batch_size"],
+                buffer_size=spec["buffer_size"],
+                spill_dir=spec["spill_dir"]
+            )
+
+        # Stages with a non-default policy are wrapped (plain stages stay fusable)
+        processors = []
+        for processor, override in zip(self._processors, self._policies):
+            policy = self._default_policy
+            if override is not None:
+                policy = ErrorPolicy(override["action"] or policy.action, override["retries"], override["backoff"])
+            processors.append(processor if policy.is_default else GuardedProcessor(processor, policy, dead_letters))
+
+        checkpoint = self._checkpoint if not self._branches else None
+        return PipelineOrchestrator(
+            source=source,
+            processors=processors,
+            sink=sink,
+            threaded=threaded,
+            queue_size=queue_size,
+            fuse=fuse,
+            batch_size=batch_size,
+            checkpoint=CheckpointStore(checkpoint["path"]) if checkpoint else None,
+            checkpoint_interval=checkpoint["interval"] if checkpoint else 10_000,
+            checkpoint_seconds=checkpoint["min_seconds"] if checkpoint else 0.0,
+            dead_letters=dead_letters,
+            sink_policy=self._default_policy,
+            telemetry=self._manager.telemetry,
+            profiler=profile,
+            tracer=self._manager.tracer,
+            memory=self._manager.memory
+        )
+
+    def build_tee(self, threaded: bool = False, queue_size: int = 64, fuse: bool = True, batch_size: Optional[int] = None) -> Tee:
+        """Returns a validated (not yet running) Tee broadcasting the chain output to every branch."""
+        if self._checkpoint is not None:
+            raise ValueError("Pipeline Configuration Error: checkpointing is not supported with tee branches.")
+        orchestrator = self.build(threaded=threaded, queue_size=queue_size, fuse=fuse, batch_size=batch_size)
+
+        declared = list(self._branches)
+        if self._sink_uri is not None:
+            declared.append({"name": "sink", "uri": self._sink_uri, "sink_settings": self._sink_settings})
+
+        branches = []
+        for spec in declared:
+            sink = None
+            if spec["uri"] is not None:
+                sink = self._manager.get_handle(spec["uri"], as_sink=True, profile=self._profiler, **spec["sink_settings"])
+            branches.append(TeeBranch(
+                name=spec["name"],
+                sink=sink,
+                processors=spec.get("processors", ()),
+                policy=spec.get("policy", BLOCK),
+                buffer_size=spec.get("buffer_size", 64),
+                spill_dir=spec.get("spill_dir")
+            ))
+        return Tee(orchestrator, branches, memory=self._manager.memory)
+
+    def run(self, threaded: bool = False, queue_size: int = 64, fuse: bool = True, batch_size: Optional[int] = None) -> Union[int, Dict[str, int]]:
+        """
+        Validates and executes the pipeline.
+        Returns the number of delivered packets, or (with tee branches) the count per branch.
+        """
+        if self._branches:
+            return self.build_tee(threaded=threaded, queue_size=queue_size, fuse=fuse, batch_size=batch_size).run()
+        return self.build(threaded=threaded, queue_size=queue_size, fuse=fuse, batch_size=batch_size).run()
+
+    def stream(self, threaded: bool = False, queue_size: int = 64, fuse: bool = True, batch_size: Optional[int] = None) -> Iterator[Packet]:
+        """Executes the chain and yields its output instead of writing to a sink."""
+        yield from self.build(threaded=threaded, queue_size=queue_size, fuse=fuse, batch_size=batch_size).stream()
@@ -0,0 +1,264 @@
+# src/app/use_cases/pipeline/channels.py
+import os
+import pickle
+import queue
+import tempfile
+from collections import deque
+from threading import Condition, Event
+from typing import IO, TYPE_CHECKING, Any, Deque, Iterator, Optional
+
+from src.app.use_cases.memory import estimate_item
+
+if TYPE_CHECKING:
+    from src.app.use_cases.memory import MemoryGovernor
+
+# End-of-stream marker travelling through a Channel
+END_OF_STREAM = object()
+
+
+class Cancelled(Exception):
+    """
+    Raised by Channel.get() once the pipeline was stopped.
+
+    Distinct from END_OF_STREAM so that a consumer never mistakes a cancelled
+    run for a complete one: drivers iterating a Channel skip flush(), and
+    aggregating stages emit (or persist) nothing.
+    """
+
+# put() calls between two item-size samples (memory accounting)
+SIZE_SAMPLE_EVERY = 16
+
+
+class Channel:
+    """
+    A bounded, stoppable pipe between two pipeline threads.
+
+    - Backpressure: put() blocks while the channel is full
+    - Cancellation: every blocking call gives up once the shared 'stop' Event is set;
+      get() (and iteration) raise Cancelled instead of reporting an end of stream
+    - Observability: 'depth' exposes the current number of queued items
+    - Memory: with a 'governor', 'buffered_bytes' estimates the queued bytes and
+      put() waits for the consumer while the process is over its memory budget
+      and this channel holds a significant share of it
+    """
+    def __init__(
+            self,
+            name: str,
+            maxsize: int,
+            stop: Event,
+            poll_interval: float = 0.1,
+            governor: Optional['MemoryGovernor'] = None
+    ) -> None:
+        """
+        :param name: Label used when reporting queue depths (usually the consuming stage).
+        :param maxsize: Maximum number of buffered items.
+        :param stop: Shared cancellation flag for the whole pipeline.
+        :param governor: Process-wide memory budget (None: count-bounded only).
+        """
+        if maxsize < 1:
+            raise ValueError(f"Channel '{name}' requires maxsize >= 1, got: {maxsize}")
+
+        self.name = name
+        self.maxsize = maxsize
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._stop = stop
+        self._poll_interval = poll_interval
+        self._governor = governor
+        self._item_size = 0
+        self._puts = 0
+
+    # --- PROPERTIES ---
+
+    @property
+    def depth(self) -> int:
+        """Current number of buffered items (approximate, thread-safe)."""
+        return self._queue.qsize()
+
+    @property
+    def buffered_bytes(self) -> int:
+        """Estimated bytes held in memory (sampled item size x depth; 0 without a governor)."""
+        return self.depth * self._item_size
+
+    # --- ACTION METHODS ---
+
+    def put(self, item: Any) -> bool:
+        """Blocks until the item is queued. Returns False if the pipeline was stopped."""
+        if self._governor is not None:
+            self._sample(item)
+            self._governor.throttle(self._queue.qsize, self._stop, held=lambda: self.buffered_bytes)
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=self._poll_interval)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def offer(self, item: Any) -> bool:
+        """Non-blocking put. Returns False (item not queued) when the channel is full."""
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except queue.Full:
+            return False
+
+    def close(self) -> bool:
+        """Signals the consumer that no more items will follow."""
+        return self.put(END_OF_STREAM)
+
+    def get(self) -> Any:
+        """
+        Blocks until an item is available.
+        Returns END_OF_STREAM on close(); raises Cancelled when the pipeline was stopped.
+        """
+        while not self._stop.is_set():
+            try:
+                return self._queue.get(timeout=self._poll_interval)
+            except queue.Empty:
+                continue
+        raise Cancelled(self.name)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yields items until the producer closes the channel (raises Cancelled on stop)."""
+        while (item := self.get()) is not END_OF_STREAM:
+            yield item
+
+    def drain(self) -> None:
+        """Discards buffered items (used during shutdown to unblock producers)."""
+        try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    # --- Private Helpers ---
+
+    def _sample(self, item: Any) -> None:
+        if self._puts % SIZE_SAMPLE_EVERY == 0 and item is not END_OF_STREAM:
+            self._item_size = estimate_item(item)
+        self._puts += 1
+
+
+class SpillingChannel(Channel):
+    """
+    A Channel that never blocks its producer: past 'maxsize' items, it appends
+    them (pickled) to a temporary spill file and replays them in FIFO order.
+
+    Memory stays bounded at 'maxsize' items; disk absorbs bursts from a fast
+    producer to a slow consumer. Once spilling starts, new items keep going to
+    disk until the consumer has caught up, which preserves ordering. With a
+    'governor', items go to disk as soon as the process is under memory pressure.
+    """
+    def __init__(
+            self,
+            name: str,
+            maxsize: int,
+            stop: Event,
+            spill_dir: Optional[str] = None,
+            poll_interval: float = 0.1,
+            governor: Optional['MemoryGovernor'] = None
+    ) -> None:
+        """
+        :param spill_dir: Directory of the spill file (defaults to the system temp dir).
+        """
+        super().__init__(name, maxsize, stop, poll_interval, governor)
+        self._memory: Deque[Any] = deque()
+        self._condition = Condition()
+        self._spill_dir = spill_dir
+        self._spill: Optional[IO[bytes]] = None
+        self._write_offset = 0
+        self._read_offset = 0
+        self._pending = 0
+        self._closed = False
+        self.spilled = 0
+
+    # --- PROPERTIES ---
+
+    @property
+    def depth(self) -> int:
+        return len(self._memory) + self._pending
+
+    @property
+    def buffered_bytes(self) -> int:
+        # Spilled items live on disk
+        return len(self._memory) * self._item_size
+
+    # --- ACTION METHODS ---
+
+    def put(self, item: Any) -> bool:
+        with self._condition:
+            if self._stop.is_set():
+                return False
+            if self._governor is not None:
+                self._sample(item)
+            if not self._pending and len(self._memory) < self.maxsize and not self._forced_spill():
+                self._memory.append(item)
+            else:
+                self._spill_item(item)
+            self._condition.notify()
+            return True
+
+    def offer(self, item: Any) -> bool:
+        return self.put(item)
+
+    def close(self) -> bool:
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            return True
+
+    def get(self) -> Any:
+        with self._condition:
+            while not self._stop.is_set():
+                if self._memory:
+                    return self._memory.popleft()
+                if self._pending:
+                    return self._unspill_item()
+                if self._closed:
+                    return END_OF_STREAM
+                self._condition.wait(self._poll_interval)
+            raise Cancelled(self.name)
+
+    def drain(self) -> None:
+        with self._condition:
+            self._memory.clear()
+            self._pending = 0
+            if self._spill is not None:
+                self._spill.close()
+                self._spill = None
+
+    # --- Private Helpers ---
+
+    def _forced_spill(self) -> bool:
+        """Under memory pressure, everything past the head item goes to disk."""
+        if self._governor is None or not self._memory or not self._governor.pressured:
+            return False
+        self._governor.forced_spills += 1
+        return True
+
+    def _spill_item(self, item: Any) -> None:
+        if self._spill is None:
+            descriptor, path = tempfile.mkstemp(prefix=f"streamflow-{self.name}-", suffix=".spill", dir=self._spill_dir)
+            self._spill = os.fdopen(descriptor, "w+b")
+            os.unlink(path)  # Anonymous: removed by the OS once closed
+            self._write_offset = self._read_offset = 0
+
+        self._spill.seek(self._write_offset)
+        pickle.dump(item, self._spill, protocol=pickle.HIGHEST_PROTOCOL)
+        self._write_offset = self._spill.tell()
+        self._pending += 1
+        self.spilled += 1
+
+    def _unspill_item(self) -> Any:
+        self._spill.flush()
+        self._spill.seek(self._read_offset)
+        item = pickle.load(self._spill)
+        self._read_offset = self._spill.tell()
+        self._pending -= 1
+
+        if not self._pending:
+            # Caught up: recycle the file from the start
+            self._spill.seek(0)
+            self._spill.truncate()
+            self._write_offset = self._read_offset = 0
+        return item
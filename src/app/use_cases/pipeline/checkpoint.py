@@ -0,0 +1,229 @@
+# src/app/use_cases/pipeline/checkpoint.py
+import math
+import os
+import pickle
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, List, Optional, TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from src.app.domain.models.streams import StreamHandle
+    from src.app.ports.output.middleware_processor import MiddlewareProcessor
+
+
+@dataclass
+class Checkpoint:
+    """
+    A consistent cut of a running pipeline.
+
+    Taken at a barrier where every Packet read so far has been fully processed
+    and written, so (source_offset, states, sink_offset) describe the same point.
+    """
+    sequence: int
+    plan: List[str]                 # Stage names, guards against restoring into a different chain
+    source_offset: Any              # Opaque, from StreamHandle.tell()
+    sink_offset: Any                # Opaque, None when the pipeline has no (seekable) sink
+    states: List[Any]               # One MiddlewareProcessor.snapshot() per stage
+    packets_read: int
+    packets_written: int
+    created_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class CheckpointStats:
+    """Cost of checkpointing during one run (overhead = seconds / run time)."""
+    count: int = 0
+    seconds: float = 0.0
+    bytes_written: int = 0
+    restored_from: Optional[int] = None
+
+
+class CheckpointStore:
+    """
+    Local, crash-safe store holding the latest Checkpoint of one pipeline.
+
+    save() writes a temp file, fsyncs it and renames it over the previous one,
+    so a crash leaves either the old or the new checkpoint, never a torn file.
+    """
+    _MAGIC = b"SFCKPT1\n"
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        self.path = Path(path)
+
+    def load(self) -> Optional[Checkpoint]:
+        """Returns the latest Checkpoint, or None when the pipeline never checkpointed."""
+        if not self.path.exists():
+            return None
+        with open(self.path, "rb") as handle:
+            if handle.read(len(self._MAGIC)) != self._MAGIC:
+                raise ValueError(f"Not a pipeline checkpoint file: {self.path}")
+            return pickle.load(handle)
+
+    def save(self, checkpoint: Checkpoint) -> int:
+        """Atomically replaces the stored Checkpoint. Returns the number of bytes written."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        with open(temporary, "wb") as handle:
+            handle.write(self._MAGIC)
+            pickle.dump(checkpoint, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            handle.flush()
+            os.fsync(handle.fileno())
+            size = handle.tell()
+        os.replace(temporary, self.path)
+        self._sync_directory()
+        return size
+
+    def clear(self) -> None:
+        """Forgets the stored Checkpoint (called once a run completes)."""
+        self.path.unlink(missing_ok=True)
+        self.path.with_name(self.path.name + ".tmp").unlink(missing_ok=True)
+
+    # --- Private Helpers ---
+
+    def _sync_directory(self) -> None:
+        # Makes the rename itself durable (no-op where directories cannot be opened)
+        try:
+            descriptor = os.open(self.path.parent, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(descriptor)
+        except OSError:
+            pass
+        finally:
+            os.close(descriptor)
+
+
+class Checkpointer:
+    """
+    Takes periodic Checkpoints during one PipelineOrchestrator.run().
+
+    guard() wraps the source iterator of the sequential engine: in a pull-based
+    chain, the moment the source is asked for its next Packet is a quiescent
+    barrier (every stage has finished the previous one and the sink has written
+    its outputs), so the checkpoint taken there is consistent without pausing
+    any thread or buffering any output.
+
+    Overhead is bounded by 'interval' (source Packets between checkpoints) and
+    'min_seconds' (wall-clock floor between checkpoints); see 'stats'.
+    """
+    def __init__(
+            self,
+            store: CheckpointStore,
+            stages: List['MiddlewareProcessor'],
+            interval: int = 10_000,
+            min_seconds: float = 0.0
+    ) -> None:
+        if interval < 1:
+            raise ValueError(f"checkpoint interval must be >= 1, got: {interval}")
+        self._store = store
+        self._stages = stages
+        self._plan = [stage.name for stage in stages]
+        self._interval = interval
+        self._min_seconds = min_seconds
+
+        self._resumed: Optional[Checkpoint] = None
+        self._sequence = 0
+        self._since = 0
+        self._last_at = -math.inf
+        self.packets_read = 0
+        self.packets_written = 0
+        self.stats = CheckpointStats()
+
+    # --- RECOVERY ---
+
+    def resume(self, source: 'StreamHandle', sink: Optional['StreamHandle']) -> Optional[Checkpoint]:
+        """
+        Loads the last Checkpoint and positions both handles (before they are opened).
+        :return: The Checkpoint resumed from, or None for a fresh run.
+        """
+        checkpoint = self._store.load()
+        if checkpoint is None:
+            return None
+        if checkpoint.plan != self._plan:
+            raise ValueError(
+                f"Checkpoint Error: {self._store.path} was taken by a different pipeline "
+                f"({checkpoint.plan}), expected {self._plan}."
+            )
+        if not source.seek(checkpoint.source_offset):
+            raise ValueError(f"Checkpoint Error: source cannot resume at a position: {source.uri}")
+        if sink is not None and checkpoint.sink_offset is not None and not sink.seek(checkpoint.sink_offset):
+            raise ValueError(f"Checkpoint Error: sink cannot resume at a position: {sink.uri}")
+
+        self._resumed = checkpoint
+        self._sequence = checkpoint.sequence
+        self.packets_read = checkpoint.packets_read
+        self.packets_written = checkpoint.packets_written
+        self.stats.restored_from = checkpoint.sequence
+        return checkpoint
+
+    def restore(self) -> None:
+        """Reinstates the processor snapshots (after the stages were opened)."""
+        if self._resumed is not None:
+            for stage, state in zip(self._stages, self._resumed.states):
+                stage.restore(state)
+
+    def complete(self) -> None:
+        """The run finished: the next one starts from scratch."""
+        self._store.clear()
+
+    # --- CHECKPOINTING ---
+
+    def guard(
+            self,
+            items: Iterable[Any],
+            weight: Callable[[Any], int],
+            source: 'StreamHandle',
+            sink: Optional['StreamHandle']
+    ) -> Iterator[Any]:
+        """
+        Yields the source items (Packets or batches), checkpointing at the barrier
+        before each pull whenever one is due.
+        :param weight: Number of source Packets in an item (1, or len() of a batch).
+        """
+        iterator = iter(items)
+        while True:
+            if self._due():
+                self.take(source, sink)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            count = weight(item)
+            self.packets_read += count
+            self._since += count
+            yield item
+
+    def take(self, source: 'StreamHandle', sink: Optional['StreamHandle']) -> Checkpoint:
+        """Snapshots source offset, processor states and committed sink position, then persists them."""
+        started = time.perf_counter()
+
+        # 1. SINK first: flushed and synced, so the stored offset is durable
+        sink_offset = sink.tell() if sink is not None else None
+        checkpoint = Checkpoint(
+            sequence=self._sequence + 1,
+            plan=self._plan,
+            source_offset=source.tell(),
+            sink_offset=sink_offset,
+            states=[stage.snapshot() for stage in self._stages],
+            packets_read=self.packets_read,
+            packets_written=self.packets_written
+        )
+
+        # 2. COMMIT: atomic replace of the previous checkpoint
+        self.stats.bytes_written += self._store.save(checkpoint)
+        self._sequence = checkpoint.sequence
+        self._since = 0
+        self._last_at = time.monotonic()
+        self.stats.count += 1
+        self.stats.seconds += time.perf_counter() - started
+        return checkpoint
+
+    # --- Private Helpers ---
+
+    def _due(self) -> bool:
+        if self._sequence == 0:
+            # Fresh run: an initial checkpoint pins the plan and the starting state
+            return True
+        return self._since >= self._interval and time.monotonic() - self._last_at >= self._min_seconds
@@ -0,0 +1,321 @@
+# src/app/use_cases/pipeline/dead_letter.py
+import base64
+import json
+import time
+import traceback
+from dataclasses import dataclass
+from threading import Event, Thread
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from src.app.domain.models.packet import Packet, PayloadType
+from src.app.domain.models.streams import StreamHandle
+from src.app.ports.output.middleware_processor import MiddlewareProcessor
+from src.app.use_cases.pipeline.channels import END_OF_STREAM, SpillingChannel
+from src.app.use_cases.pipeline.errors import PipelineError
+
+# Error actions (applied once the retries are exhausted)
+FAIL = "fail"
+SKIP = "skip"
+DEAD_LETTER = "dead_letter"
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class ErrorPolicy:
+    """
+    What a stage does when processing a Packet raises.
+
+    - 'retries': extra attempts before giving up (backoff doubles after each one)
+    - 'action':  then 'fail' (stop the run), 'skip' (drop the Packet) or
+                 'dead_letter' (drop it and record it in the DeadLetterQueue)
+    """
+    action: str = FAIL
+    retries: int = 0
+    backoff: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.action not in (FAIL, SKIP, DEAD_LETTER):
+            raise ValueError(f"Unsupported error action: '{self.action}'. Use '{FAIL}', '{SKIP}' or '{DEAD_LETTER}'.")
+        if self.retries < 0 or self.backoff < 0:
+            raise ValueError(f"ErrorPolicy requires retries >= 0 and backoff >= 0, got: {self.retries}, {self.backoff}")
+
+    @property
+    def is_default(self) -> bool:
+        """Fail on the first error (the runtime's behaviour without a policy)."""
+        return self.action == FAIL and self.retries == 0
+
+    def run(
+            self,
+            stage: str,
+            packet: Optional[Packet],
+            operation: Callable[[], T],
+            dead_letters: Optional['DeadLetterQueue'] = None
+    ) -> Tuple[bool, Optional[T]]:
+        """
+        Runs 'operation' under the policy.
+        :return: (True, result) on success, (False, None) when the Packet was skipped or dead-lettered.
+        :raises PipelineError: when the action is 'fail'.
+        """
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                return True, operation()
+            except PipelineError:
+                raise
+            except Exception as error:
+                if attempts <= self.retries:
+                    if self.backoff:
+                        time.sleep(self.backoff * 2 ** (attempts - 1))
+                    continue
+                if self.action == FAIL:
+                    raise PipelineError(stage, packet) from error
+                if self.action == DEAD_LETTER:
+                    dead_letters.put(stage, packet, error, attempts)
+                return False, None
+
+
+def dead_letter_record(stage: str, packet: Optional[Packet], error: BaseException, attempts: int) -> Dict[str, Any]:
+    """JSON-ready description of a failed Packet: lineage, payload and exception."""
+    record: Dict[str, Any] = {
+        "stage": stage,
+        "attempts": attempts,
+        "failed_at": time.time(),
+        "error": {
+            "type": type(error).__name__,
+            "message": str(error),
+            "traceback": "".join(traceback.format_exception(type(error), error, error.__traceback__)),
+        },
+        "packet": None,
+    }
+    if packet is not None:
+        payload, encoding = packet.payload, None
+        if isinstance(payload, (bytes, bytearray)):
+            payload, encoding = base64.b64encode(payload).decode("ascii"), "base64"
+        record["packet"] = {
+            "id": packet.identity.id,
+            "correlation_id": packet.identity.correlation_id,
+            "parent_id": packet.identity.parent_id,
+            "trace_id": packet.context.trace_id,
+            "origin": packet.context.origin,
+            "subject": packet.subject,
+            "signal": str(packet.signal),
+            "metadata": packet.metadata,
+            "payload": payload,
+            "payload_encoding": encoding,
+        }
+    return record
+
+
+class DeadLetterQueue:
+    """
+    Collects failed Packets and writes them, as JSON Lines batches, to any sink.
+
+    put() never blocks the pipeline: records wait in a SpillingChannel (at most
+    'buffer_size' in memory, the rest in a temp file under 'spill_dir') and a
+    writer thread sends up to 'batch_size' records per sink write.
+    Thread-safe: stages on different threads may share one queue.
+    """
+    STAGE = "dead_letter"
+
+    def __init__(
+            self,
+            sink: StreamHandle,
+            batch_size: int = 100,
+            buffer_size: int = 1000,
+            spill_dir: Optional[str] = None,
+            poll_interval: float = 0.1
+    ) -> None:
+        """
+        :param sink: Writable handle receiving the JSON Lines records.
+        :param batch_size: Maximum records per sink write.
+        :param buffer_size: Records kept in memory before spilling to disk.
+        :param spill_dir: Directory of the spill file (defaults to the system temp dir).
+        """
+        if batch_size < 1:
+            raise ValueError(f"DeadLetterQueue requires batch_size >= 1, got: {batch_size}")
+        if not sink.capacity.is_writable:
+            raise ValueError(f"DeadLetterQueue sink is read-only: {sink.uri}")
+
+        self._sink = sink
+        self._batch_size = batch_size
+        self._buffer_size = buffer_size
+        self._spill_dir = spill_dir
+        self._poll_interval = poll_interval
+
+        self._channel: Optional[SpillingChannel] = None
+        self._stop = Event()
+        self._writer: Optional[Thread] = None
+        self._error: Optional[BaseException] = None
+        self.count = 0
+        self.written = 0
+
+    # --- PROPERTIES ---
+
+    @property
+    def spilled(self) -> int:
+        return self._channel.spilled if self._channel is not None else 0
+
+    # --- LIFECYCLE ---
+
+    def open(self) -> None:
+        self.count = self.written = 0
+        self._error = None
+        self._stop = Event()
+        self._channel = SpillingChannel(self.STAGE, self._buffer_size, self._stop, self._spill_dir, self._poll_interval)
+        self._sink.__enter__()
+        self._writer = Thread(target=self._drain, name="streamflow-dead-letter", daemon=True)
+        self._writer.start()
+
+    def close(self) -> None:
+        """Writes every pending record, then closes the sink."""
+        if self._channel is None:
+            return
+        try:
+            self._channel.close()
+            self._writer.join()
+        finally:
+            self._sink.__exit__(None, None, None)
+            self._channel.drain()
+            self._channel = self._writer = None
+        self._raise_on_writer_error()
+
+    def __enter__(self) -> 'DeadLetterQueue':
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    # --- ACTION METHODS ---
+
+    def put(self, stage: str, packet: Optional[Packet], error: BaseException, attempts: int = 1) -> None:
+        """Queues a failed Packet (None for stage-level failures such as flush())."""
+        if self._channel is None:
+            raise RuntimeError("DeadLetterQueue is not open.")
+        self._raise_on_writer_error()
+        self._channel.put(dead_letter_record(stage, packet, error, attempts))
+        self.count += 1
+
+    # --- Private Helpers ---
+
+    def _drain(self) -> None:
+        channel = self._channel
+        try:
+            while (record := channel.get()) is not END_OF_STREAM:
+                batch = [record]
+                while len(batch) < self._batch_size and channel.depth:
+                    batch.append(channel.get())
+                self._write(batch)
+        except BaseException as e:
+            self._error = e
+            self._stop.set()
+
+    def _write(self, records: List[Dict[str, Any]]) -> None:
+        payload = b"".join(json.dumps(record, default=repr).encode("utf-8") + b"\n" for record in records)
+        self._sink.write(payload)
+        self.written += len(records)
+
+    def _raise_on_writer_error(self) -> None:
+        if self._error is not None:
+            raise PipelineError(self.STAGE, message=f"Error in '{self.STAGE}' while writing records") from self._error
+
+
+class GuardedProcessor(MiddlewareProcessor):
+    """
+    Applies an ErrorPolicy around another processor (same name and subjects).
+
+    process() outputs are materialized per Packet, so a retried or skipped
+    Packet never leaks partial results downstream. A failing process_batch()
+    is replayed one Packet at a time to isolate the bad records; processors
+    with side effects should make process_batch() all-or-nothing.
+    """
+    def __init__(
+            self,
+            processor: MiddlewareProcessor,
+            policy: ErrorPolicy,
+            dead_letters: Optional[DeadLetterQueue] = None
+    ) -> None:
+        if policy.action == DEAD_LETTER and dead_letters is None:
+            raise ValueError(f"Stage '{processor.name}' dead-letters its failures but no DeadLetterQueue was given.")
+        self._processor = processor
+        self._policy = policy
+        self._dead_letters = dead_letters
+        self.failures = 0
+
+    # --- IDENTITY & HANDSHAKE ---
+
+    @property
+    def name(self) -> str:
+        return self._processor.name
+
+    @property
+    def input_subject(self) -> PayloadType:
+        return self._processor.input_subject
+
+    @property
+    def output_subject(self) -> PayloadType:
+        return self._processor.output_subject
+
+    @property
+    def processor(self) -> MiddlewareProcessor:
+        return self._processor
+
+    @property
+    def policy(self) -> ErrorPolicy:
+        return self._policy
+
+    # --- LIFECYCLE ---
+
+    def open(self) -> None:
+        self.failures = 0
+        self._processor.open()
+
+    def close(self) -> None:
+        self._processor.close()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        # Forwarded rather than close(): the wrapped stage may discard uncommitted state on failure
+        self._processor.__exit__(exc_type, exc_val, exc_tb)
+
+    def snapshot(self) -> Any:
+        return self._processor.snapshot()
+
+    def restore(self, state: Any) -> None:
+        self._processor.restore(state)
+
+    # --- TRANSFORMATION ---
+
+    def process(self, packet: Packet) -> Iterator[Packet]:
+        return iter(self._attempt(packet))
+
+    def process_batch(self, packets: List[Packet]) -> Iterator[Packet]:
+        try:
+            return iter(list(self._processor.process_batch(packets)))
+        except PipelineError:
+            raise
+        except Exception:
+            output: List[Packet] = []
+            for packet in packets:
+                output.extend(self._attempt(packet))
+            return iter(output)
+
+    def flush(self) -> Iterator[Packet]:
+        # Not retried: a partial flush may already have drained the buffers
+        no_retry = ErrorPolicy(self._policy.action)
+        succeeded, output = no_retry.run(self.name, None, lambda: list(self._processor.flush()), self._dead_letters)
+        if not succeeded:
+            self.failures += 1
+            return iter(())
+        return iter(output)
+
+    # --- Private Helpers ---
+
+    def _attempt(self, packet: Packet) -> List[Packet]:
+        processor = self._processor
+        succeeded, output = self._policy.run(self.name, packet, lambda: list(processor.process(packet)), self._dead_letters)
+        if not succeeded:
+            self.failures += 1
+            return []
+        return output
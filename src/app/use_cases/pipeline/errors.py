@@ -0,0 +1,24 @@
+# src/app/use_cases/pipeline/errors.py
+from typing import Optional
+
+from src.app.domain.models.packet import Packet
+
+
+class PipelineError(RuntimeError):
+    """
+    Labelled failure raised by the Pipeline runtime.
+
+    Carries the failing stage and (when available) the packet being processed, 
+    e.g. "Error in 'Validation Layer' while processing Packet ID: 123".
+    The original exception is chained as __cause__.
+    """
+    def __init__(self, stage: str, packet: Optional[Packet] = None, message: Optional[str] = None) -> None:
+        self.stage = stage
+        self.packet = packet
+
+        if message is None:
+            if packet is not None:
+                message = f"Error in '{stage}' while processing Packet ID: {packet.identity.id}"
+            else:
+                message = f"Error in '{stage}'"
+        super().__init__(message)
@@ -0,0 +1,291 @@
+# src/app/use_cases/pipeline/executors.py
+import os
+from abc import abstractmethod
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional
+
+from src.app.domain.models.packet import Packet, PayloadType
+from src.app.ports.output.middleware_processor import MiddlewareProcessor
+from src.app.use_cases.pipeline.errors import PipelineError
+from src.app.use_cases.pipeline.workers import ProcessorFactory, WorkerError, WorkerPool
+
+# Extracts the partition key from a Packet payload
+KeyFunction = Callable[[Any], Hashable]
+
+
+class PooledProcessor(MiddlewareProcessor):
+    """
+    Base for processors that fan packets out to a WorkerPool.
+
+    Owns the shared plumbing: batching, in-flight accounting (backpressure),
+    error translation and the flush protocol (drain in-flight batches, then
+    flush every worker's private instance). Subclasses decide routing via
+    '_route()' and may post-process results via '_emit()'.
+    """
+    def __init__(
+            self,
+            factory: ProcessorFactory,
+            workers: int,
+            executor: str,
+            batch_size: int,
+            max_inflight: Optional[int],
+            start_method: Optional[str]
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got: {batch_size}")
+
+        self._factory = factory
+        self._workers = workers
+        self._batch_size = batch_size
+        self._max_inflight = max_inflight or 2 * workers
+
+        # Prototype: declares name/subjects without being opened
+        self._prototype = factory()
+
+        self._pool = WorkerPool(
+            factory=factory,
+            workers=workers,
+            executor=executor,
+            inbox_size=self._max_inflight,
+            start_method=start_method
+        )
+        self._reset_state()
+
+    # --- IDENTITY & HANDSHAKE ---
+
+    @property
+    def input_subject(self) -> PayloadType:
+        return self._prototype.input_subject
+
+    @property
+    def output_subject(self) -> PayloadType:
+        return self._prototype.output_subject
+
+    # --- LIFECYCLE ---
+
+    def open(self) -> None:
+        self._reset_state()
+        self._pool.start()
+
+    def close(self) -> None:
+        self._pool.stop()
+        self._reset_state()
+
+    # --- TRANSFORMATION ---
+
+    def process(self, packet: Packet) -> Iterator[Packet]:
+        worker_index = self._route(packet)
+        batch = self._batches[worker_index]
+        batch.append(packet)
+        if len(batch) >= self._batch_size:
+            self._submit(worker_index)
+
+        # Opportunistically emit whatever is ready; block only when saturated
+        yield from self._collect(block=False)
+        while self._inflight >= self._max_inflight:
+            yield from self._collect(block=True)
+
+    def flush(self) -> Iterator[Packet]:
+        # 1. Push every partial batch and wait for every outstanding result
+        for worker_index in range(self._workers):
+            self._submit(worker_index)
+        while self._inflight:
+            yield from self._collect(block=True)
+
+        # 2. Flush every worker's private instance (emitted in worker order)
+        first_seq = self._next_seq
+        for worker_index in range(self._workers):
+            self._pool.request_flush(worker_index, self._next_seq)
+            self._next_seq += 1
+
+        flushed: Dict[int, List[Packet]] = {}
+        while len(flushed) < self._workers:
+            _, seq, packets = self._receive(block=True)
+            flushed[seq] = packets
+
+        self._on_flushed(self._next_seq)
+        for seq in range(first_seq, first_seq + self._workers):
+            yield from flushed[seq]
+
+    # --- CHECKPOINT ---
+
+    @property
+    def checkpointable(self) -> bool:
+        # Worker-side state and in-flight batches live in other threads/processes
+        return False
+
+    def snapshot(self) -> Any:
+        raise RuntimeError(f"'{self.name}' cannot be checkpointed: its state lives on the workers.")
+
+    # --- Extension Points ---
+
+    @abstractmethod
+    def _route(self, packet: Packet) -> int:
+        """Returns the index of the worker that must process 'packet'."""
+        pass
+
+    def _emit(self, seq: int, packets: List[Packet]) -> Iterator[Packet]:
+        """Releases the results of batch 'seq' (default: as they arrive)."""
+        yield from packets
+
+    def _on_flushed(self, next_seq: int) -> None:
+        """Called once every worker has been flushed."""
+        pass
+
+    # --- Private Helpers ---
+
+    def _reset_state(self) -> None:
+        self._batches: List[List[Packet]] = [[] for _ in range(self._workers)]
+        self._next_seq = 0
+        self._inflight = 0
+
+    def _submit(self, worker_index: int) -> None:
+        """Sends the pending batch of a worker, tagged with the next sequence number."""
+        batch = self._batches[worker_index]
+        if not batch:
+            return
+        self._pool.submit(worker_index, self._next_seq, batch)
+        self._batches[worker_index] = []
+        self._next_seq += 1
+        self._inflight += 1
+
+    def _collect(self, block: bool) -> Iterator[Packet]:
+        """Receives at most one result and yields whatever became emittable."""
+        result = self._receive(block=block)
+        if result is None:
+            return
+        _, seq, packets = result
+        self._inflight -= 1
+        yield from self._emit(seq, packets)
+
+    def _receive(self, block: bool):
+        try:
+            return self._pool.receive(block=block)
+        except WorkerError as e:
+            raise PipelineError(self.name, message=f"Error in '{self.name}' (worker {e.worker_index})") from e
+
+
+class ProcessPoolProcessor(PooledProcessor):
+    """
+    Execution Mode: runs a CPU-bound MiddlewareProcessor across worker processes.
+
+    - Each worker builds its own processor via 'factory' and calls open() once
+    - Packets travel in batches of 'batch_size' to amortize pickling/IPC cost
+    - ordered=True re-sequences batch results so output order matches input order
+    - flush() waits for every in-flight batch, then flushes every worker's instance
+    - At most 'max_inflight' batches are outstanding (backpressure)
+
+    Being a MiddlewareProcessor itself, it drops into any chain:
+        pipeline.pipe(ProcessPoolProcessor(MyParser, workers=4))
+    """
+    def __init__(
+            self,
+            factory: ProcessorFactory,
+            workers: Optional[int] = None,
+            batch_size: int = 64,
+            ordered: bool = True,
+            max_inflight: Optional[int] = None,
+            start_method: Optional[str] = None
+    ) -> None:
+        """
+        :param factory: Picklable callable returning a fresh processor (e.g. the class itself).
+        :param workers: Number of worker processes (defaults to os.cpu_count()).
+        :param batch_size: Packets per IPC message.
+        :param ordered: Preserve input order in the output.
+        :param max_inflight: Outstanding batches before process() blocks (defaults to 2 * workers).
+        :param start_method: multiprocessing start method ('fork', 'spawn', 'forkserver').
+        """
+        self._ordered = ordered
+        super().__init__(
+            factory=factory,
+            workers=workers or os.cpu_count() or 1,
+            executor="process",
+            batch_size=batch_size,
+            max_inflight=max_inflight,
+            start_method=start_method
+        )
+
+    @property
+    def name(self) -> str:
+        return f"{self._prototype.name}[x{self._workers}]"
+
+    # --- Routing & Ordering ---
+
+    def _reset_state(self) -> None:
+        super()._reset_state()
+        self._next_emit = 0
+        self._reorder: Dict[int, List[Packet]] = {}
+
+    def _route(self, packet: Packet) -> int:
+        # Round-robin on the sequence number of the batch being filled
+        return self._next_seq % self._workers
+
+    def _emit(self, seq: int, packets: List[Packet]) -> Iterator[Packet]:
+        if not self._ordered:
+            yield from packets
+            return
+
+        # Reorder buffer: release contiguous sequence numbers only
+        self._reorder[seq] = packets
+        while self._next_emit in self._reorder:
+            yield from self._reorder.pop(self._next_emit)
+            self._next_emit += 1
+
+    def _on_flushed(self, next_seq: int) -> None:
+        self._next_emit = next_seq
+
+
+class PartitionedProcessor(PooledProcessor):
+    """
+    Execution Mode: key-partitioned parallelism for stateful processors.
+
+    Packets are hash-routed on key(payload) to one of N private processor
+    instances, so every key is always seen by the same instance and per-key
+    state (rollups, sessions, dedup sets) stays correct.
+
+    - Each partition keeps its own buffers and is flushed independently on STREAM_END
+    - Outputs of all partitions are merged as they complete; order is preserved
+      within a partition, not across partitions
+    - executor='thread' (default) or 'process' for CPU-bound aggregations
+    """
+    def __init__(
+            self,
+            factory: ProcessorFactory,
+            key: KeyFunction,
+            partitions: Optional[int] = None,
+            executor: str = "thread",
+            batch_size: int = 64,
+            max_inflight: Optional[int] = None,
+            start_method: Optional[str] = None
+    ) -> None:
+        """
+        :param factory: Callable returning a fresh processor (picklable for executor='process').
+        :param key: Extracts the partition key from a payload (evaluated in the calling thread).
+        :param partitions: Number of instances/workers (defaults to os.cpu_count()).
+        :param executor: 'thread' or 'process'.
+        :param batch_size: Packets per partition batch.
+        :param max_inflight: Outstanding batches before process() blocks (defaults to 2 * partitions).
+        :param start_method: multiprocessing start method (executor='process' only).
+        """
+        self._key = key
+        super().__init__(
+            factory=factory,
+            workers=partitions or os.cpu_count() or 1,
+            executor=executor,
+            batch_size=batch_size,
+            max_inflight=max_inflight,
+            start_method=start_method
+        )
+
+    @property
+    def name(self) -> str:
+        return f"{self._prototype.name}[by key x{self._workers}]"
+
+    def partition_of(self, payload: Any) -> int:
+        """The partition index a payload is routed to."""
+        return hash(self._key(payload)) % self._workers
+
+    def _route(self, packet: Packet) -> int:
+        try:
+            return self.partition_of(packet.payload)
+        except Exception as e:
+            raise PipelineError(self.name, packet, message=f"Error in '{self.name}' while computing the partition key") from e
@@ -0,0 +1,136 @@
+# src/app/use_cases/pipeline/fusion.py
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+from src.app.domain.models.packet import Packet, PayloadType
+from src.app.ports.output.middleware_processor import FilterProcessor, MapProcessor, MiddlewareProcessor
+from src.app.use_cases.pipeline.errors import PipelineError
+
+# (is_filter, transform-or-predicate, stage)
+FusedStep = Tuple[bool, Callable[[Any], Any], MiddlewareProcessor]
+
+
+def is_fusable(processor: MiddlewareProcessor) -> bool:
+    """
+    True for Map/Filter stages that kept the stock process()/process_batch(),
+    i.e. whose behaviour is fully described by transform()/accept().
+    """
+    for base in (MapProcessor, FilterProcessor):
+        if isinstance(processor, base):
+            cls = type(processor)
+            return cls.process is base.process and cls.process_batch is base.process_batch
+    return False
+
+
+class FusedProcessor(MiddlewareProcessor):
+    """
+    Operator Fusion: N consecutive stateless stages executed as one loop.
+
+    Instead of one generator and one intermediate Packet per stage, the payload
+    is threaded through every transform/predicate and a single derivative is
+    spawned at the end. Filters that reject stop the loop early; a chain made
+    only of filters passes the original Packet through.
+    """
+    def __init__(self, stages: Sequence[MiddlewareProcessor]) -> None:
+        if len(stages) < 2:
+            raise ValueError("FusedProcessor requires at least 2 stages.")
+        for stage in stages:
+            if not is_fusable(stage):
+                raise TypeError(f"Stage '{stage.name}' is not a fusable Map/Filter processor.")
+
+        self._stages: List[MiddlewareProcessor] = list(stages)
+        self._steps: List[FusedStep] = [
+            (True, stage.accept, stage) if isinstance(stage, FilterProcessor) else (False, stage.transform, stage)
+            for stage in self._stages
+        ]
+        self._maps = any(not is_filter for is_filter, _, _ in self._steps)
+        self._name = "+".join(stage.name for stage in self._stages)
+
+    # --- IDENTITY & HANDSHAKE ---
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def stages(self) -> List[MiddlewareProcessor]:
+        return list(self._stages)
+
+    @property
+    def input_subject(self) -> PayloadType:
+        return self._stages[0].input_subject
+
+    @property
+    def output_subject(self) -> PayloadType:
+        return self._stages[-1].output_subject
+
+    # --- LIFECYCLE ---
+
+    def open(self) -> None:
+        for stage in self._stages:
+            stage.open()
+
+    def close(self) -> None:
+        for stage in reversed(self._stages):
+            stage.close()
+
+    # --- TRANSFORMATION ---
+
+    def process(self, packet: Packet) -> Iterator[Packet]:
+        result = self._apply(packet)
+        if result is not None:
+            yield result
+
+    def process_batch(self, packets: List[Packet]) -> Iterator[Packet]:
+        apply = self._apply
+        for packet in packets:
+            result = apply(packet)
+            if result is not None:
+                yield result
+
+    def flush(self) -> Iterator[Packet]:
+        yield from []
+
+    # --- Private Helpers ---
+
+    def _apply(self, packet: Packet) -> Optional[Packet]:
+        """Runs every step; returns the single derivative, or None when filtered out."""
+        payload = packet.payload
+        for is_filter, step, stage in self._steps:
+            try:
+                if is_filter:
+                    if not step(payload):
+                        return None
+                else:
+                    payload = step(payload)
+            except Exception as e:
+                # Label with the original stage, not the fused group
+                raise PipelineError(stage.name, packet) from e
+
+        if self._maps:
+            return packet.spawn(payload, subject=self.output_subject)
+        return packet
+
+
+def fuse(processors: Sequence[MiddlewareProcessor]) -> List[MiddlewareProcessor]:
+    """
+    Collapses every run of 2+ consecutive fusable stages into a FusedProcessor.
+    Other stages are returned untouched and in order.
+    """
+    fused: List[MiddlewareProcessor] = []
+    run: List[MiddlewareProcessor] = []
+
+    def close_run() -> None:
+        if len(run) > 1:
+            fused.append(FusedProcessor(run))
+        else:
+            fused.extend(run)
+        run.clear()
+
+    for processor in processors:
+        if is_fusable(processor):
+            run.append(processor)
+        else:
+            close_run()
+            fused.append(processor)
+    close_run()
+    return fused
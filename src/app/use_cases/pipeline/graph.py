@@ -0,0 +1,401 @@
+# src/app/use_cases/pipeline/graph.py
+import heapq
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from threading import Event, Thread
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, TYPE_CHECKING, Union
+
+from src.app.domain.models.packet import Packet, PayloadSubject, PayloadType
+from src.app.domain.models.streams import StreamHandle
+from src.app.ports.output.middleware_processor import MiddlewareProcessor
+from src.app.use_cases.pipeline.channels import END_OF_STREAM, Cancelled, Channel
+from src.app.use_cases.pipeline.errors import PipelineError
+from src.app.use_cases.pipeline.fusion import fuse
+from src.app.use_cases.pipeline.join import HashJoin
+from src.app.use_cases.pipeline.orchestrator import PipelineOrchestrator
+
+if TYPE_CHECKING:
+    from src.app.use_cases.manager import StreamManager
+
+# Node kinds
+SOURCE = "source"
+MERGE = "merge"
+STAGE = "stage"
+JOIN = "join"
+ZIP = "zip"
+ROUTE = "route"
+SINK = "sink"
+
+
+@dataclass
+class GraphNode:
+    """One vertex of a PipelineGraph: a named operator and the nodes it reads from."""
+    name: str
+    kind: str
+    inputs: List[str] = field(default_factory=list)
+    options: Dict[str, Any] = field(default_factory=dict)
+
+
+class PipelineGraph:
+    """
+    DAG Pipelines.
+
+    Declares named nodes wired by name; run() starts one thread per node and
+    connects every edge with a bounded Channel, so independent branches run
+    concurrently and memory stays capped at 'queue_size' per edge.
+
+    Operators:
+    - source(name, uri_or_handle):           reads a StreamHandle
+    - merge(name, inputs, key=None):         interleaves (key=None) or k-way merges by key(payload)
+    - stage(name, input, processors):        a linear MiddlewareProcessor chain (fused)
+    - join(name, probe, build, ...):         streaming HashJoin; the build side is loaded once
+    - zip(name, inputs, combine, subject):   pairs the n-th Packets of every input into one
+                                             (stops at the shortest input, the rest is 'dropped')
+    - route(name, input, routes, default):   sends each Packet to the port named for its subject
+                                             (unrouted Packets are counted in 'dropped')
+    - sink(name, input, uri_or_handle):      writes to a StreamHandle
+
+    A node consumed by several nodes broadcasts to all of them (blocking fan-out).
+    Route ports are addressed as inputs named '<route>.<port>'. The inputs of a join,
+    a zip or a keyed merge must not share an upstream: these nodes wait on one
+    input (the build side, the next item of each input) while the shared producer
+    blocks on the full inbox of another, so validate() rejects them.
+
+    When the manager carries a MemoryGovernor, every edge counts against the
+    process memory budget and stage processors receive it through bind_memory().
+    """
+    def __init__(self, manager: Optional['StreamManager'] = None, queue_size: int = 64) -> None:
+        """
+        :param manager: Resolves URI sources/sinks (optional when handles are passed).
+        :param queue_size: Bounded depth of every edge.
+        """
+        self._manager = manager
+        self._queue_size = queue_size
+        self._memory = manager.memory if manager is not None else None
+        self._nodes: Dict[str, GraphNode] = {}
+        self.dropped: Dict[str, int] = {}
+
+    # --- DECLARATION ---
+
+    def source(self, name: str, source: Union[str, StreamHandle], **settings) -> 'PipelineGraph':
+        return self._add(GraphNode(name, SOURCE, [], {"target": source, "settings": settings}))
+
+    def merge(self, name: str, inputs: Sequence[str], key: Optional[Callable[[Any], Any]] = None) -> 'PipelineGraph':
+        if len(inputs) < 2:
+            raise ValueError(f"Graph Configuration Error: merge '{name}' requires at least 2 inputs.")
+        return self._add(GraphNode(name, MERGE, list(inputs), {"key": key}))
+
+    def stage(self, name: str, input: str, processors: Sequence[MiddlewareProcessor]) -> 'PipelineGraph':
+        return self._add(GraphNode(name, STAGE, [input], {"processors": list(processors)}))
+
+    def join(self, name: str, probe: str, build: str, join: HashJoin) -> 'PipelineGraph':
+        """'probe' is streamed; 'build' is fully consumed into 'join' before probing starts."""
+        return self._add(GraphNode(name, JOIN, [probe, build], {"join": join}))
+
+    def zip(
+            self,
+            name: str,
+            inputs: Sequence[str],
+            combine: Optional[Callable[..., Any]] = None,
+            subject: PayloadType = PayloadSubject.RECORDS
+    ) -> 'PipelineGraph':
+        """
+        :param combine: Builds the output payload from one payload per input, in input
+            order (default: the list of payloads, which suits dict records).
+        :param subject: PayloadType of the combined Packets.
+        """
+        if len(inputs) < 2:
+            raise ValueError(f"Graph Configuration Error: zip '{name}' requires at least 2 inputs.")
+        return self._add(GraphNode(name, ZIP, list(inputs), {"combine": combine or _as_list, "subject": subject}))
+
+    def route(self, name: str, input: str, routes: Dict[PayloadType, str], default: Optional[str] = None) -> 'PipelineGraph':
+        """
+        :param routes: Subject -> port name.
+        :param default: Port for unlisted subjects (None drops them).
+        """
+        return self._add(GraphNode(name, ROUTE, [input], {"routes": dict(routes), "default": default}))
+
+    def sink(self, name: str, input: str, sink: Union[str, StreamHandle], **settings) -> 'PipelineGraph':
+        return self._add(GraphNode(name, SINK, [input], {"target": sink, "settings": settings}))
+
+    # --- VALIDATION ---
+
+    def validate(self) -> List[str]:
+        """
+        Checks that every input exists, the graph is acyclic and no join, zip or
+        keyed merge reads two of its inputs from a common upstream.
+        :return: Node names in topological order.
+        """
+        for node in self._nodes.values():
+            for input_name in node.inputs:
+                producer = self._producer_of(input_name)
+                if producer not in self._nodes:
+                    raise ValueError(f"Graph Configuration Error: node '{node.name}' reads unknown input '{input_name}'.")
+                if self._nodes[producer].kind == SINK:
+                    raise ValueError(f"Graph Configuration Error: node '{node.name}' cannot read from sink '{producer}'.")
+                if self._nodes[producer].kind == ROUTE and producer == input_name:
+                    raise ValueError(
+                        f"Graph Configuration Error: node '{node.name}' must read a port of route '{producer}' "
+                        f"('{producer}.<port>')."
+                    )
+
+        # Kahn's algorithm
+        indegree = {name: len(node.inputs) for name, node in self._nodes.items()}
+        consumers = self._consumers()
+        order = [name for name, degree in indegree.items() if degree == 0]
+        for name in order:
+            for consumer, _ in consumers[name]:
+                indegree[consumer] -= 1
+                if indegree[consumer] == 0:
+                    order.append(consumer)
+        if len(order) != len(self._nodes):
+            cyclic = sorted(name for name, degree in indegree.items() if degree > 0)
+            raise ValueError(f"Graph Configuration Error: cycle detected between {cyclic}.")
+
+        # A join reads its build side to the end before probing, a zip or keyed merge
+        # needs the next item of every input: an upstream feeding two of the inputs
+        # blocks on one full inbox while the node waits on the other
+        lineage: Dict[str, Set[str]] = {}
+        for name in order:
+            node = self._nodes[name]
+            sides = [lineage[self._producer_of(input_name)] for input_name in node.inputs]
+            lineage[name] = {name}.union(*sides)
+            if node.kind == JOIN:
+                shared = sides[0] & sides[1]
+                if shared:
+                    raise ValueError(
+                        f"Graph Configuration Error: join '{name}' reads probe and build from a common upstream "
+                        f"{sorted(shared)}, which deadlocks."
+                    )
+            elif node.kind == ZIP or (node.kind == MERGE and node.options["key"] is not None):
+                for index, side in enumerate(sides):
+                    for other in range(index + 1, len(sides)):
+                        shared = side & sides[other]
+                        if shared:
+                            raise ValueError(
+                                f"Graph Configuration Error: {node.kind} '{name}' reads '{node.inputs[index]}' and "
+                                f"'{node.inputs[other]}' from a common upstream {sorted(shared)}, which deadlocks."
+                            )
+        return order
+
+    # --- EXECUTION ---
+
+    def run(self) -> Dict[str, int]:
+        """
+        Executes the graph until every source is exhausted.
+        :return: Packets written per sink node.
+        """
+        self.validate()
+        stop = Event()
+        failures: List[BaseException] = []
+        written: Dict[str, int] = {name: 0 for name, node in self._nodes.items() if node.kind == SINK}
+        self.dropped = {name: 0 for name, node in self._nodes.items() if node.kind in (ROUTE, ZIP)}
+
+        # 1. EDGES: one Channel per (consumer, input slot); merge inputs share one Channel
+        inboxes: Dict[str, List[Channel]] = {}
+        outputs: Dict[str, List[Channel]] = {name: [] for name in self._nodes}
+        port_outputs: Dict[str, Dict[str, List[Channel]]] = {name: {} for name in self._nodes}
+        for node in self._nodes.values():
+            if node.kind == MERGE and node.options["key"] is None:
+                shared = Channel(node.name, self._queue_size, stop, governor=self._memory)
+                inboxes[node.name] = [shared] * len(node.inputs)
+            else:
+                inboxes[node.name] = [
+                    Channel(f"{node.name}[{index}]", self._queue_size, stop, governor=self._memory)
+                    for index in range(len(node.inputs))
+                ]
+            for index, input_name in enumerate(node.inputs):
+                producer = self._producer_of(input_name)
+                if producer != input_name:
+                    port = input_name[len(producer) + 1:]
+                    port_outputs[producer].setdefault(port, []).append(inboxes[node.name][index])
+                else:
+                    outputs[producer].append(inboxes[node.name][index])
+
+        # 2. THREADS: one per node
+        def run_node(node: GraphNode) -> None:
+            try:
+                self._execute(node, inboxes[node.name], outputs[node.name], port_outputs[node.name], written)
+            except Cancelled:
+                # Another node failed: stop without flushing
+                return
+            except BaseException as e:
+                if not isinstance(e, PipelineError):
+                    labelled = PipelineError(node.name)
+                    labelled.__cause__ = e
+                    e = labelled
+                failures.append(e)
+                stop.set()
+
+        threads = [
+            Thread(target=run_node, args=(node,), name=f"streamflow-graph-{node.name}", daemon=True)
+            for node in self._nodes.values()
+        ]
+        # Merge inputs share one Channel: count every edge once
+        edges = list({id(channel): channel for channels in inboxes.values() for channel in channels}.values())
+        buffered_bytes = lambda: sum(channel.buffered_bytes for channel in edges)
+        if self._memory is not None:
+            self._memory.watch(buffered_bytes)
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                thread.join()
+        finally:
+            stop.set()
+            for channels in inboxes.values():
+                for channel in channels:
+                    channel.drain()
+            for thread in threads:
+                thread.join()
+            if self._memory is not None:
+                self._memory.unwatch(buffered_bytes)
+
+        if failures:
+            raise failures[0]
+        return written
+
+    # --- NODE EXECUTION ---
+
+    def _execute(
+            self,
+            node: GraphNode,
+            inboxes: List[Channel],
+            outputs: List[Channel],
+            ports: Dict[str, List[Channel]],
+            written: Dict[str, int]
+    ) -> None:
+        with ExitStack() as stack:
+            if node.kind == SINK:
+                handle = stack.enter_context(self._handle(node, as_sink=True))
+                for packet in inboxes[0]:
+                    try:
+                        handle.write(packet)
+                    except Exception as e:
+                        raise PipelineError(node.name, packet, message=f"Error in '{node.name}' while writing Packet ID: {packet.identity.id}") from e
+                    written[node.name] += 1
+                return
+
+            if node.kind == ROUTE:
+                self._route(node, inboxes[0], ports)
+                all_ports = [channel for channels in ports.values() for channel in channels]
+                for channel in all_ports:
+                    channel.close()
+                return
+
+            for packet in self._packets(node, inboxes, stack):
+                for channel in outputs:
+                    if not channel.put(packet):
+                        return
+            for channel in outputs:
+                channel.close()
+
+    def _packets(self, node: GraphNode, inboxes: List[Channel], stack: ExitStack) -> Iterator[Packet]:
+        if node.kind == SOURCE:
+            handle = stack.enter_context(self._handle(node, as_sink=False))
+            return handle.read()
+
+        if node.kind == MERGE:
+            key = node.options["key"]
+            if key is None:
+                return self._interleave(inboxes[0], len(inboxes))
+            return heapq.merge(*(iter(channel) for channel in inboxes), key=lambda packet: key(packet.payload))
+
+        if node.kind == STAGE:
+            stream: Iterable[Packet] = inboxes[0]
+            for processor in fuse(node.options["processors"]):
+                if self._memory is not None:
+                    PipelineOrchestrator.unwrap(processor).bind_memory(self._memory)
+                stack.enter_context(processor)
+                stream = PipelineOrchestrator.drive(processor, stream)
+            return iter(stream)
+
+        if node.kind == JOIN:
+            join: HashJoin = node.options["join"]
+            join.load(inboxes[1])       # Build side: consumed once, fully, before probing
+            stack.enter_context(join)
+            return PipelineOrchestrator.drive(join, inboxes[0])
+
+        if node.kind == ZIP:
+            return self._zip(node, inboxes)
+
+        raise ValueError(f"Unsupported node kind: '{node.kind}'")
+
+    @staticmethod
+    def _interleave(channel: Channel, producers: int) -> Iterator[Packet]:
+        """Reads a shared Channel until every producer has closed it."""
+        open_producers = producers
+        while open_producers:
+            item = channel.get()
+            if item is END_OF_STREAM:
+                open_producers -= 1
+                continue
+            yield item
+
+    def _zip(self, node: GraphNode, inboxes: List[Channel]) -> Iterator[Packet]:
+        combine, subject = node.options["combine"], node.options["subject"]
+        while True:
+            packets: List[Packet] = []
+            for channel in inboxes:
+                item = channel.get()
+                if item is END_OF_STREAM:
+                    break
+                packets.append(item)
+            else:
+                yield packets[0].spawn(combine(*(packet.payload for packet in packets)), subject=subject)
+                continue
+
+            # Shortest input ended: drain the others so that their producers can finish
+            ended = len(packets)
+            unpaired = len(packets)
+            for index, channel in enumerate(inboxes):
+                if index != ended:
+                    unpaired += sum(1 for _ in channel)
+            self.dropped[node.name] += unpaired
+            return
+
+    def _route(self, node: GraphNode, inbox: Channel, ports: Dict[str, List[Channel]]) -> None:
+        routes, default = node.options["routes"], node.options["default"]
+        for packet in inbox:
+            port = routes.get(packet.subject, default)
+            targets = ports.get(port) if port is not None else None
+            if not targets:
+                self.dropped[node.name] += 1
+                continue
+            for channel in targets:
+                if not channel.put(packet):
+                    return
+
+    # --- Private Helpers ---
+
+    def _add(self, node: GraphNode) -> 'PipelineGraph':
+        if node.name in self._nodes:
+            raise ValueError(f"Graph Configuration Error: duplicate node name '{node.name}'.")
+        if "." in node.name:
+            raise ValueError(f"Graph Configuration Error: node names cannot contain '.': '{node.name}'.")
+        self._nodes[node.name] = node
+        return self
+
+    def _producer_of(self, input_name: str) -> str:
+        """'route.port' -> 'route'; plain names map to themselves."""
+        return input_name.split(".", 1)[0]
+
+    def _consumers(self) -> Dict[str, List[tuple]]:
+        consumers: Dict[str, List[tuple]] = {name: [] for name in self._nodes}
+        for node in self._nodes.values():
+            for index, input_name in enumerate(node.inputs):
+                consumers[self._producer_of(input_name)].append((node.name, index))
+        return consumers
+
+    def _handle(self, node: GraphNode, as_sink: bool) -> StreamHandle:
+        target = node.options["target"]
+        if isinstance(target, str):
+            if self._manager is None:
+                raise ValueError(f"Graph Configuration Error: node '{node.name}' uses a URI but the graph has no manager.")
+            return self._manager.get_handle(target, as_sink=as_sink, **node.options["settings"])
+        return target
+
+
+def _as_list(*payloads: Any) -> List[Any]:
+    """Default zip combiner: one payload per input, in input order."""
+    return list(payloads)
@@ -0,0 +1,110 @@
+# src/app/use_cases/pipeline/join.py
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional
+
+from src.app.domain.models.packet import Packet, PayloadSubject, PayloadType
+from src.app.ports.output.middleware_processor import MiddlewareProcessor
+
+# Extracts the join key from a payload
+JoinKey = Callable[[Any], Hashable]
+
+# Combines (probe_payload, build_payload or None) into the output payload
+JoinMerge = Callable[[Any, Optional[Any]], Any]
+
+
+def merge_dicts(probe: Any, build: Optional[Any]) -> Any:
+    """Default merge: build fields first, probe fields win on conflicts."""
+    if build is None:
+        return dict(probe)
+    return {**build, **probe}
+
+
+class HashJoin(MiddlewareProcessor):
+    """
+    Streaming Hash Join (probe stream x small build stream).
+
+    The build side (lookup table) is loaded into a hash table exactly once,
+    either from 'build' on the first open() or explicitly via load(); every
+    probe Packet is then joined in O(1) without buffering the large side.
+
+    - how='inner': probe rows without a match are dropped
+    - how='left':  they are emitted with build=None passed to 'merge'
+    - Duplicate build keys yield one output per match
+    """
+    def __init__(
+            self,
+            probe_key: JoinKey,
+            build_key: Optional[JoinKey] = None,
+            build: Optional[Callable[[], Iterable[Packet]]] = None,
+            how: str = "inner",
+            merge: JoinMerge = merge_dicts,
+            subject: PayloadType = PayloadSubject.DICT
+    ) -> None:
+        """
+        :param probe_key: Join key over probe (streamed) payloads.
+        :param build_key: Join key over build payloads (defaults to probe_key).
+        :param build: Callable returning the build-side Packets (optional, see load()).
+        :param how: 'inner' or 'left'.
+        :param merge: Combines (probe_payload, build_payload) into the output payload.
+        :param subject: PayloadType of probe input and joined output.
+        """
+        if how not in ("inner", "left"):
+            raise ValueError(f"Unsupported join: '{how}'. Use 'inner' or 'left'.")
+
+        self._probe_key = probe_key
+        self._build_key = build_key or probe_key
+        self._build = build
+        self._how = how
+        self._merge = merge
+        self._subject = subject
+        self._table: Optional[Dict[Hashable, List[Any]]] = None
+
+    # --- IDENTITY & HANDSHAKE ---
+
+    @property
+    def name(self) -> str:
+        return f"hash_join_{self._how}"
+
+    @property
+    def input_subject(self) -> PayloadType:
+        return self._subject
+
+    @property
+    def output_subject(self) -> PayloadType:
+        return self._subject
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._table is not None
+
+    # --- LIFECYCLE ---
+
+    def open(self) -> None:
+        if self._table is None and self._build is not None:
+            self.load(self._build())
+
+    def load(self, packets: Iterable[Packet]) -> int:
+        """Builds the hash table from the build-side Packets. Returns the number of rows."""
+        table: Dict[Hashable, List[Any]] = {}
+        rows = 0
+        build_key = self._build_key
+        for packet in packets:
+            table.setdefault(build_key(packet.payload), []).append(packet.payload)
+            rows += 1
+        self._table = table
+        return rows
+
+    # --- TRANSFORMATION ---
+
+    def process(self, packet: Packet) -> Iterator[Packet]:
+        if self._table is None:
+            raise RuntimeError(f"'{self.name}' has no build side: pass 'build' or call load() first.")
+
+        matches = self._table.get(self._probe_key(packet.payload))
+        if matches:
+            for match in matches:
+                yield packet.spawn(self._merge(packet.payload, match), subject=self._subject)
+        elif self._how == "left":
+            yield packet.spawn(self._merge(packet.payload, None), subject=self._subject)
+
+    def flush(self) -> Iterator[Packet]:
+        yield from []
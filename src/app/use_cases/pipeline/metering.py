@@ -0,0 +1,181 @@
+# src/app/use_cases/pipeline/metering.py
+import time
+from typing import Any, Iterable, Iterator, List, Optional
+
+from src.app.domain.models.packet import Packet, PayloadType
+from src.app.domain.models.telemetry import StageMetrics
+from src.app.domain.models.telemetry.stage_metrics import SIZED_PAYLOADS
+from src.app.ports.output.middleware_processor import MiddlewareProcessor
+from src.app.use_cases.pipeline.errors import PipelineError
+
+
+def drive_metered(
+        processor: MiddlewareProcessor,
+        packets: Iterable[Packet],
+        metrics: StageMetrics,
+        upstream: Optional[StageMetrics] = None
+) -> Iterator[Packet]:
+    """
+    PipelineOrchestrator.drive() with telemetry, inlined so that the hot loop
+    gains no generator layer.
+
+    Only the input side is counted: what enters a stage is exactly what the
+    previous one emitted, so the same block is published as 'upstream' output
+    (the last stage's output is counted by meter_tail()). Every
+    'sample_every'-th process() call is materialized and timed.
+    """
+    name = processor.name
+    flushed = False
+    every = metrics.sample_every
+    countdown = every
+    clock = time.perf_counter_ns
+    record = metrics.latency.record
+    sized = SIZED_PAYLOADS
+    count = size = 0
+
+    try:
+        for packet in packets:
+            count += 1
+            payload = packet.payload
+            if type(payload) in sized:
+                size += len(payload)
+            try:
+                countdown -= 1
+                if countdown:
+                    yield from processor.process(packet)
+                else:
+                    # Sample: time this call, publish the block counted so far
+                    countdown = every
+                    started = clock()
+                    outputs = list(processor.process(packet))
+                    record(clock() - started)
+                    _publish(metrics, upstream, count, size)
+                    count = size = 0
+                    yield from outputs
+                flushed = False
+
+                if packet.is_flush_signal():
+                    yield from processor.flush()
+                    flushed = True
+            except PipelineError:
+                metrics.errors += 1
+                raise
+            except Exception as e:
+                metrics.errors += 1
+                raise PipelineError(name, packet) from e
+
+        if not flushed:
+            try:
+                yield from processor.flush()
+            except PipelineError:
+                metrics.errors += 1
+                raise
+            except Exception as e:
+                metrics.errors += 1
+                raise PipelineError(name, message=f"Error in '{name}' while flushing") from e
+    finally:
+        _publish(metrics, upstream, count, size)
+
+
+def meter_tail(packets: Iterable[Packet], metrics: StageMetrics) -> Iterator[Packet]:
+    """Counts the output of the last stage (published every 'sample_every' Packets)."""
+    every = metrics.sample_every
+    count = size = 0
+    try:
+        for packet in packets:
+            count += 1
+            payload = packet.payload
+            if type(payload) in SIZED_PAYLOADS:
+                size += len(payload)
+            if count == every:
+                metrics.add(packets_out=count, bytes_out=size)
+                count = size = 0
+            yield packet
+    finally:
+        metrics.add(packets_out=count, bytes_out=size)
+
+
+def _publish(metrics: StageMetrics, upstream: Optional[StageMetrics], count: int, size: int) -> None:
+    metrics.add(packets_in=count, bytes_in=size)
+    if upstream is not None:
+        upstream.add(packets_out=count, bytes_out=size)
+
+
+class MeteredProcessor(MiddlewareProcessor):
+    """
+    Batched-mode telemetry: wraps a stage for PipelineOrchestrator.drive_batches().
+    Every process_batch() call is timed (the cost is spread over the batch) and
+    recorded as len(batch) observations of the per-Packet average.
+    """
+    def __init__(self, processor: MiddlewareProcessor, metrics: StageMetrics) -> None:
+        self._processor = processor
+        self._metrics = metrics
+
+    # --- IDENTITY & HANDSHAKE ---
+
+    @property
+    def name(self) -> str:
+        return self._processor.name
+
+    @property
+    def input_subject(self) -> PayloadType:
+        return self._processor.input_subject
+
+    @property
+    def output_subject(self) -> PayloadType:
+        return self._processor.output_subject
+
+    @property
+    def processor(self) -> MiddlewareProcessor:
+        return self._processor
+
+    # --- LIFECYCLE ---
+
+    def open(self) -> None:
+        self._processor.open()
+
+    def close(self) -> None:
+        self._processor.close()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        # Forwarded rather than close(): the wrapped stage may discard uncommitted state on failure
+        self._processor.__exit__(exc_type, exc_val, exc_tb)
+
+    def snapshot(self) -> Any:
+        return self._processor.snapshot()
+
+    def restore(self, state: Any) -> None:
+        self._processor.restore(state)
+
+    # --- TRANSFORMATION ---
+
+    def process(self, packet: Packet) -> Iterator[Packet]:
+        return self.process_batch([packet])
+
+    def process_batch(self, packets: List[Packet]) -> Iterator[Packet]:
+        metrics = self._metrics
+        started = time.perf_counter_ns()
+        try:
+            output = list(self._processor.process_batch(packets))
+        except Exception:
+            metrics.errors += 1
+            raise
+        if packets:
+            metrics.latency.record((time.perf_counter_ns() - started) // len(packets), len(packets))
+        metrics.add(len(packets), len(output), self._size(packets), self._size(output))
+        return iter(output)
+
+    def flush(self) -> Iterator[Packet]:
+        try:
+            output = list(self._processor.flush())
+        except Exception:
+            self._metrics.errors += 1
+            raise
+        self._metrics.add(packets_out=len(output), bytes_out=self._size(output))
+        return iter(output)
+
+    # --- Private Helpers ---
+
+    @staticmethod
+    def _size(packets: List[Packet]) -> int:
+        return sum(len(packet.payload) for packet in packets if type(packet.payload) in SIZED_PAYLOADS)
@@ -0,0 +1,568 @@
+# src/app/use_cases/pipeline/orchestrator.py
+import time
+from contextlib import ExitStack
+from itertools import islice
+from threading import Event, Thread
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from src.app.domain.models.packet import FlowSignal, Packet
+from src.app.domain.models.streams import StreamHandle
+from src.app.domain.models.telemetry import Span, StageMetrics, otel_trace_id
+from src.app.ports.output.middleware_processor import MiddlewareProcessor
+from src.app.use_cases.pipeline.channels import Cancelled, Channel
+from src.app.use_cases.pipeline.checkpoint import CheckpointStats, Checkpointer, CheckpointStore
+from src.app.use_cases.pipeline.dead_letter import DEAD_LETTER, DeadLetterQueue, ErrorPolicy, GuardedProcessor
+from src.app.use_cases.pipeline.errors import PipelineError
+from src.app.use_cases.pipeline.fusion import fuse as fuse_stages
+from src.app.use_cases.pipeline.metering import MeteredProcessor, drive_metered, meter_tail
+from src.app.use_cases.memory import MemoryGovernor
+from src.app.use_cases.profiling import ProfiledProcessor, Profiler
+from src.app.use_cases.telemetry import Telemetry
+from src.app.use_cases.tracing import TracedProcessor, Tracer
+
+
+class PipelineOrchestrator:
+    """
+    The Conductor.
+
+    SRP: Drives Packets from a source StreamHandle through a chain of
+    MiddlewareProcessors into an (optional) sink StreamHandle.
+
+    Responsibilities:
+    - Topological Validation: output_subject of stage N == input_subject of stage N+1
+    - Lifecycle: open()/close() for every processor and both handles
+    - Flow Control: flush() on STREAM_END and once the source is exhausted
+    - Error Propagation: failures are re-raised as labelled PipelineErrors
+
+    Execution Modes:
+    - Sequential (default): one thread, lazily chained iterators (O(1) memory)
+    - Threaded: every stage on its own thread, connected by bounded Channels so that
+      I/O-bound stages overlap while memory stays capped at 'queue_size' per stage
+
+    Consecutive stateless Map/Filter stages are fused into one stage (fuse=True).
+    With 'batch_size', Packets travel between stages in lists and every stage is
+    driven through process_batch() (vectorized processors) instead of process().
+
+    With a 'checkpoint' store, run() periodically persists the source offset,
+    every stage's snapshot() and the committed sink position, and a later run()
+    resumes from the last checkpoint instead of from the start.
+
+    Stage failures follow each stage's ErrorPolicy (see GuardedProcessor); sink
+    writes follow 'sink_policy'. Dead-lettered Packets go to 'dead_letters',
+    which is opened before and closed after the stages.
+
+    With an enabled 'telemetry' registry, every stage records into a series
+    keyed by (source trace_id, stage name) and threaded runs expose their
+    queue depths; the source and sink handles meter themselves.
+
+    With a 'profiler', every stage is wrapped in a ProfiledProcessor (after
+    fusion) and the report is written when the run ends.
+
+    With a 'tracer', every run records a 'pipeline' span in the source's trace,
+    parent of the source handle's spans and of one span per stage (TracedProcessor).
+
+    With a 'memory' governor, every stage receives it through bind_memory()
+    before open(), and threaded runs account their Channels against the budget
+    (producers are throttled while the process is over it).
+    """
+    SOURCE_STAGE = "source"
+    SINK_STAGE = "sink"
+
+    def __init__(
+            self,
+            source: StreamHandle,
+            processors: Sequence[MiddlewareProcessor] = (),
+            sink: Optional[StreamHandle] = None,
+            threaded: bool = False,
+            queue_size: int = 64,
+            fuse: bool = True,
+            batch_size: Optional[int] = None,
+            checkpoint: Optional[CheckpointStore] = None,
+            checkpoint_interval: int = 10_000,
+            checkpoint_seconds: float = 0.0,
+            dead_letters: Optional[DeadLetterQueue] = None,
+            sink_policy: Optional[ErrorPolicy] = None,
+            telemetry: Optional[Telemetry] = None,
+            profiler: Optional[Profiler] = None,
+            tracer: Optional[Tracer] = None,
+            memory: Optional[MemoryGovernor] = None
+    ) -> None:
+        """
+        :param source: Readable handle providing the Packets.
+        :param processors: Ordered middleware chain.
+        :param sink: Writable handle receiving the final payloads (optional for stream()).
+        :param threaded: Run every stage on its own thread.
+        :param queue_size: Bounded depth of each inter-stage Channel (threaded mode).
+        :param fuse: Collapse consecutive Map/Filter stages into a single loop.
+        :param batch_size: Move Packets in batches of this size and call process_batch().
+        :param checkpoint: Store for periodic checkpoints of run() (sequential engine only).
+        :param checkpoint_interval: Source Packets between two checkpoints.
+        :param checkpoint_seconds: Minimum wall-clock time between two checkpoints.
+        :param dead_letters: Queue receiving dead-lettered Packets (its lifecycle follows the run).
+        :param sink_policy: ErrorPolicy for sink writes (default: fail).
+        :param telemetry: Metrics registry for the stages (None: uninstrumented).
+        :param profiler: Opt-in Profiler timing every stage (None: no wrapping, no cost).
+        :param tracer: Span recorder for the run and its stages (None: no wrapping, no cost).
+        :param memory: Process-wide memory budget for stage buffers and Channels (None: unbounded).
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got: {batch_size}")
+        self._source = source
+        self._processors: List[MiddlewareProcessor] = list(processors)
+        self._sink = sink
+        self._threaded = threaded
+        self._queue_size = queue_size
+        self._batch_size = batch_size
+        self._channels: List[Channel] = []
+        self._checkpoint = checkpoint
+        self._checkpoint_interval = checkpoint_interval
+        self._checkpoint_seconds = checkpoint_seconds
+        self.checkpoint_stats: Optional[CheckpointStats] = None
+        self._dead_letters = dead_letters
+        self._sink_policy = sink_policy or ErrorPolicy()
+        self.sink_failures = 0
+        self._telemetry = telemetry
+        self.profiler = profiler
+        self._tracer = tracer
+        self._memory = memory
+
+        self.validate()
+        # Execution plan (validated against the declared chain above)
+        self._stages: List[MiddlewareProcessor] = fuse_stages(self._processors) if fuse else list(self._processors)
+        if profiler is not None:
+            self._stages = [profiler.wrap_processor(stage) for stage in self._stages]
+        if tracer is not None:
+            self._stages = [tracer.wrap_processor(stage) for stage in self._stages]
+
+    # --- PROPERTIES ---
+
+    @property
+    def processors(self) -> List[MiddlewareProcessor]:
+        return list(self._processors)
+
+    @property
+    def stages(self) -> List[MiddlewareProcessor]:
+        """The execution plan: processors after fusion."""
+        return list(self._stages)
+
+    # --- VALIDATION ---
+
+    def validate(self) -> None:
+        """
+        The Handshake: ensures each stage yields what the next stage expects.
+        Raises ValueError on the first mismatch.
+        """
+        for index in range(1, len(self._processors)):
+            upstream = self._processors[index - 1]
+            downstream = self._processors[index]
+            if upstream.output_subject != downstream.input_subject:
+                raise ValueError(
+                    f"Pipeline Configuration Error at index {index}: "
+                    f"Processor '{downstream.name}' expects {downstream.input_subject}, "
+                    f"but '{upstream.name}' is providing {upstream.output_subject}."
+                )
+
+        if self._sink is not None and not self._sink.capacity.is_writable:
+            raise ValueError(f"Pipeline Configuration Error: sink is read-only: {self._sink.uri}")
+
+        if self._sink_policy.action == DEAD_LETTER and self._dead_letters is None:
+            raise ValueError("Pipeline Configuration Error: the sink dead-letters its failures but no DeadLetterQueue was given.")
+
+        if self._checkpoint is not None:
+            if self._threaded:
+                raise ValueError("Pipeline Configuration Error: checkpointing requires the sequential engine (threaded=False).")
+            if not self._source.capacity.can_seek:
+                raise ValueError(f"Pipeline Configuration Error: checkpointing requires a seekable source: {self._source.uri}")
+            for processor in self._processors:
+                if not self.unwrap(processor).checkpointable:
+                    raise ValueError(f"Pipeline Configuration Error: stage '{processor.name}' cannot be checkpointed.")
+
+    # --- EXECUTION ---
+
+    def run(self) -> int:
+        """
+        Executes the pipeline and writes every resulting Packet to the sink.
+        :return: Number of packets delivered to the sink (or drained when no sink is set).
+        """
+        # 1. RECOVERY: position source and sink at the last checkpoint (if any)
+        checkpointer = None
+        if self._checkpoint is not None:
+            checkpointer = Checkpointer(self._checkpoint, self._stages, self._checkpoint_interval, self._checkpoint_seconds)
+            self.checkpoint_stats = checkpointer.stats
+            checkpointer.resume(self._source, self._sink)
+
+        delivered = checkpointer.packets_written if checkpointer is not None else 0
+        self.sink_failures = 0
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            sink = stack.enter_context(self._sink) if self._sink is not None else None
+            for packet in self._stream(checkpointer, sink):
+                if sink is not None and not self._write(sink, packet):
+                    self.sink_failures += 1
+                    continue
+                delivered += 1
+                if checkpointer is not None:
+                    checkpointer.packets_written = delivered
+
+        # 2. DONE: the next run starts from scratch
+        if checkpointer is not None:
+            checkpointer.complete()
+        if self._telemetry is not None:
+            self._telemetry.logger.info(
+                "Pipeline %s -> %s delivered %d packets in %.3fs (trace_id=%s, sink failures=%d)",
+                self._source.uri, self._sink.uri if self._sink is not None else "-",
+                delivered, time.perf_counter() - started, self._source.context.trace_id, self.sink_failures
+            )
+        return delivered
+
+    def stream(self) -> Iterator[Packet]:
+        """
+        Executes the pipeline and yields the resulting Packets (the sink is ignored).
+        Resources are released when the iterator is exhausted or closed.
+        """
+        return self._stream()
+
+    def _stream(self, checkpointer: Optional[Checkpointer] = None, sink: Optional[StreamHandle] = None) -> Iterator[Packet]:
+        with ExitStack() as stack:
+            # 0. PROFILING: the session ends (and the report is written) last
+            if self.profiler is not None:
+                self.profiler.start()
+                stack.callback(self.profiler.finish)
+
+            # 0b. TRACING: the run span ends last, with the run's outcome
+            if self._tracer is not None:
+                span = self._trace_run()
+                stack.push(lambda exc_type, exc, tb: self._tracer.end(span, exc))
+
+            # 1. LIFECYCLE: open processors; close() runs in reverse order on exit
+            # - The dead-letter queue outlives every stage (flush() may still fail)
+            if self._dead_letters is not None:
+                stack.enter_context(self._dead_letters)
+            for processor in self._stages:
+                if self._memory is not None:
+                    self.unwrap(processor).bind_memory(self._memory)
+                stack.enter_context(processor)
+
+            # 2. SOURCE: open the handle
+            source = stack.enter_context(self._source)
+
+            # 3. TELEMETRY: one series per stage (None when disabled)
+            metrics = self._stage_metrics()
+            if metrics is not None:
+                stack.callback(self._publish_failures, metrics)
+
+            # 4. EXECUTE
+            if self._threaded:
+                yield from self._run_threaded(source, metrics)
+            elif checkpointer is not None:
+                checkpointer.restore()
+                guard = lambda items, weight: checkpointer.guard(items, weight, source, sink)
+                yield from self._chain(source.read(), guard, metrics)
+            else:
+                yield from self._chain(source.read(), metrics=metrics)
+
+    def queue_depths(self) -> Dict[str, int]:
+        """
+        Current depth of every inter-stage Channel, keyed by the consuming stage.
+        Empty in sequential mode or when the pipeline is not running.
+        """
+        return {channel.name: channel.depth for channel in self._channels}
+
+    def buffered_bytes(self) -> int:
+        """Estimated bytes queued in the inter-stage Channels (0 when not running)."""
+        return sum(channel.buffered_bytes for channel in self._channels)
+
+    def _write(self, sink: StreamHandle, packet: Packet) -> bool:
+        """Writes one Packet under the sink policy. Returns False when it was skipped or dead-lettered."""
+        if self._sink_policy.is_default:
+            try:
+                sink.write(packet)
+            except Exception as e:
+                raise PipelineError(self.SINK_STAGE, packet) from e
+            return True
+        succeeded, _ = self._sink_policy.run(self.SINK_STAGE, packet, lambda: sink.write(packet), self._dead_letters)
+        return succeeded
+
+    # --- TELEMETRY ---
+
+    def _stage_metrics(self) -> Optional[List[StageMetrics]]:
+        """One series per stage, keyed by the source trace_id (repeated names get a '#n' suffix)."""
+        if self._telemetry is None or not self._telemetry.enabled:
+            return None
+        trace_id = self._source.context.trace_id
+        seen: Dict[str, int] = {}
+        metrics = []
+        for processor in self._stages:
+            seen[processor.name] = seen.get(processor.name, 0) + 1
+            label = processor.name if seen[processor.name] == 1 else f"{processor.name}#{seen[processor.name]}"
+            metrics.append(self._telemetry.series(trace_id, label))
+        return metrics
+
+    def _publish_failures(self, metrics: List[StageMetrics]) -> None:
+        # Skipped and dead-lettered Packets never reach the driver as exceptions
+        for processor, stage_metrics in zip(self._stages, metrics):
+            while isinstance(processor, (TracedProcessor, ProfiledProcessor)):
+                processor = processor.processor
+            if isinstance(processor, GuardedProcessor):
+                stage_metrics.errors += processor.failures
+
+    def _drivers(self, metrics: Optional[List[StageMetrics]]) -> List[Callable[[Iterable], Iterator]]:
+        """One driver per stage: drive() / drive_batches(), metered when telemetry is on."""
+        batching = self._batch_size is not None
+        if metrics is None:
+            drive = self.drive_batches if batching else self.drive
+            return [lambda items, processor=processor: drive(processor, items) for processor in self._stages]
+        if batching:
+            return [
+                lambda items, metered=MeteredProcessor(processor, stage_metrics): self.drive_batches(metered, items)
+                for processor, stage_metrics in zip(self._stages, metrics)
+            ]
+        # Each driver also publishes its input as the previous stage's output
+        upstreams = [None] + metrics[:-1]
+        return [
+            lambda items, processor=processor, stage_metrics=stage_metrics, upstream=upstream:
+                drive_metered(processor, items, stage_metrics, upstream)
+            for processor, stage_metrics, upstream in zip(self._stages, metrics, upstreams)
+        ]
+
+    def _tail(self, packets: Iterable[Packet], metrics: Optional[List[StageMetrics]]) -> Iterable[Packet]:
+        """Counts the last stage's output (per-Packet mode; batched stages count their own)."""
+        if not metrics or self._batch_size is not None:
+            return packets
+        return meter_tail(packets, metrics[-1])
+
+    # --- TRACING ---
+
+    def _trace_run(self) -> Span:
+        """Starts the run span and places the source handle and every stage below it."""
+        context = self._source.context
+        trace_id = otel_trace_id(context.trace_id)
+        attributes = {
+            "streamflow.trace_id": context.trace_id,
+            "streamflow.source": self._source.uri,
+            "streamflow.stages": len(self._stages),
+            "streamflow.threaded": self._threaded,
+        }
+        if self._sink is not None:
+            # The sink handle records into its own trace
+            attributes["streamflow.sink"] = self._sink.uri
+            attributes["streamflow.sink.trace_id"] = self._sink.context.trace_id
+        if self._batch_size is not None:
+            attributes["streamflow.batch_size"] = self._batch_size
+
+        span = self._tracer.start("pipeline", trace_id, attributes=attributes)
+        if self._source.trace is not None:
+            self._source.trace.parent_id = span.span_id
+        for stage in self._stages:
+            stage.bind(trace_id, span.span_id)
+        return span
+
+    # --- SEQUENTIAL ENGINE ---
+
+    def _chain(
+            self,
+            packets: Iterable[Packet],
+            guard: Optional[Callable] = None,
+            metrics: Optional[List[StageMetrics]] = None
+    ) -> Iterator[Packet]:
+        """
+        Wraps the source iterator in one driver per stage.
+        :param guard: Checkpoint barrier wrapped around the source (packets or batches).
+        :param metrics: Per-stage telemetry series (None: uninstrumented).
+        """
+        drivers = self._drivers(metrics)
+        if self._batch_size is not None:
+            batches: Iterable[List[Packet]] = self.batched(packets, self._batch_size)
+            if guard is not None:
+                batches = guard(batches, len)
+            for drive in drivers:
+                batches = drive(batches)
+            return self.unbatched(batches)
+
+        stream: Iterable[Packet] = packets if guard is None else guard(packets, lambda packet: 1)
+        for drive in drivers:
+            stream = drive(stream)
+        return iter(self._tail(stream, metrics))
+
+    @staticmethod
+    def unwrap(processor: MiddlewareProcessor) -> MiddlewareProcessor:
+        """The user processor behind the tracing, profiling and error-policy wrappers."""
+        while isinstance(processor, (TracedProcessor, ProfiledProcessor, GuardedProcessor)):
+            processor = processor.processor
+        return processor
+
+    @staticmethod
+    def drive(processor: MiddlewareProcessor, packets: Iterable[Packet]) -> Iterator[Packet]:
+        """
+        Runs a single processor over a packet iterator.
+        - process() is called for every packet
+        - flush() is called after a STREAM_END packet and once more when the input
+          is exhausted (unless nothing arrived since the last flush)
+        """
+        name = processor.name
+        flushed = False
+
+        for packet in packets:
+            try:
+                yield from processor.process(packet)
+                flushed = False
+
+                if packet.is_flush_signal():
+                    yield from processor.flush()
+                    flushed = True
+            except PipelineError:
+                raise
+            except Exception as e:
+                raise PipelineError(name, packet) from e
+
+        if not flushed:
+            try:
+                yield from processor.flush()
+            except PipelineError:
+                raise
+            except Exception as e:
+                raise PipelineError(name, message=f"Error in '{name}' while flushing") from e
+
+    @staticmethod
+    def drive_batches(processor: MiddlewareProcessor, batches: Iterable[List[Packet]]) -> Iterator[List[Packet]]:
+        """
+        Batched counterpart of drive(): one process_batch() call per run of Packets.
+        Batches are split after every STREAM_END so flush() keeps its position in
+        the stream. Yields one output list per input batch (empty ones are skipped).
+        """
+        name = processor.name
+        flushed = False
+
+        for batch in batches:
+            if not batch:
+                continue
+            output: List[Packet] = []
+            start = 0
+            try:
+                for index, packet in enumerate(batch):
+                    if packet.signal is FlowSignal.STREAM_END:
+                        output.extend(processor.process_batch(batch[start:index + 1]))
+                        output.extend(processor.flush())
+                        start = index + 1
+                flushed = start == len(batch)
+                if not flushed:
+                    output.extend(processor.process_batch(batch if start == 0 else batch[start:]))
+            except PipelineError:
+                raise
+            except Exception as e:
+                raise PipelineError(
+                    name, batch[start],
+                    message=f"Error in '{name}' while processing a batch of {len(batch) - start} "
+                            f"starting at Packet ID: {batch[start].identity.id}"
+                ) from e
+            if output:
+                yield output
+
+        if not flushed:
+            try:
+                output = list(processor.flush())
+            except PipelineError:
+                raise
+            except Exception as e:
+                raise PipelineError(name, message=f"Error in '{name}' while flushing") from e
+            if output:
+                yield output
+
+    @staticmethod
+    def batched(packets: Iterable[Packet], size: int) -> Iterator[List[Packet]]:
+        """Groups a Packet iterator into lists of at most 'size' Packets."""
+        iterator = iter(packets)
+        while True:
+            batch = list(islice(iterator, size))
+            if not batch:
+                return
+            yield batch
+
+    @staticmethod
+    def unbatched(batches: Iterable[List[Packet]]) -> Iterator[Packet]:
+        for batch in batches:
+            yield from batch
+
+    # --- THREADED ENGINE ---
+
+    def _run_threaded(self, source: StreamHandle, metrics: Optional[List[StageMetrics]] = None) -> Iterator[Packet]:
+        """
+        Source -> [Channel] -> Stage 1 -> [Channel] -> ... -> Stage N -> [Channel] -> caller
+        """
+        stop = Event()
+        failures: List[BaseException] = []
+
+        names = [processor.name for processor in self._stages] + [self.SINK_STAGE]
+        self._channels = [Channel(name, self._queue_size, stop, governor=self._memory) for name in names]
+
+        def pump(label: str, packets: Iterable[Packet], out: Channel) -> None:
+            try:
+                for packet in packets:
+                    if not out.put(packet):
+                        return
+                out.close()
+            except Cancelled:
+                # Stopped upstream: no flush() ran, nothing more to report
+                return
+            except BaseException as e:
+                if not isinstance(e, PipelineError):
+                    e = self._label(label, e)
+                failures.append(e)
+                stop.set()
+
+        # In batched mode Channels carry lists, so 'queue_size' counts batches
+        batching = self._batch_size is not None
+        drivers = self._drivers(metrics)
+        packets = self.batched(source.read(), self._batch_size) if batching else source.read()
+
+        threads = [
+            Thread(
+                target=pump,
+                args=(self.SOURCE_STAGE, packets, self._channels[0]),
+                name="streamflow-source",
+                daemon=True
+            )
+        ]
+        for index, processor in enumerate(self._stages):
+            threads.append(
+                Thread(
+                    target=pump,
+                    args=(processor.name, drivers[index](self._channels[index]), self._channels[index + 1]),
+                    name=f"streamflow-stage-{index}",
+                    daemon=True
+                )
+            )
+
+        if metrics is not None:
+            self._telemetry.watch(self._source.context.trace_id, self.queue_depths)
+        if self._memory is not None:
+            self._memory.watch(self.buffered_bytes)
+        for thread in threads:
+            thread.start()
+
+        try:
+            try:
+                yield from self.unbatched(self._channels[-1]) if batching else self._tail(self._channels[-1], metrics)
+            except Cancelled:
+                # A stage failed: its error (below) replaces the cancellation
+                pass
+            if failures:
+                raise failures[0]
+        finally:
+            # Early exit or failure: stop every stage and unblock pending puts
+            stop.set()
+            for channel in self._channels:
+                channel.drain()
+            for thread in threads:
+                thread.join()
+            self._channels = []
+            if metrics is not None:
+                self._telemetry.unwatch(self._source.context.trace_id, self.queue_depths)
+            if self._memory is not None:
+                self._memory.unwatch(self.buffered_bytes)
+
+    @staticmethod
+    def _label(stage: str, error: BaseException) -> PipelineError:
+        labelled = PipelineError(stage)
+        labelled.__cause__ = error
+        return labelled
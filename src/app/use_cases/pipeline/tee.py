@@ -0,0 +1,240 @@
+# src/app/use_cases/pipeline/tee.py
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from threading import Event, Thread
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from src.app.domain.models.packet import Packet
+from src.app.domain.models.streams import StreamHandle
+from src.app.ports.output.middleware_processor import MiddlewareProcessor
+from src.app.use_cases.pipeline.channels import Cancelled, Channel, SpillingChannel
+from src.app.use_cases.pipeline.errors import PipelineError
+from src.app.use_cases.pipeline.fusion import fuse
+from src.app.use_cases.pipeline.orchestrator import PipelineOrchestrator
+
+if TYPE_CHECKING:
+    from src.app.use_cases.memory import MemoryGovernor
+
+# Slow-branch policies
+BLOCK = "block"
+DROP = "drop"
+SPILL = "spill"
+
+
+@dataclass
+class TeeBranch:
+    """
+    One destination of a Tee: an optional processor chain ending in an optional sink.
+
+    policy decides what happens when the branch falls 'buffer_size' packets behind:
+    - 'block': the source waits (every branch sees every packet, slowest sets the pace)
+    - 'drop':  packets are skipped for this branch only (counted in 'dropped')
+    - 'spill': packets overflow to a temp file under 'spill_dir' and are replayed in order
+    """
+    name: str
+    sink: Optional[StreamHandle] = None
+    processors: Sequence[MiddlewareProcessor] = field(default_factory=tuple)
+    policy: str = BLOCK
+    buffer_size: int = 64
+    spill_dir: Optional[str] = None
+
+
+class Tee:
+    """
+    Single-read Fan-out.
+
+    Reads the source once and broadcasts every Packet to N branches. Each branch
+    runs on its own thread behind its own bounded Channel, so a slow archive sink
+    does not stall a fast one (subject to its policy).
+
+    The source is either a readable StreamHandle or a PipelineOrchestrator (whose
+    output is broadcast, e.g. decode once, then write to several sinks).
+
+    With a 'memory' governor, branch buffers count against the process budget:
+    'block' branches throttle the source and 'spill' branches spill early while
+    the process is under pressure.
+    """
+    SOURCE_STAGE = "tee"
+
+    def __init__(
+            self,
+            source: Union[StreamHandle, PipelineOrchestrator],
+            branches: Sequence[TeeBranch],
+            poll_interval: float = 0.1,
+            memory: Optional['MemoryGovernor'] = None
+    ) -> None:
+        self._source = source
+        self._branches: List[TeeBranch] = list(branches)
+        self._poll_interval = poll_interval
+        self._memory = memory
+        self._channels: Dict[str, Channel] = {}
+        self.dropped: Dict[str, int] = {}
+        self.spilled: Dict[str, int] = {}
+
+        self.validate()
+
+    # --- VALIDATION ---
+
+    def validate(self) -> None:
+        if not self._branches:
+            raise ValueError("Tee Configuration Error: at least one branch is required.")
+
+        names = [branch.name for branch in self._branches]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Tee Configuration Error: branch names must be unique, got: {names}")
+
+        for branch in self._branches:
+            if branch.policy not in (BLOCK, DROP, SPILL):
+                raise ValueError(
+                    f"Tee Configuration Error: unsupported policy '{branch.policy}' on branch '{branch.name}'. "
+                    f"Use '{BLOCK}', '{DROP}' or '{SPILL}'."
+                )
+            # Reuses the orchestrator handshake rules for the branch chain + sink
+            processors = list(branch.processors)
+            for index in range(1, len(processors)):
+                upstream, downstream = processors[index - 1], processors[index]
+                if upstream.output_subject != downstream.input_subject:
+                    raise ValueError(
+                        f"Tee Configuration Error on branch '{branch.name}' at index {index}: "
+                        f"Processor '{downstream.name}' expects {downstream.input_subject}, "
+                        f"but '{upstream.name}' is providing {upstream.output_subject}."
+                    )
+            if branch.sink is not None and not branch.sink.capacity.is_writable:
+                raise ValueError(f"Tee Configuration Error: sink of branch '{branch.name}' is read-only: {branch.sink.uri}")
+
+    # --- EXECUTION ---
+
+    def run(self) -> Dict[str, int]:
+        """
+        Broadcasts the source to every branch and waits for all of them.
+        :return: Packets delivered per branch (after its processors).
+        """
+        stop = Event()
+        failures: List[BaseException] = []
+        delivered: Dict[str, int] = {branch.name: 0 for branch in self._branches}
+        self.dropped = {branch.name: 0 for branch in self._branches}
+
+        self._channels = {branch.name: self._make_channel(branch, stop) for branch in self._branches}
+        if self._memory is not None:
+            self._memory.watch(self.buffered_bytes)
+
+        def consume(branch: TeeBranch, channel: Channel) -> None:
+            try:
+                delivered[branch.name] = self._run_branch(branch, channel, stop, self._memory)
+            except Cancelled:
+                # The source or another branch failed: stop without flushing
+                return
+            except BaseException as e:
+                if not isinstance(e, PipelineError):
+                    labelled = PipelineError(branch.name)
+                    labelled.__cause__ = e
+                    e = labelled
+                failures.append(e)
+                stop.set()
+
+        threads = [
+            Thread(target=consume, args=(branch, self._channels[branch.name]), name=f"streamflow-tee-{branch.name}", daemon=True)
+            for branch in self._branches
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            # 1. SINGLE READ: broadcast each packet according to the branch policy
+            try:
+                for packet in self._read():
+                    if stop.is_set():
+                        break
+                    self._broadcast(packet)
+            except PipelineError as e:
+                failures.append(e)
+            except Exception as e:
+                failures.append(self._label(self.SOURCE_STAGE, e))
+
+            # 2. END: let every branch drain its buffer and flush
+            if failures:
+                stop.set()
+            for channel in self._channels.values():
+                channel.close()
+            for thread in threads:
+                thread.join()
+        finally:
+            stop.set()
+            for channel in self._channels.values():
+                channel.drain()
+            for thread in threads:
+                thread.join()
+            self.spilled = {
+                name: channel.spilled for name, channel in self._channels.items() if isinstance(channel, SpillingChannel)
+            }
+            self._channels = {}
+            if self._memory is not None:
+                self._memory.unwatch(self.buffered_bytes)
+
+        if failures:
+            raise failures[0]
+        return delivered
+
+    def queue_depths(self) -> Dict[str, int]:
+        """Current buffer depth of every branch (empty when not running)."""
+        return {name: channel.depth for name, channel in self._channels.items()}
+
+    def buffered_bytes(self) -> int:
+        """Estimated bytes held in memory by the branch buffers (0 when not running)."""
+        return sum(channel.buffered_bytes for channel in list(self._channels.values()))
+
+    # --- Private Helpers ---
+
+    def _read(self) -> Iterator[Packet]:
+        if isinstance(self._source, PipelineOrchestrator):
+            yield from self._source.stream()
+        else:
+            with self._source as handle:
+                yield from handle.read()
+
+    def _make_channel(self, branch: TeeBranch, stop: Event) -> Channel:
+        if branch.policy == SPILL:
+            return SpillingChannel(branch.name, branch.buffer_size, stop, branch.spill_dir, self._poll_interval, self._memory)
+        return Channel(branch.name, branch.buffer_size, stop, self._poll_interval, self._memory)
+
+    def _broadcast(self, packet: Packet) -> None:
+        for branch in self._branches:
+            channel = self._channels[branch.name]
+            if branch.policy == DROP:
+                if not channel.offer(packet):
+                    self.dropped[branch.name] += 1
+            else:
+                channel.put(packet)
+
+    @staticmethod
+    def _run_branch(branch: TeeBranch, channel: Channel, stop: Event, memory: Optional['MemoryGovernor'] = None) -> int:
+        delivered = 0
+        with ExitStack() as stack:
+            stages = fuse(branch.processors)
+            for processor in stages:
+                if memory is not None:
+                    PipelineOrchestrator.unwrap(processor).bind_memory(memory)
+                stack.enter_context(processor)
+            sink = stack.enter_context(branch.sink) if branch.sink is not None else None
+
+            stream: Iterable[Packet] = channel
+            for processor in stages:
+                stream = PipelineOrchestrator.drive(processor, stream)
+
+            for packet in stream:
+                if stop.is_set():
+                    # The source or another branch failed (possibly while this one was flushing)
+                    raise Cancelled(branch.name)
+                if sink is not None:
+                    try:
+                        sink.write(packet)
+                    except Exception as e:
+                        raise PipelineError(branch.name, packet, message=f"Error in '{branch.name}' while writing Packet ID: {packet.identity.id}") from e
+                delivered += 1
+        return delivered
+
+    @staticmethod
+    def _label(stage: str, error: BaseException) -> PipelineError:
+        labelled = PipelineError(stage)
+        labelled.__cause__ = error
+        return labelled
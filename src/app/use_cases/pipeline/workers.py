@@ -0,0 +1,215 @@
+# src/app/use_cases/pipeline/workers.py
+import queue
+import traceback
+from threading import Thread
+from typing import Any, Callable, List, Optional, Tuple
+
+from src.app.domain.models.packet import Packet
+from src.app.ports.output.middleware_processor import MiddlewareProcessor
+
+# Builds one private processor instance inside each worker
+ProcessorFactory = Callable[[], MiddlewareProcessor]
+
+# --- WIRE PROTOCOL ---
+# Parent -> Worker: (command, seq, packets)
+# Worker -> Parent: (status, worker_index, seq, payload)
+BATCH = "batch"
+FLUSH = "flush"
+STOP = "stop"
+RESULT = "result"
+FAILED = "failed"
+
+
+class WorkerError(RuntimeError):
+    """
+    A failure inside a pool worker.
+    Carries the formatted remote traceback, since exceptions raised in another
+    process are not guaranteed to be picklable.
+    """
+    def __init__(self, worker_index: int, remote_traceback: str) -> None:
+        self.worker_index = worker_index
+        self.remote_traceback = remote_traceback
+        super().__init__(f"Worker {worker_index} failed:\n{remote_traceback}")
+
+
+def worker_loop(factory: ProcessorFactory, inbox: Any, outbox: Any, worker_index: int) -> None:
+    """
+    Worker body (thread or process).
+    Owns a private processor instance for its whole lifetime: open() once,
+    process batches / flush on command, close() on STOP.
+    """
+    try:
+        processor = factory()
+        processor.open()
+    except BaseException:
+        outbox.put((FAILED, worker_index, -1, traceback.format_exc()))
+        return
+
+    try:
+        while True:
+            command, seq, packets = inbox.get()
+            if command == STOP:
+                break
+            try:
+                if command == BATCH:
+                    results: List[Packet] = list(processor.process_batch(packets))
+                else:
+                    results = list(processor.flush())
+                outbox.put((RESULT, worker_index, seq, results))
+            except Exception:
+                outbox.put((FAILED, worker_index, seq, traceback.format_exc()))
+    finally:
+        processor.close()
+
+
+class WorkerPool:
+    """
+    A fixed set of addressable workers, each with its own processor instance.
+
+    - Every worker has a private inbox, so batches (or partitions) can be routed
+      to a specific worker and FLUSH reaches every instance exactly once
+    - Results from all workers share one outbox, tagged with a sequence number
+    - executor='process' side-steps the GIL for CPU-bound processors;
+      executor='thread' suits I/O-bound or C-extension-heavy ones
+    """
+    def __init__(
+            self,
+            factory: ProcessorFactory,
+            workers: int,
+            executor: str = "process",
+            inbox_size: int = 4,
+            start_method: Optional[str] = None,
+            poll_interval: float = 0.5
+    ) -> None:
+        """
+        :param factory: Picklable callable (e.g. the processor class) building one instance per worker.
+        :param workers: Number of workers.
+        :param executor: 'process' or 'thread'.
+        :param inbox_size: Bounded depth of each worker inbox (in batches).
+        :param start_method: multiprocessing start method ('fork', 'spawn', 'forkserver').
+        """
+        if workers < 1:
+            raise ValueError(f"WorkerPool requires at least 1 worker, got: {workers}")
+        if executor not in ("process", "thread"):
+            raise ValueError(f"Unsupported executor: '{executor}'. Use 'process' or 'thread'.")
+
+        self._factory = factory
+        self._workers = workers
+        self._executor = executor
+        self._inbox_size = inbox_size
+        self._start_method = start_method
+        self._poll_interval = poll_interval
+
+        self._inboxes: List[Any] = []
+        self._outbox: Any = None
+        self._handles: List[Any] = []
+
+    # --- PROPERTIES ---
+
+    @property
+    def size(self) -> int:
+        return self._workers
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._handles)
+
+    # --- LIFECYCLE ---
+
+    def start(self) -> None:
+        """Spawns the workers (idempotent)."""
+        if self._handles:
+            return
+
+        if self._executor == "process":
+            import multiprocessing
+            context = multiprocessing.get_context(self._start_method)
+            make_queue = context.Queue
+            make_worker = context.Process
+        else:
+            make_queue = queue.Queue
+            make_worker = Thread
+
+        # The outbox is unbounded: the parent bounds in-flight work instead, so a
+        # worker can never block on a result while the parent blocks on an inbox.
+        self._outbox = make_queue()
+        self._inboxes = [make_queue(self._inbox_size) for _ in range(self._workers)]
+        self._handles = [
+            make_worker(
+                target=worker_loop,
+                args=(self._factory, self._inboxes[index], self._outbox, index),
+                name=f"streamflow-worker-{index}",
+                daemon=True
+            )
+            for index in range(self._workers)
+        ]
+        for handle in self._handles:
+            handle.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Asks every worker to close its processor and waits for it to exit."""
+        if not self._handles:
+            return
+
+        for inbox in self._inboxes:
+            try:
+                inbox.put((STOP, -1, None), timeout=timeout)
+            except queue.Full:
+                pass
+
+        for handle in self._handles:
+            handle.join(timeout)
+            if self._executor == "process" and handle.is_alive():
+                handle.terminate()
+
+        self._handles = []
+        self._inboxes = []
+        self._outbox = None
+
+    # --- MESSAGING ---
+
+    def submit(self, worker_index: int, seq: int, packets: List[Packet]) -> None:
+        """Routes a batch to a specific worker."""
+        self._put(worker_index, (BATCH, seq, packets))
+
+    def request_flush(self, worker_index: int, seq: int) -> None:
+        """Asks a specific worker to drain its processor's buffers."""
+        self._put(worker_index, (FLUSH, seq, None))
+
+    def receive(self, block: bool = True) -> Optional[Tuple[int, int, List[Packet]]]:
+        """
+        Returns the next (worker_index, seq, packets) result.
+        - block=False returns None when nothing is ready
+        - Raises WorkerError when a worker failed or died
+        """
+        while True:
+            try:
+                status, worker_index, seq, payload = self._outbox.get(
+                    block=block, timeout=self._poll_interval if block else None
+                )
+            except queue.Empty:
+                if not block:
+                    return None
+                self._check_alive()
+                continue
+
+            if status == FAILED:
+                raise WorkerError(worker_index, payload)
+            return worker_index, seq, payload
+
+    # --- Private Helpers ---
+
+    def _put(self, worker_index: int, message: tuple) -> None:
+        """Blocking put that notices dead workers instead of hanging."""
+        inbox = self._inboxes[worker_index]
+        while True:
+            try:
+                inbox.put(message, timeout=self._poll_interval)
+                return
+            except queue.Full:
+                self._check_alive()
+
+    def _check_alive(self) -> None:
+        for index, handle in enumerate(self._handles):
+            if not handle.is_alive():
+                raise WorkerError(index, f"Worker exited unexpectedly (exitcode={getattr(handle, 'exitcode', None)})")
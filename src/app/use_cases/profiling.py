@@ -0,0 +1,472 @@
+# src/app/use_cases/profiling.py
+import inspect
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock, RLock
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, Union
+
+from src.app.domain.models.packet import Packet, PayloadType
+from src.app.domain.models.streams import StreamCapacity, StreamContext
+from src.app.ports.output.middleware_processor import MiddlewareProcessor
+
+# Component kinds
+ADAPTER = "adapter"
+STAGE = "stage"
+
+# Root frame of the collapsed stacks
+ROOT_FRAME = "streamflow"
+
+T = TypeVar("T")
+
+
+@dataclass
+class OperationProfile:
+    """Cost of one operation ('read', 'write', 'process', 'flush') of one component."""
+    name: str
+    kind: str
+    operation: str
+    calls: int = 0
+    items: int = 0                  # Packets produced (read/process/flush) or consumed (write)
+    wall_ns: int = 0
+    cpu_ns: int = 0                 # Thread CPU time (excludes I/O waits and other threads)
+    alloc_peak: int = 0             # Largest traced-memory rise within one call (tracemalloc)
+    alloc_net: int = 0              # Traced memory retained across all calls (tracemalloc)
+    profile: Any = None             # cProfile.Profile (cprofile=True), created on the first call
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "operation": self.operation,
+            "calls": self.calls,
+            "items": self.items,
+            "wall_ms": round(self.wall_ns / 1e6, 3),
+            "cpu_ms": round(self.cpu_ns / 1e6, 3),
+            "wall_us_per_call": round(self.wall_ns / self.calls / 1e3, 3) if self.calls else 0.0,
+            "alloc_peak_bytes": self.alloc_peak,
+            "alloc_net_bytes": self.alloc_net,
+        }
+
+
+@dataclass
+class ProfileReport:
+    """What a Profiler collected, in the order the operations were first seen."""
+    operations: List[OperationProfile] = field(default_factory=list)
+    allocations: Dict[str, List[str]] = field(default_factory=dict)   # Component -> top tracemalloc sites
+
+
+class Profiler:
+    """
+    Opt-in profiling of adapters (read/write) and processors (process/flush).
+
+    Components are wrapped only when a Profiler is given (see ProfiledStream and
+    ProfiledProcessor), so profiling that is off costs nothing. Per operation:
+    - Wall time and thread CPU time (time.thread_time_ns)
+    - Optional cProfile.Profile (cprofile=True)
+    - Optional tracemalloc peak/net allocations and, when the session ends,
+      the top allocation sites inside each component's module (tracemalloc=True)
+
+    Every handle or pipeline using the Profiler opens a session; when the last
+    one ends, the report is written to 'report_path' (collapsed stacks, one
+    'frame;frame;... value' line each, for flamegraph.pl / speedscope) and a JSON
+    summary next to it. Values are microseconds: wall time without cProfile,
+    self time per function with it.
+
+    tracemalloc is process-wide: allocation figures of concurrent stages
+    (threaded mode) include each other's allocations. So is the active cProfile
+    (one at a time from Python 3.12): with cprofile=True, the profiled calls of
+    concurrent stages, tee branches and graph nodes run one at a time.
+    """
+    def __init__(
+            self,
+            report_path: Optional[Union[str, os.PathLike]] = None,
+            cprofile: bool = False,
+            tracemalloc: bool = False,
+            top_allocations: int = 10
+    ) -> None:
+        """
+        :param report_path: Collapsed-stack file written when the last session ends (summary: same name, '.json').
+        :param cprofile: Record a cProfile.Profile per operation.
+        :param tracemalloc: Trace allocations (starts tracemalloc for the session if needed).
+        :param top_allocations: Allocation sites kept per component.
+        """
+        self._report_path = Path(report_path) if report_path is not None else None
+        self._cprofile = cprofile
+        self._tracemalloc = tracemalloc
+        self._top_allocations = top_allocations
+
+        self._operations: Dict[Tuple[str, str], OperationProfile] = {}
+        self._modules: Dict[str, str] = {}
+        self._allocations: Dict[str, List[str]] = {}
+        self._sessions = 0
+        self._started_tracing = False
+        self._lock = Lock()
+
+    # --- PROPERTIES ---
+
+    @property
+    def report_path(self) -> Optional[Path]:
+        return self._report_path
+
+    # --- WRAPPING ---
+
+    def wrap_stream(self, adapter: Any, name: str) -> 'ProfiledStream':
+        self._register(name, adapter)
+        return ProfiledStream(adapter, self, name)
+
+    def wrap_processor(self, processor: MiddlewareProcessor) -> 'ProfiledProcessor':
+        self._register(processor.name, processor)
+        return ProfiledProcessor(processor, self)
+
+    def operation(self, name: str, kind: str, operation: str) -> OperationProfile:
+        key = (name, operation)
+        with self._lock:
+            profile = self._operations.get(key)
+            if profile is None:
+                profile = OperationProfile(name, kind, operation)
+                self._operations[key] = profile
+            return profile
+
+    # --- SESSIONS ---
+
+    def start(self) -> None:
+        """Opens a session (one per profiled handle or pipeline run)."""
+        with self._lock:
+            self._sessions += 1
+            if self._sessions == 1 and self._tracemalloc:
+                import tracemalloc
+                if not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    self._started_tracing = True
+
+    def finish(self) -> Optional[Path]:
+        """Closes a session; the last one snapshots allocations and writes the report."""
+        with self._lock:
+            self._sessions = max(0, self._sessions - 1)
+            if self._sessions:
+                return None
+        if self._tracemalloc:
+            self._snapshot_allocations()
+        if self._report_path is None:
+            return None
+        return self.write(self._report_path)
+
+    # --- MEASUREMENT ---
+
+    def call(self, profile: OperationProfile, operation: Callable[[], T]) -> T:
+        """Runs 'operation' and charges its cost to 'profile'."""
+        if not self._cprofile:
+            return self._measure(profile, operation)
+        with _PROFILE_SLOT.lock:
+            owner = _PROFILE_SLOT.claim(profile)
+            try:
+                return self._measure(profile, operation)
+            finally:
+                if owner:
+                    _PROFILE_SLOT.release(profile)
+
+    # --- REPORTING ---
+
+    def report(self) -> ProfileReport:
+        with self._lock:
+            operations = list(self._operations.values())
+        return ProfileReport(operations=operations, allocations=dict(self._allocations))
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """One row per (component, operation), most expensive (wall time) first."""
+        rows = [operation.as_dict() for operation in self.report().operations]
+        return sorted(rows, key=lambda row: row["wall_ms"], reverse=True)
+
+    def collapsed(self) -> List[str]:
+        """Collapsed stacks: 'streamflow;<kind>:<name>;<operation>[;function...] <microseconds>'."""
+        lines: List[str] = []
+        for operation in self.report().operations:
+            prefix = f"{ROOT_FRAME};{operation.kind}:{_frame(operation.name)};{operation.operation}"
+            if operation.profile is None:
+                lines.append(f"{prefix} {operation.wall_ns // 1000}")
+                continue
+            for stack, microseconds in _profile_stacks(operation.profile):
+                if microseconds:
+                    lines.append(f"{prefix};{stack} {microseconds}")
+        return lines
+
+    def write(self, path: Union[str, os.PathLike]) -> Path:
+        """Writes the collapsed stacks to 'path' and the summary to 'path' with a '.json' suffix."""
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("\n".join(self.collapsed()) + "\n", encoding="utf-8")
+        summary = {"operations": self.summary(), "allocations": self.report().allocations}
+        target.with_suffix(".json").write_text(json.dumps(summary, indent=2), encoding="utf-8")
+        return target
+
+    # --- Private Helpers ---
+
+    def _measure(self, profile: OperationProfile, operation: Callable[[], T]) -> T:
+        tracer = None
+        if self._tracemalloc:
+            import tracemalloc as tracer
+            if tracer.is_tracing():
+                before = tracer.get_traced_memory()[0]
+                tracer.reset_peak()
+            else:
+                tracer = None
+        cpu = time.thread_time_ns()
+        wall = time.perf_counter_ns()
+        try:
+            return operation()
+        finally:
+            profile.wall_ns += time.perf_counter_ns() - wall
+            profile.cpu_ns += time.thread_time_ns() - cpu
+            profile.calls += 1
+            if tracer is not None:
+                current, peak = tracer.get_traced_memory()
+                profile.alloc_peak = max(profile.alloc_peak, peak - before)
+                profile.alloc_net += current - before
+
+    def _register(self, name: str, component: Any) -> None:
+        # Module of the component: tracemalloc sites are attributed by file
+        try:
+            self._modules[name] = inspect.getsourcefile(type(component)) or ""
+        except TypeError:
+            self._modules[name] = ""
+
+    def _snapshot_allocations(self) -> None:
+        import tracemalloc
+        if not tracemalloc.is_tracing():
+            return
+        snapshot = tracemalloc.take_snapshot()
+        for name, module in self._modules.items():
+            if not module:
+                continue
+            statistics = snapshot.filter_traces([tracemalloc.Filter(True, module)]).statistics("lineno")
+            self._allocations[name] = [str(statistic) for statistic in statistics[:self._top_allocations]]
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+
+class _ProfileSlot:
+    """
+    The one cProfile.Profile enabled at a time. Python 3.12+ refuses a second
+    active profiler ("Another profiling tool is already active"), so profiled
+    calls hold 'lock' (serialized across threads); a call nested in another one
+    (same thread) is charged to the outer Profile.
+    """
+    def __init__(self) -> None:
+        self.lock = RLock()
+        self._active = False
+
+    def claim(self, profile: OperationProfile) -> bool:
+        """Enables the Profile of 'profile' unless one is already active (call with 'lock' held)."""
+        if self._active:
+            return False
+        if profile.profile is None:
+            import cProfile
+            profile.profile = cProfile.Profile()
+        profile.profile.enable()
+        self._active = True
+        return True
+
+    def release(self, profile: OperationProfile) -> None:
+        self._active = False
+        profile.profile.disable()
+
+
+_PROFILE_SLOT = _ProfileSlot()
+
+
+class ProfiledStream:
+    """
+    DataStream proxy charging read() (per yielded Packet) and write() to a Profiler.
+    Opening starts a Profiler session, closing ends it.
+    """
+    def __init__(self, adapter: Any, profiler: Profiler, name: str) -> None:
+        self._adapter = adapter
+        self._profiler = profiler
+        self._name = name
+
+    # --- PROPERTIES ---
+
+    @property
+    def adapter(self) -> Any:
+        return self._adapter
+
+    @property
+    def profiler(self) -> Profiler:
+        return self._profiler
+
+    @property
+    def uri(self) -> Any:
+        return self._adapter.uri
+
+    @property
+    def capacity(self) -> StreamCapacity:
+        return self._adapter.capacity
+
+    @property
+    def chunk_size(self) -> int:
+        return self._adapter.chunk_size
+
+    @property
+    def is_open(self) -> bool:
+        return self._adapter.is_open
+
+    # --- LIFECYCLE ---
+
+    def open(self) -> None:
+        self._profiler.start()
+        self._profiler.call(self._profiler.operation(self._name, ADAPTER, "open"), self._adapter.open)
+
+    def close(self) -> None:
+        try:
+            self._profiler.call(self._profiler.operation(self._name, ADAPTER, "close"), self._adapter.close)
+        finally:
+            self._profiler.finish()
+
+    # --- ACTION METHODS ---
+
+    def read(self) -> Iterator[Packet]:
+        profile = self._profiler.operation(self._name, ADAPTER, "read")
+        iterator = iter(self._adapter.read())
+        end = object()
+        while True:
+            packet = self._profiler.call(profile, lambda: next(iterator, end))
+            if packet is end:
+                return
+            profile.items += 1
+            yield packet
+
+    def write(self, packet: Packet) -> None:
+        profile = self._profiler.operation(self._name, ADAPTER, "write")
+        self._profiler.call(profile, lambda: self._adapter.write(packet))
+        profile.items += 1
+
+    def tell(self) -> Optional[Any]:
+        return self._adapter.tell()
+
+    def seek(self, position: Any) -> bool:
+        return self._adapter.seek(position)
+
+    def reset(self) -> bool:
+        return self._adapter.reset()
+
+    def bind_context(self, context: StreamContext) -> None:
+        self._adapter.bind_context(context)
+
+
+class ProfiledProcessor(MiddlewareProcessor):
+    """
+    Charges process()/process_batch() and flush() of a processor to a Profiler
+    (same name and subjects). Outputs are materialized per call so that the
+    time spent downstream is never charged to this stage.
+    """
+    def __init__(self, processor: MiddlewareProcessor, profiler: Profiler) -> None:
+        self._processor = processor
+        self._profiler = profiler
+        self._process = profiler.operation(processor.name, STAGE, "process")
+        self._flush = profiler.operation(processor.name, STAGE, "flush")
+
+    # --- IDENTITY & HANDSHAKE ---
+
+    @property
+    def name(self) -> str:
+        return self._processor.name
+
+    @property
+    def input_subject(self) -> PayloadType:
+        return self._processor.input_subject
+
+    @property
+    def output_subject(self) -> PayloadType:
+        return self._processor.output_subject
+
+    @property
+    def processor(self) -> MiddlewareProcessor:
+        return self._processor
+
+    # --- LIFECYCLE ---
+
+    def open(self) -> None:
+        self._processor.open()
+
+    def close(self) -> None:
+        self._processor.close()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        # Forwarded rather than close(): the wrapped stage may discard uncommitted state on failure
+        self._processor.__exit__(exc_type, exc_val, exc_tb)
+
+    def snapshot(self) -> Any:
+        return self._processor.snapshot()
+
+    def restore(self, state: Any) -> None:
+        self._processor.restore(state)
+
+    # --- TRANSFORMATION ---
+
+    def process(self, packet: Packet) -> Iterator[Packet]:
+        output = self._profiler.call(self._process, lambda: list(self._processor.process(packet)))
+        self._process.items += len(output)
+        return iter(output)
+
+    def process_batch(self, packets: List[Packet]) -> Iterator[Packet]:
+        output = self._profiler.call(self._process, lambda: list(self._processor.process_batch(packets)))
+        self._process.items += len(output)
+        return iter(output)
+
+    def flush(self) -> Iterator[Packet]:
+        output = self._profiler.call(self._flush, lambda: list(self._processor.flush()))
+        self._flush.items += len(output)
+        return iter(output)
+
+
+# --- Collapsed Stacks ---
+
+def _frame(label: str) -> str:
+    # ';' separates frames and the last ' ' separates the value
+    return str(label).replace(";", ":").replace(" ", "_")
+
+
+def _function_label(function: Tuple[str, int, str]) -> str:
+    filename, line, name = function
+    if filename == "~":
+        return _frame(name)
+    return _frame(f"{name}@{os.path.basename(filename)}:{line}")
+
+
+def _profile_stacks(profile: Any) -> Iterator[Tuple[str, int]]:
+    """
+    Rebuilds stacks from a cProfile.Profile: every function hangs below its
+    most expensive caller (cProfile only keeps caller -> callee edges), and
+    weighs its own time (tottime) in microseconds.
+    """
+    import pstats
+    stats = pstats.Stats(profile).stats
+    if not stats:
+        return
+
+    paths: Dict[Tuple[str, int, str], List[str]] = {}
+
+    def path(function: Tuple[str, int, str], visiting: Tuple) -> List[str]:
+        if function in paths:
+            return paths[function]
+        callers = {caller: edge for caller, edge in stats[function][4].items() if caller in stats and caller not in visiting}
+        if not callers or len(visiting) > 64:
+            result = [] if _is_own(function) else [_function_label(function)]
+        else:
+            heaviest = max(callers, key=lambda caller: callers[caller][3])
+            result = path(heaviest, visiting + (function,)) + ([] if _is_own(function) else [_function_label(function)])
+        paths[function] = result
+        return result
+
+    for function, (_, _, own_time, _, _) in stats.items():
+        if not _is_own(function):
+            yield ";".join(path(function, ())), round(own_time * 1e6)
+
+
+def _is_own(function: Tuple[str, int, str]) -> bool:
+    # Profiler.call's lambdas and Profile.disable() are not part of the profiled code
+    return function[0] == __file__ or "_lsprof.Profiler" in function[2]
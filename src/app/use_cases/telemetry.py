@@ -0,0 +1,214 @@
+# src/app/use_cases/telemetry.py
+import os
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from src.app.domain.models.app_config import LogLevel
+from src.app.domain.models.telemetry import StageMetrics
+from src.app.domain.models.telemetry.stage_metrics import STAGE
+
+LOGGER_NAME = "streamflow"
+
+# Prometheus 'le' buckets (seconds), aggregated from the fine HDR buckets at export
+EXPORT_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# (Metric, Help, StageMetrics attribute)
+_COUNTERS = (
+    ("streamflow_packets_in_total", "Packets received by a component.", "packets_in"),
+    ("streamflow_packets_out_total", "Packets emitted by a component.", "packets_out"),
+    ("streamflow_bytes_in_total", "Payload bytes (or characters) received by a component.", "bytes_in"),
+    ("streamflow_bytes_out_total", "Payload bytes (or characters) emitted by a component.", "bytes_out"),
+    ("streamflow_errors_total", "Failed operations of a component.", "errors"),
+)
+
+QueueProvider = Callable[[], Dict[str, int]]
+
+
+class Telemetry:
+    """
+    Process-wide metrics registry (wired by the Bootstrap from the AppConfig).
+
+    - Series: one StageMetrics per (trace_id, component); the oldest series are
+      evicted beyond 'max_series', so long-lived clients stay bounded
+    - Queues: running engines register a provider of their Channel depths,
+      sampled only when a snapshot is taken (no hot-path cost)
+    - Export: snapshot() dicts or Prometheus text format (export())
+    - Logging: owns the 'streamflow' logger, configured from 'log_level'
+
+    With enabled=False, series() returns None and components run uninstrumented.
+    """
+    def __init__(
+            self,
+            enabled: bool = True,
+            sample_every: int = 16,
+            max_series: int = 1024,
+            log_level: LogLevel = LogLevel.INFO
+    ) -> None:
+        """
+        :param enabled: Record metrics at all (AppConfig.enable_telemetry).
+        :param sample_every: Time one operation out of this many per component.
+        :param max_series: Maximum number of (trace_id, component) series kept.
+        :param log_level: Level of the 'streamflow' logger (AppConfig.log_level).
+        """
+        if sample_every < 1:
+            raise ValueError(f"telemetry sample_every must be >= 1, got: {sample_every}")
+        self._enabled = enabled
+        self._sample_every = sample_every
+        self._max_series = max_series
+        self._log_level = LogLevel(log_level)
+        self._series: 'OrderedDict[Tuple[str, str], StageMetrics]' = OrderedDict()
+        self._queues: Dict[str, List[QueueProvider]] = {}
+        self._lock = Lock()
+        self._logger = None
+
+    # --- PROPERTIES ---
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @property
+    def sample_every(self) -> int:
+        return self._sample_every
+
+    @property
+    def logger(self) -> Any:
+        """
+        The 'streamflow' logger. INFO prints to stderr unless the application
+        configured logging itself; NONE silences it.
+        Deferred: 'logging' stays off the startup path.
+        """
+        if self._logger is None:
+            import logging
+            logger = logging.getLogger(LOGGER_NAME)
+            if self._log_level is LogLevel.NONE:
+                logger.disabled = True
+            else:
+                logger.disabled = False
+                logger.setLevel(logging.INFO)
+                if not logger.handlers and not logging.getLogger().handlers:
+                    handler = logging.StreamHandler()
+                    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s"))
+                    logger.addHandler(handler)
+                    logger.propagate = False
+            self._logger = logger
+        return self._logger
+
+    # --- REGISTRATION ---
+
+    def series(self, trace_id: str, name: str, kind: str = STAGE) -> Optional[StageMetrics]:
+        """
+        Returns the StageMetrics of a component, creating it on first use.
+        None when telemetry is disabled.
+        """
+        if not self._enabled:
+            return None
+        key = (trace_id, name)
+        with self._lock:
+            metrics = self._series.get(key)
+            if metrics is None:
+                metrics = StageMetrics(trace_id, name, kind, self._sample_every)
+                self._series[key] = metrics
+                while len(self._series) > self._max_series:
+                    self._series.popitem(last=False)
+            return metrics
+
+    def watch(self, trace_id: str, provider: QueueProvider) -> None:
+        """Registers a callable returning {queue name: depth} for a running engine."""
+        if self._enabled:
+            with self._lock:
+                self._queues.setdefault(trace_id, []).append(provider)
+
+    def unwatch(self, trace_id: str, provider: QueueProvider) -> None:
+        with self._lock:
+            providers = self._queues.get(trace_id, [])
+            if provider in providers:
+                providers.remove(provider)
+            if not providers:
+                self._queues.pop(trace_id, None)
+
+    def reset(self) -> None:
+        """Forgets every series (running components keep recording into detached ones)."""
+        with self._lock:
+            self._series.clear()
+
+    # --- EXPORT ---
+
+    def snapshot(self, trace_id: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Current metrics keyed by trace_id:
+        {trace_id: {"components": {name: {...counters, latency}}, "queues": {name: depth}}}
+        """
+        with self._lock:
+            series = [metrics for key, metrics in self._series.items() if trace_id in (None, key[0])]
+            queues = {key: list(providers) for key, providers in self._queues.items() if trace_id in (None, key)}
+
+        result: Dict[str, Dict[str, Any]] = {}
+        for metrics in series:
+            trace = result.setdefault(metrics.trace_id, {"components": {}, "queues": {}})
+            trace["components"][metrics.name] = metrics.as_dict()
+        for key, providers in queues.items():
+            trace = result.setdefault(key, {"components": {}, "queues": {}})
+            for provider in providers:
+                trace["queues"].update(provider())
+        return result
+
+    def render(self) -> str:
+        """All series in the Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            series = list(self._series.values())
+            queues = [(key, list(providers)) for key, providers in self._queues.items()]
+
+        lines: List[str] = []
+        for metric, description, attribute in _COUNTERS:
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} counter")
+            for metrics in series:
+                lines.append(f"{metric}{{{self._labels(metrics)}}} {getattr(metrics, attribute)}")
+
+        metric = "streamflow_latency_seconds"
+        bounds = [round(bound * 1e9) for bound in EXPORT_BUCKETS]
+        lines.append(f"# HELP {metric} Sampled per-operation latency of a component.")
+        lines.append(f"# TYPE {metric} histogram")
+        for metrics in series:
+            labels = self._labels(metrics)
+            histogram = metrics.latency
+            for bound, count in zip(EXPORT_BUCKETS, histogram.cumulative(bounds)):
+                lines.append(f'{metric}_bucket{{{labels},le="{bound:g}"}} {count}')
+            lines.append(f'{metric}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"{metric}_sum{{{labels}}} {histogram.total / 1e9:.9f}")
+            lines.append(f"{metric}_count{{{labels}}} {histogram.count}")
+
+        metric = "streamflow_queue_depth"
+        lines.append(f"# HELP {metric} Items waiting in an inter-stage queue.")
+        lines.append(f"# TYPE {metric} gauge")
+        for trace_id, providers in queues:
+            for provider in providers:
+                for name, depth in provider().items():
+                    lines.append(f'{metric}{{trace_id="{_escape(trace_id)}",queue="{_escape(name)}"}} {depth}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: Union[str, os.PathLike]) -> Path:
+        """
+        Writes render() to a local file (e.g. for the node_exporter textfile collector).
+        Atomic: scrapers never read a half-written file.
+        """
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temporary = target.with_name(target.name + ".tmp")
+        with open(temporary, "w", encoding="utf-8") as handle:
+            handle.write(self.render())
+        os.replace(temporary, target)
+        return target
+
+    # --- Private Helpers ---
+
+    @staticmethod
+    def _labels(metrics: StageMetrics) -> str:
+        return f'trace_id="{_escape(metrics.trace_id)}",kind="{metrics.kind}",name="{_escape(metrics.name)}"'
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
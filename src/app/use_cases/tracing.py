@@ -0,0 +1,406 @@
+# src/app/use_cases/tracing.py
+import atexit
+import os
+from collections import deque
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from src.app.domain.models.packet import Packet, PayloadType
+from src.app.domain.models.streams import StreamContext
+from src.app.domain.models.telemetry.span import CLIENT, INTERNAL, Span, otel_trace_id, otlp_attributes
+from src.app.domain.models.telemetry.stage_metrics import SIZED_PAYLOADS
+from src.app.ports.output.middleware_processor import MiddlewareProcessor
+
+SCOPE = "streamflow"
+
+
+class Tracer:
+    """
+    Process-wide span recorder (wired by the Bootstrap when AppConfig.trace_path is set).
+
+    - Spans: handles record open/read/first_byte/close (HandleTrace), pipelines
+      a root span per run and one span per stage (TracedProcessor); per-Packet
+      spans (write, process) are sampled one in 'sample_every'
+    - Buffer: finished spans wait in memory; beyond 'buffer_size' new spans are
+      dropped (and counted) instead of blocking the hot path
+    - Export: a writer thread appends one OTLP/JSON 'ExportTraceServiceRequest'
+      per batch of up to 'batch_size' spans to 'path' (the layout of the
+      OpenTelemetry Collector file exporter), at least every 'flush_seconds'
+
+    Spans are keyed by StreamContext.trace_id (see otel_trace_id()); the original
+    id is kept in the 'streamflow.trace_id' attribute.
+    """
+    def __init__(
+            self,
+            path: Union[str, os.PathLike],
+            sample_every: int = 64,
+            batch_size: int = 512,
+            buffer_size: int = 65_536,
+            flush_seconds: float = 1.0,
+            service_name: str = "streamflow"
+    ) -> None:
+        """
+        :param path: JSONL file receiving the span batches (appended to).
+        :param sample_every: Record one per-Packet span out of this many per component.
+        :param batch_size: Maximum spans per exported line.
+        :param buffer_size: Maximum finished spans waiting for export.
+        :param flush_seconds: Maximum delay between a span ending and its export.
+        :param service_name: OpenTelemetry 'service.name' resource attribute.
+        """
+        if sample_every < 1:
+            raise ValueError(f"trace sample_every must be >= 1, got: {sample_every}")
+        if batch_size < 1:
+            raise ValueError(f"trace batch_size must be >= 1, got: {batch_size}")
+        self._path = Path(path)
+        self._sample_every = sample_every
+        self._batch_size = batch_size
+        self._buffer_size = buffer_size
+        self._flush_seconds = flush_seconds
+        self._resource = {"attributes": otlp_attributes({"service.name": service_name, "process.pid": os.getpid()})}
+
+        self._buffer: deque = deque()
+        self._wake = Event()
+        self._stop = Event()
+        self._lock = Lock()
+        self._writer: Optional[Thread] = None
+        self._registered = False
+        self.exported = 0
+        self.dropped = 0
+
+    # --- PROPERTIES ---
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def sample_every(self) -> int:
+        return self._sample_every
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    # --- RECORDING ---
+
+    def start(
+            self,
+            name: str,
+            trace_id: str,
+            parent_id: Optional[str] = None,
+            kind: int = INTERNAL,
+            attributes: Optional[Dict[str, Any]] = None
+    ) -> Span:
+        """Starts a span; it is exported once passed to end()."""
+        return Span(trace_id, name, parent_id, kind, attributes)
+
+    def end(self, span: Span, error: Optional[BaseException] = None) -> None:
+        """Finishes a span and queues it for export."""
+        self.emit(span.finish(error))
+
+    def emit(self, span: Span) -> None:
+        """Queues a finished span (never blocks: drops it when the buffer is full)."""
+        buffer = self._buffer
+        if len(buffer) >= self._buffer_size:
+            self.dropped += 1
+            return
+        buffer.append(span)
+        if self._writer is None:
+            self._start_writer()
+        if len(buffer) >= self._batch_size:
+            self._wake.set()
+
+    def handle(self, context: StreamContext, uri: str) -> 'HandleTrace':
+        """Span recorder for one StreamHandle."""
+        return HandleTrace(self, context, uri)
+
+    def wrap_processor(self, processor: MiddlewareProcessor) -> 'TracedProcessor':
+        return TracedProcessor(processor, self)
+
+    # --- EXPORT ---
+
+    def flush(self) -> int:
+        """Exports every queued span now. Returns the number of spans written."""
+        written = 0
+        with self._lock:
+            while self._buffer:
+                batch = []
+                while self._buffer and len(batch) < self._batch_size:
+                    batch.append(self._buffer.popleft())
+                self._write(batch)
+                written += len(batch)
+        return written
+
+    def close(self) -> None:
+        """Stops the writer thread and exports the remaining spans."""
+        writer = self._writer
+        if writer is not None:
+            self._stop.set()
+            self._wake.set()
+            writer.join()
+            self._writer = None
+            self._stop = Event()
+        self.flush()
+
+    # --- Private Helpers ---
+
+    def _start_writer(self) -> None:
+        with self._lock:
+            if self._writer is not None:
+                return
+            self._writer = Thread(target=self._drain, name="streamflow-trace-export", daemon=True)
+            self._writer.start()
+            # The daemon writer dies with the interpreter: export the tail first
+            if not self._registered:
+                atexit.register(self.close)
+                self._registered = True
+
+    def _drain(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self._flush_seconds)
+            self._wake.clear()
+            self.flush()
+
+    def _write(self, spans: List[Span]) -> None:
+        # Deferred: 'json' stays off the startup path
+        import json
+        document = {
+            "resourceSpans": [{
+                "resource": self._resource,
+                "scopeSpans": [{"scope": {"name": SCOPE}, "spans": [span.to_otlp() for span in spans]}],
+            }]
+        }
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._path, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(document, separators=(",", ":")) + "\n")
+        self.exported += len(spans)
+
+
+class HandleTrace:
+    """
+    Span recorder of one StreamHandle (one trace per handle, keyed by its trace_id):
+    'handle' (open -> close) parents 'open', 'read', 'first_byte' (from the
+    read() call to the first Packet), sampled 'write' spans and 'close'.
+    """
+    def __init__(self, tracer: Tracer, context: StreamContext, uri: str) -> None:
+        self._tracer = tracer
+        self.trace_id = otel_trace_id(context.trace_id)
+        # Engines may nest the handle below one of their spans (same trace_id)
+        self.parent_id: Optional[str] = None
+        self._attributes = {"streamflow.uri": uri, "streamflow.trace_id": context.trace_id}
+        self._root: Optional[Span] = None
+        self._every = tracer.sample_every
+        self._countdown = self._every
+        self._writes = 0
+
+    # --- PROPERTIES ---
+
+    @property
+    def span_id(self) -> Optional[str]:
+        """The 'handle' span (None until the handle is opened)."""
+        return self._root.span_id if self._root is not None else None
+
+    # --- LIFECYCLE ---
+
+    def open(self, action: Callable[[], Any]) -> None:
+        self._root = self._tracer.start("handle", self.trace_id, self.parent_id, CLIENT, dict(self._attributes))
+        self._writes = 0
+        try:
+            self._timed("open", action)
+        except BaseException as e:
+            # A failed open never reaches __exit__: the handle span ends here
+            root, self._root = self._root, None
+            self._tracer.end(root, e)
+            raise
+
+    def close(self, action: Callable[[], Any], error: Optional[BaseException] = None) -> None:
+        try:
+            self._timed("close", action)
+        finally:
+            root, self._root = self._root, None
+            if root is not None:
+                if self._writes:
+                    root.attributes["streamflow.writes"] = self._writes
+                self._tracer.end(root, error)
+
+    # --- ACTION METHODS ---
+
+    def read(self, packets: Iterable[Packet]) -> Iterator[Packet]:
+        tracer = self._tracer
+        parent = self.span_id or self.parent_id
+        span = tracer.start("read", self.trace_id, parent, CLIENT)
+        first = tracer.start("first_byte", self.trace_id, span.span_id, CLIENT)
+        error = None
+        count = size = 0
+        try:
+            for packet in packets:
+                if first is not None:
+                    tracer.end(first)
+                    first = None
+                count += 1
+                payload = packet.payload
+                if type(payload) in SIZED_PAYLOADS:
+                    size += len(payload)
+                yield packet
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            span.attributes["streamflow.packets"] = count
+            span.attributes["streamflow.bytes"] = size
+            if first is not None:
+                # Empty (or failed) before the first Packet
+                tracer.end(first, error)
+            tracer.end(span, error)
+
+    def write(self, action: Callable[[Packet], None], packet: Packet) -> None:
+        """Runs a write; one in 'sample_every' becomes a span carrying the Packet lineage."""
+        self._writes += 1
+        self._countdown -= 1
+        if self._countdown:
+            action(packet)
+            return
+        self._countdown = self._every
+        span = self._tracer.start("write", self.trace_id, self.span_id or self.parent_id, CLIENT, lineage(packet))
+        try:
+            action(packet)
+        except BaseException as e:
+            self._tracer.end(span, e)
+            raise
+        self._tracer.end(span)
+
+    # --- Private Helpers ---
+
+    def _timed(self, name: str, action: Callable[[], Any]) -> None:
+        span = self._tracer.start(name, self.trace_id, self.span_id or self.parent_id, CLIENT)
+        try:
+            action()
+        except BaseException as e:
+            self._tracer.end(span, e)
+            raise
+        self._tracer.end(span)
+
+
+class TracedProcessor(MiddlewareProcessor):
+    """
+    Records a span per stage (open -> close) and, for one process() or
+    process_batch() call in 'sample_every', a child span carrying the Packet
+    lineage. Sampled outputs are materialized so that the time spent
+    downstream is never charged to this stage; other calls pass through.
+
+    The engine places the stage in its trace with bind() before opening it.
+    """
+    def __init__(self, processor: MiddlewareProcessor, tracer: Tracer) -> None:
+        self._processor = processor
+        self._tracer = tracer
+        self._every = tracer.sample_every
+        self._countdown = self._every
+        self._span: Optional[Span] = None
+        self._trace_id = otel_trace_id("")
+        self._parent_id: Optional[str] = None
+        self._calls = 0
+
+    # --- IDENTITY & HANDSHAKE ---
+
+    @property
+    def name(self) -> str:
+        return self._processor.name
+
+    @property
+    def input_subject(self) -> PayloadType:
+        return self._processor.input_subject
+
+    @property
+    def output_subject(self) -> PayloadType:
+        return self._processor.output_subject
+
+    @property
+    def processor(self) -> MiddlewareProcessor:
+        return self._processor
+
+    def bind(self, trace_id: str, parent_id: Optional[str]) -> None:
+        """Places the stage span below 'parent_id' in 'trace_id' (an OpenTelemetry trace id)."""
+        self._trace_id = trace_id
+        self._parent_id = parent_id
+
+    # --- LIFECYCLE ---
+
+    def open(self) -> None:
+        self._calls = 0
+        self._countdown = self._every
+        self._span = self._tracer.start(
+            self._processor.name, self._trace_id, self._parent_id, INTERNAL, {"streamflow.component": "stage"}
+        )
+        self._processor.open()
+
+    def close(self) -> None:
+        self._end(self._processor.close)
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        # Forwarded rather than close(): the wrapped stage may discard uncommitted state on failure
+        self._end(lambda: self._processor.__exit__(exc_type, exc_val, exc_tb))
+
+    def snapshot(self) -> Any:
+        return self._processor.snapshot()
+
+    def restore(self, state: Any) -> None:
+        self._processor.restore(state)
+
+    # --- TRANSFORMATION ---
+
+    def process(self, packet: Packet) -> Iterator[Packet]:
+        self._calls += 1
+        self._countdown -= 1
+        if self._countdown:
+            return self._processor.process(packet)
+        self._countdown = self._every
+        return self._sampled("process", lambda: self._processor.process(packet), lineage(packet))
+
+    def process_batch(self, packets: List[Packet]) -> Iterator[Packet]:
+        self._calls += 1
+        self._countdown -= 1
+        if self._countdown:
+            return self._processor.process_batch(packets)
+        self._countdown = self._every
+        attributes = lineage(packets[0]) if packets else {}
+        attributes["streamflow.batch_size"] = len(packets)
+        return self._sampled("process_batch", lambda: self._processor.process_batch(packets), attributes)
+
+    def flush(self) -> Iterator[Packet]:
+        return self._sampled("flush", self._processor.flush, {})
+
+    # --- Private Helpers ---
+
+    def _end(self, action: Callable[[], Any]) -> None:
+        span, self._span = self._span, None
+        try:
+            action()
+        except BaseException as e:
+            if span is not None:
+                self._tracer.end(span, e)
+            raise
+        if span is not None:
+            span.attributes["streamflow.calls"] = self._calls
+            self._tracer.end(span)
+
+    def _sampled(self, name: str, call: Callable[[], Iterable[Packet]], attributes: Dict[str, Any]) -> Iterator[Packet]:
+        parent = self._span.span_id if self._span is not None else self._parent_id
+        span = self._tracer.start(name, self._trace_id, parent, INTERNAL, attributes)
+        try:
+            output = list(call())
+        except BaseException as e:
+            self._tracer.end(span, e)
+            raise
+        span.attributes["streamflow.outputs"] = len(output)
+        self._tracer.end(span)
+        return iter(output)
+
+
+def lineage(packet: Packet) -> Dict[str, Any]:
+    """Span attributes of a Packet's Identity."""
+    identity = packet.identity
+    attributes = {"streamflow.packet.id": identity.id, "streamflow.packet.correlation_id": identity.correlation_id}
+    if identity.parent_id is not None:
+        attributes["streamflow.packet.parent_id"] = identity.parent_id
+    return attributes
@@ -78,6 +78,7 @@ class HttpStream(DataStream[HttpContract]):
                 timeout=self._settings.timeout,
                 headers=self._settings.headers
             )
+        self.is_open = True
     
     @classmethod
     def exists(cls, location: StreamLocation) -> bool:
@@ -118,6 +119,8 @@ class HttpStream(DataStream[HttpContract]):
                 request_kwargs["content"] = self._settings.request_body
 
         # Open the Valve
+        # - Release a previous response first (e.g. a pooled, re-read adapter)
+        self._close_valve()
         self._transport_valve = self._client.stream(**request_kwargs)
         self._response = self._transport_valve.__enter__()
         self._response.raise_for_status()
@@ -140,12 +143,7 @@ class HttpStream(DataStream[HttpContract]):
     def close(self) -> None:
         """Properly unwinds the network stack."""
         # 1. Close the Valve
-        if self._transport_valve:
-            try:
-                self._transport_valve.__exit__(None, None, None)
-            finally:
-                self._transport_valve = None
-                self._response = None
+        self._close_valve()
 
         # 2. Close the Engine
         if self._client:
@@ -153,7 +151,27 @@ class HttpStream(DataStream[HttpContract]):
                 self._client.close()
             finally:
                 self._client = None
+        self.is_open = False
+
+    def reset(self) -> bool:
+        """
+        Closes the current response but keeps the connection pool alive.
+        The next read() re-issues the request over the warm client.
+        """
+        if self._client is None:
+            return False
+        self._close_valve()
+        return True
     
+    def _close_valve(self) -> None:
+        """Releases the in-flight response (if any)."""
+        if self._transport_valve:
+            try:
+                self._transport_valve.__exit__(None, None, None)
+            finally:
+                self._transport_valve = None
+                self._response = None
+
     # --- INTERNAL STRATEGY METHODS ---
 
     def _read_chunks(self) -> Iterator[Packet]:
@@ -35,7 +35,7 @@ class PosixFileStream(DataStream[PosixFileContract]):
             if uri.protocol != "file":
                 raise TypeError(f"PosixFileStream cannot handle non-file URI: {uri.protocol}")
             # Extract path from file:///...
-            self._path = Path(uri.split("://")[1])
+            self._path = Path(uri.address)
         elif isinstance(uri, Path):
             self._path = uri
         else:
@@ -50,6 +50,9 @@ class PosixFileStream(DataStream[PosixFileContract]):
         # - Stores io.TextIOWrapper or io.BufferedRandom object
         self._file_handle: Optional[IO] = None
 
+        # Position to resume at on open() (set by seek() before opening)
+        self._resume_at: Optional[int] = None
+
         # 2. Re-assert the type for the specific child class
         # This resolves the "Unknown Attribute" error in the methods below.
         self._policy: PosixFilePolicy = policy or PosixFilePolicy()
@@ -102,10 +105,14 @@ class PosixFileStream(DataStream[PosixFileContract]):
         encoding = None if is_binary else self._settings.encoding
 
         # 3. Perform the actual OS open
+        # - Resuming writers ('w', 'x') reopen without truncating; seek() cuts the tail
+        file_mode = self._settings.file_mode
+        if self._as_sink and self._resume_at is not None and "a" not in file_mode and self._path.exists():
+            file_mode = "r+b" if is_binary else "r+"
         try:
             self._file_handle = open(
                 self._path, 
-                mode=self._settings.file_mode, 
+                mode=file_mode, 
                 encoding=encoding
             )
             self.is_open = True
@@ -113,6 +120,11 @@ class PosixFileStream(DataStream[PosixFileContract]):
             # We wrap OS errors in a domain-friendly IOError
             raise IOError(f"Could not open {self._path}: {e}")
 
+        # 4. Resume at a checkpointed position
+        if self._resume_at is not None:
+            position, self._resume_at = self._resume_at, None
+            self._apply_position(position)
+
     def read(self) -> Iterator[Packet]:
         """
         Dispatches reading based on the Contract strategy.
@@ -134,7 +146,8 @@ class PosixFileStream(DataStream[PosixFileContract]):
                 )
         
         elif strategy == FileReadMode.LINES:
-            for line in self._file_handle:
+            # readline() (not iteration) keeps tell() available between lines
+            while line := self._file_handle.readline():
                 yield Packet(
                     payload=line,
                     context=self._context,
@@ -171,9 +184,56 @@ class PosixFileStream(DataStream[PosixFileContract]):
         if self._file_handle:
             self._file_handle.close()
             self._file_handle = None
+        self.is_open = False
+
+    def reset(self) -> bool:
+        """
+        Rewinds the open file so the adapter can be reused without an OS open.
+        - Readers seek back to the start
+        - Appending writers ('a', 'ab') flush their buffer and keep appending
+        - Truncating/exclusive writers ('w', 'x') cannot be reused
+        """
+        if not self._file_handle or self._file_handle.closed:
+            return False
+
+        file_mode = self._settings.file_mode
+        if "a" in file_mode:
+            self._file_handle.flush()
+            return True
+        if "w" in file_mode or "x" in file_mode or not self.capacity.can_seek:
+            return False
+
+        self._file_handle.seek(0)
+        return True
+
+    def tell(self) -> Optional[int]:
+        """
+        Readers: offset after the last yielded Packet (a text-mode cookie for 'r').
+        Writers: flushes and fsyncs, then returns the committed size.
+        """
+        if not self._file_handle or self._file_handle.closed:
+            return self._resume_at
+        if self._as_sink:
+            self._file_handle.flush()
+            os.fsync(self._file_handle.fileno())
+        return self._file_handle.tell()
+
+    def seek(self, position: int) -> bool:
+        if not self._file_handle or self._file_handle.closed:
+            self._resume_at = position
+            return True
+        self._apply_position(position)
+        return True
 
     # --- Helper Methods ---
 
+    def _apply_position(self, position: int) -> None:
+        """Readers skip to 'position'; writers drop everything past it."""
+        if self._as_sink:
+            self._file_handle.flush()
+            self._file_handle.truncate(position)
+        self._file_handle.seek(position)
+
     def _ensure_directory_exists(self) -> None:
         """Creates the parent structure if missing, applying Policy-governed permissions."""
         parent = self._path.parent
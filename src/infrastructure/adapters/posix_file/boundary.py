@@ -5,9 +5,14 @@ from src.app.ports.input.resource_boundary import ResourceBoundary
 from src.app.domain.models.resource_identity import LogicalURI, PhysicalPath
 
 class PosixResourceBoundary(ResourceBoundary[Path]):
+    def canonicalize(self, anchor: Path) -> Path:
+        # Absolute, symlink-free anchor; computed once per add_anchor()
+        return Path(anchor).resolve()
+
     def resolve(self, uri: LogicalURI, anchor: Path) -> PhysicalPath:
         # 1. Standardixe the anchor
-        anchor_absolute = anchor.resolve()
+        # - Already canonical when handed over by the ResourceCatalog
+        anchor_absolute = anchor
 
         # 2. Extract sub-path
         # - e.g. registry://key/sub/path.xml --> /sub/path.xml
@@ -30,4 +35,4 @@ class PosixResourceBoundary(ResourceBoundary[Path]):
             physical_resource.relative_to(anchor)
             return True
         except ValueError:
-            return False
\ No newline at end of file
+            return False
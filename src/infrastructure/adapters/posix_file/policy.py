@@ -42,7 +42,7 @@ class PosixFilePolicy(StreamPolicy):
             if resolved_config.protocol != "file":
                 # Only 'file' is safe to promote to a local path
                 return False
-            path_obj = Path(resolved_config.split("://")[1])
+            path_obj = Path(resolved_config.address)
         else:
             path_obj = Path(resolved_config)
 
@@ -0,0 +1,17 @@
+# src/infrastructure/processors/__init__.py
+from src.infrastructure.processors.jsonl import JsonLinesDecoder
+from src.infrastructure.processors.delimited import DelimitedDecoder
+from src.infrastructure.processors.sort import ExternalSort
+from src.infrastructure.processors.window import LogHistogram, WindowAggregator
+from src.infrastructure.processors.dedup import BloomFilter, Deduplicator, HashIndex
+
+__all__ = [
+    "JsonLinesDecoder",
+    "DelimitedDecoder",
+    "ExternalSort",
+    "WindowAggregator",
+    "LogHistogram",
+    "Deduplicator",
+    "BloomFilter",
+    "HashIndex",
+]
@@ -0,0 +1,366 @@
+# src/infrastructure/processors/dedup.py
+import hashlib
+import math
+import os
+import sqlite3
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterator, List, Optional, Tuple, Union
+
+from src.app.domain.models.packet import Packet, PayloadSubject, PayloadType
+from src.app.ports.output.middleware_processor import MiddlewareProcessor
+
+# Extracts the identity of a record from its payload
+KeyFunction = Callable[[Any], Hashable]
+
+_DIGEST_SIZE = 16
+
+
+def digest(key: Hashable) -> bytes:
+    """Stable 128-bit fingerprint of a key (identical across runs and processes)."""
+    if isinstance(key, bytes):
+        raw = key
+    elif isinstance(key, str):
+        raw = key.encode("utf-8")
+    else:
+        raw = repr(key).encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=_DIGEST_SIZE).digest()
+
+
+class BloomFilter:
+    """
+    Compact probabilistic set (bit array + double hashing).
+
+    Sized from the expected 'capacity' and target 'error_rate'; false positives
+    are possible (a new record reported as seen), false negatives are not.
+    State is persisted with save()/load().
+    """
+    _MAGIC = b"SFBLOOM1"
+    _HEADER = struct.Struct("<8sQQQ")  # magic, bits, hashes, count
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("BloomFilter requires capacity >= 1 and 0 < error_rate < 1.")
+        bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.bits = max(8, bits)
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+        self.count = 0
+        self._array = bytearray((self.bits + 7) // 8)
+
+    # --- SET OPERATIONS ---
+
+    def add(self, fingerprint: bytes) -> bool:
+        """Inserts a fingerprint. Returns False when it was (probably) already present."""
+        new = False
+        array = self._array
+        for position in self._positions(fingerprint):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not array[byte] & mask:
+                array[byte] |= mask
+                new = True
+        if new:
+            self.count += 1
+        return new
+
+    def __contains__(self, fingerprint: bytes) -> bool:
+        array = self._array
+        return all(array[position >> 3] & (1 << (position & 7)) for position in self._positions(fingerprint))
+
+    # --- PERSISTENCE ---
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Writes the filter atomically (temp file + rename)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(path.name + ".tmp")
+        with open(temporary, "wb") as handle:
+            handle.write(self._HEADER.pack(self._MAGIC, self.bits, self.hashes, self.count))
+            handle.write(self._array)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> 'BloomFilter':
+        with open(path, "rb") as handle:
+            magic, bits, hashes, count = cls._HEADER.unpack(handle.read(cls._HEADER.size))
+            if magic != cls._MAGIC:
+                raise ValueError(f"Not a BloomFilter state file: {path}")
+            instance = cls.__new__(cls)
+            instance.bits, instance.hashes, instance.count = bits, hashes, count
+            instance._array = bytearray(handle.read())
+        if len(instance._array) != (bits + 7) // 8:
+            raise ValueError(f"Truncated BloomFilter state file: {path}")
+        return instance
+
+    # --- Private Helpers ---
+
+    def _positions(self, fingerprint: bytes) -> Iterator[int]:
+        # Kirsch-Mitzenmacher: k positions from two 64-bit halves of one digest
+        first = int.from_bytes(fingerprint[:8], "little")
+        second = int.from_bytes(fingerprint[8:16], "little") | 1
+        bits = self.bits
+        return ((first + index * second) % bits for index in range(self.hashes))
+
+
+class HashIndex:
+    """
+    Exact, disk-backed set of fingerprints (SQLite primary-key index).
+    Memory use is bounded by SQLite's page cache, not by the number of keys.
+
+    Inserts are committed every 'batch_size' new keys so the WAL stays bounded.
+    Until commit(), the new keys are also appended to an undo log ('<path>-undo'):
+    rollback() deletes them again, and so does the next open after a killed run.
+    """
+    def __init__(self, path: Union[str, os.PathLike], cache_kib: int = 16 * 1024, batch_size: int = 10_000) -> None:
+        self._connection = sqlite3.connect(str(path), isolation_level=None, check_same_thread=False)
+        self._connection.executescript(
+            f"""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA cache_size=-{int(cache_kib)};
+            CREATE TABLE IF NOT EXISTS seen (fingerprint BLOB PRIMARY KEY) WITHOUT ROWID;
+            """
+        )
+        self._batch_size = batch_size
+        self._added = bytearray()   # Keys of the open batch, not yet in the undo log
+        self._undo = open(str(path) + "-undo", "a+b")
+        self._undo_inserts()
+        self._connection.execute("BEGIN")
+
+    def add(self, fingerprint: bytes) -> bool:
+        """Inserts a fingerprint. Returns False when it was already present."""
+        cursor = self._connection.execute("INSERT OR IGNORE INTO seen VALUES (?)", (fingerprint,))
+        if cursor.rowcount != 1:
+            return False
+        self._added += fingerprint
+        if len(self._added) >= self._batch_size * _DIGEST_SIZE:
+            self._commit_batch()
+        return True
+
+    def add_many(self, fingerprints: List[bytes]) -> List[bool]:
+        """Batch insert; returns, per fingerprint, whether it was new (first occurrence wins)."""
+        existing = set()
+        for start in range(0, len(fingerprints), 500):
+            chunk = fingerprints[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            existing.update(
+                row[0] for row in self._connection.execute(
+                    f"SELECT fingerprint FROM seen WHERE fingerprint IN ({placeholders})", chunk
+                )
+            )
+
+        flags = []
+        for fingerprint in fingerprints:
+            new = fingerprint not in existing
+            existing.add(fingerprint)
+            flags.append(new)
+        added = [fingerprint for fingerprint, new in zip(fingerprints, flags) if new]
+        self._connection.executemany("INSERT OR IGNORE INTO seen VALUES (?)", [(fingerprint,) for fingerprint in added])
+        self._added += b"".join(added)
+        if len(self._added) >= self._batch_size * _DIGEST_SIZE:
+            self._commit_batch()
+        return flags
+
+    def commit(self) -> None:
+        """Keeps every insert since the last commit()."""
+        self._connection.execute("COMMIT")
+        self._added.clear()
+        self._undo.truncate(0)
+        self._connection.execute("BEGIN")
+
+    def rollback(self) -> None:
+        """Discards every insert since the last commit()."""
+        self._connection.execute("ROLLBACK")
+        self._added.clear()
+        self._undo_inserts()
+        self._connection.execute("BEGIN")
+
+    def close(self) -> None:
+        """Discards every insert since the last commit() and closes the database."""
+        self.rollback()
+        self._connection.execute("COMMIT")
+        self._connection.close()
+        self._undo.close()
+        Path(self._undo.name).unlink(missing_ok=True)
+
+    # --- Private Helpers ---
+
+    def _commit_batch(self) -> None:
+        # The undo log reaches the OS before the batch becomes durable in the index
+        self._undo.write(self._added)
+        self._undo.flush()
+        self._added.clear()
+        self._connection.execute("COMMIT")
+        self._connection.execute("BEGIN")
+
+    def _undo_inserts(self) -> None:
+        """Deletes the keys of every intermediate commit since the last commit()."""
+        # One transaction per block: interrupted, the (idempotent) deletes are replayed on the next open
+        self._undo.seek(0)
+        while block := self._undo.read(self._batch_size * _DIGEST_SIZE):
+            self._connection.execute("BEGIN")
+            self._connection.executemany(
+                "DELETE FROM seen WHERE fingerprint = ?",
+                [(block[start:start + _DIGEST_SIZE],) for start in range(0, len(block), _DIGEST_SIZE)]
+            )
+            self._connection.execute("COMMIT")
+        self._undo.truncate(0)
+
+
+class Deduplicator(MiddlewareProcessor):
+    """
+    Drops records whose key(payload) has been seen before (1:1 / 1:0).
+
+    Modes:
+    - 'exact': disk-backed HashIndex (SQLite); no false positives, bounded memory
+    - 'bloom': BloomFilter sized by 'capacity' and 'error_rate'; a small fraction
+               of new records may be dropped as duplicates, never the reverse
+
+    Incremental Ingestion: with 'state_path', the index/filter is reloaded on
+    open() and persisted when the run closes successfully, so later runs skip
+    records that earlier runs already delivered. Without it, state lives for
+    one run only.
+
+    A failed or cancelled run (__exit__ with an exception) discards every key
+    added since the last persist: those records may never have reached the
+    sink. In a checkpointed pipeline, state is also persisted at every
+    snapshot(), so it always matches the checkpoint the next run resumes from.
+    """
+    def __init__(
+            self,
+            key: KeyFunction,
+            mode: str = "exact",
+            state_path: Union[str, os.PathLike, None] = None,
+            capacity: int = 1_000_000,
+            error_rate: float = 0.001,
+            subject: PayloadType = PayloadSubject.DICT
+    ) -> None:
+        """
+        :param key: Record identity over the payload.
+        :param mode: 'exact' or 'bloom'.
+        :param state_path: File holding the persisted index/filter (optional).
+        :param capacity: Expected number of distinct keys (bloom mode).
+        :param error_rate: Target false-positive rate at 'capacity' (bloom mode).
+        :param subject: PayloadType consumed and emitted.
+        """
+        if mode not in ("exact", "bloom"):
+            raise ValueError(f"Unsupported dedup mode: '{mode}'. Use 'exact' or 'bloom'.")
+
+        self._key = key
+        self._mode = mode
+        self._state_path = Path(state_path) if state_path is not None else None
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._subject = subject
+
+        self._index: Optional[HashIndex] = None
+        self._bloom: Optional[BloomFilter] = None
+        self._scratch: Optional[Tuple[int, str]] = None
+        self.duplicates_dropped = 0
+
+    # --- IDENTITY & HANDSHAKE ---
+
+    @property
+    def name(self) -> str:
+        return f"dedup_{self._mode}"
+
+    @property
+    def input_subject(self) -> PayloadType:
+        return self._subject
+
+    @property
+    def output_subject(self) -> PayloadType:
+        return self._subject
+
+    # --- LIFECYCLE ---
+
+    def open(self) -> None:
+        self.duplicates_dropped = 0
+        if self._mode == "exact":
+            if self._state_path is not None:
+                self._state_path.parent.mkdir(parents=True, exist_ok=True)
+                self._index = HashIndex(self._state_path)
+            else:
+                self._scratch = tempfile.mkstemp(prefix="streamflow-dedup-", suffix=".sqlite")
+                self._index = HashIndex(self._scratch[1])
+        elif self._state_path is not None and self._state_path.exists():
+            self._bloom = BloomFilter.load(self._state_path)
+        else:
+            self._bloom = BloomFilter(self._capacity, self._error_rate)
+
+    def close(self) -> None:
+        self._persist()
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+        if self._scratch is not None:
+            descriptor, path = self._scratch
+            os.close(descriptor)
+            for suffix in ("", "-wal", "-shm", "-undo"):
+                Path(path + suffix).unlink(missing_ok=True)
+            self._scratch = None
+        self._bloom = None
+
+    # --- TRANSFORMATION ---
+
+    def process(self, packet: Packet) -> Iterator[Packet]:
+        if self._add(digest(self._key(packet.payload))):
+            yield packet
+        else:
+            self.duplicates_dropped += 1
+
+    def process_batch(self, packets: List[Packet]) -> Iterator[Packet]:
+        key = self._key
+        fingerprints = [digest(key(packet.payload)) for packet in packets]
+        if self._index is not None:
+            flags = self._index.add_many(fingerprints)
+        else:
+            flags = [self._bloom.add(fingerprint) for fingerprint in fingerprints]
+
+        kept = [packet for packet, new in zip(packets, flags) if new]
+        self.duplicates_dropped += len(packets) - len(kept)
+        return iter(kept)
+
+    def flush(self) -> Iterator[Packet]:
+        # Nothing to persist yet: records kept so far may still be in flight downstream
+        return iter(())
+
+    # --- CHECKPOINT ---
+
+    @property
+    def checkpointable(self) -> bool:
+        # An exact index without 'state_path' is a scratch file (a bloom filter is pickled instead)
+        return self._state_path is not None or self._mode == "bloom"
+
+    def snapshot(self) -> Any:
+        if not self.checkpointable:
+            raise RuntimeError(f"'{self.name}' needs a 'state_path' to be checkpointed.")
+        if self._state_path is None:
+            return self._bloom
+        self._persist()
+        return None
+
+    def restore(self, state: Any) -> None:
+        if state is not None:
+            self._bloom = state
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is not None:
+            # Keep the last persisted state (run start or checkpoint): the next run replays from there
+            if self._index is not None:
+                self._index.rollback()
+            self._bloom = None
+        self.close()
+
+    # --- Private Helpers ---
+
+    def _add(self, fingerprint: bytes) -> bool:
+        if self._index is not None:
+            return self._index.add(fingerprint)
+        return self._bloom.add(fingerprint)
+
+    def _persist(self) -> None:
+        if self._index is not None:
+            self._index.commit()
+        elif self._bloom is not None and self._state_path is not None:
+            self._bloom.save(self._state_path)
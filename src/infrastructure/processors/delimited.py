@@ -0,0 +1,276 @@
+# src/infrastructure/processors/delimited.py
+import codecs
+import csv
+import io
+from array import array
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from src.app.domain.models.packet import Completeness, FlowSignal, Packet, PayloadSubject, PayloadType
+from src.app.ports.output.middleware_processor import MiddlewareProcessor
+
+# Converts one raw field (str) into its typed value
+Coercer = Callable[[str], Any]
+
+# Receives (raw_row, error) for every row that could not be parsed/coerced
+MalformedHandler = Callable[[List[str], Exception], None]
+
+# array.array typecodes for numeric columns (arrays=True)
+_ARRAY_TYPECODES = {int: "q", float: "d"}
+
+# Quote state at the end of the carried partial record
+_UNQUOTED, _QUOTED, _CLOSED = 0, 1, 2   # _CLOSED: the last char closed a quoted field
+
+
+class DelimitedDecoder(MiddlewareProcessor):
+    """
+    Streaming CSV/TSV parser.
+
+    Turns PARTIAL byte/text chunks into rows using the 'csv' module over an
+    incremental text buffer:
+    - Multi-byte characters split across chunks are decoded incrementally
+    - Only text up to the last newline *outside quotes* is parsed, so quoted
+      fields containing newlines may span any number of chunks
+    - The header row (or the given fieldnames) names the fields
+    - 'schema' coerces fields (e.g. {"age": int, "price": float}); empty fields become None
+
+    Output modes:
+    - batch=None:      one DICT Packet per row
+    - batch='rows':    one RECORDS Packet (list of dicts) per chunk
+    - batch='columns': one COLUMNS Packet ({field: [values]}) per chunk;
+                       arrays=True packs null-free int/float columns into array.array
+                       (int columns outside the int64 range stay lists)
+
+    Quoting follows the default dialect: a quote char opens a quoted field only at
+    the start of a field, doubled quote chars escape it; 'escapechar' is not supported.
+    """
+    def __init__(
+            self,
+            delimiter: str = ",",
+            fieldnames: Optional[Sequence[str]] = None,
+            schema: Optional[Dict[str, Coercer]] = None,
+            batch: Optional[str] = None,
+            arrays: bool = False,
+            encoding: str = "utf-8",
+            quotechar: str = '"',
+            on_malformed: Union[str, MalformedHandler] = "skip",
+            max_record_size: int = 16 * 1024 * 1024
+    ) -> None:
+        """
+        :param delimiter: Field separator (',' for CSV, '\\t' for TSV).
+        :param fieldnames: Field names; when None the first row is the header.
+        :param schema: Per-field coercion callables; other fields stay str.
+        :param batch: None, 'rows' or 'columns'.
+        :param arrays: In 'columns' mode, pack int/float columns into array.array.
+        :param encoding: Used to decode bytes chunks.
+        :param quotechar: Quote character of the dialect.
+        :param on_malformed: 'skip', 'raise', or a callable receiving (row, error).
+        :param max_record_size: Upper bound (characters) for a carried partial record.
+        """
+        if batch not in (None, "rows", "columns"):
+            raise ValueError(f"batch must be None, 'rows' or 'columns', got: {batch!r}")
+        if not callable(on_malformed) and on_malformed not in ("skip", "raise"):
+            raise ValueError(f"on_malformed must be 'skip', 'raise' or a callable, got: {on_malformed!r}")
+
+        self._delimiter = delimiter
+        self._declared_fields = list(fieldnames) if fieldnames is not None else None
+        self._schema = dict(schema or {})
+        self._batch = batch
+        self._arrays = arrays
+        self._encoding = encoding
+        self._quotechar = quotechar
+        self._on_malformed = on_malformed
+        self._max_record_size = max_record_size
+        self._reset_state()
+
+    # --- IDENTITY & HANDSHAKE ---
+
+    @property
+    def name(self) -> str:
+        return "tsv_decoder" if self._delimiter == "\t" else "csv_decoder"
+
+    @property
+    def input_subject(self) -> PayloadType:
+        return PayloadSubject.BYTES
+
+    @property
+    def output_subject(self) -> PayloadType:
+        if self._batch == "rows":
+            return PayloadSubject.RECORDS
+        if self._batch == "columns":
+            return PayloadSubject.COLUMNS
+        return PayloadSubject.DICT
+
+    @property
+    def fieldnames(self) -> Optional[List[str]]:
+        return self._fields
+
+    # --- LIFECYCLE ---
+
+    def open(self) -> None:
+        self._reset_state()
+
+    # --- TRANSFORMATION ---
+
+    def process(self, packet: Packet) -> Iterator[Packet]:
+        self._last = packet
+        return self._emit(packet, self._parse(self._frame(packet.payload)))
+
+    def process_batch(self, packets: List[Packet]) -> Iterator[Packet]:
+        self._last = packets[-1]
+        text = "".join([self._frame(packet.payload) for packet in packets])
+        return self._emit(packets[-1], self._parse(text))
+
+    def flush(self) -> Iterator[Packet]:
+        tail = self._carry + self._decoder.decode(b"", final=True)
+        self._carry, self._carry_state = "", _UNQUOTED
+        if self._last is None or not tail.strip():
+            return iter(())
+        if not tail.endswith("\n"):
+            tail += "\n"
+        return self._emit(self._last, self._parse(tail))
+
+    # --- CHECKPOINT ---
+
+    def snapshot(self) -> Any:
+        # The incremental decoder holds the bytes of a multibyte char split across chunks
+        return self._decoder.getstate(), self._carry, self._fields, self._last, self.malformed_count
+
+    def restore(self, state: Any) -> None:
+        decoder_state, self._carry, self._fields, self._last, self.malformed_count = state
+        self._decoder.setstate(decoder_state)
+        self._carry_state = self._scan(self._carry, 0, _UNQUOTED)[1]
+
+    # --- Private Helpers ---
+
+    def _reset_state(self) -> None:
+        self._decoder = codecs.getincrementaldecoder(self._encoding)()
+        self._carry = ""
+        self._carry_state = _UNQUOTED
+        self._fields: Optional[List[str]] = list(self._declared_fields) if self._declared_fields else None
+        self._last: Optional[Packet] = None
+        self.malformed_count = 0
+
+    def _frame(self, payload: Union[bytes, str]) -> str:
+        """
+        Appends a chunk to the buffer and returns the prefix made of complete records.
+        A newline ends a record only outside a quoted field.
+
+        The carry ends in a known quote state, so only the new chunk is
+        scanned (O(chunk), not O(carry)).
+        """
+        chunk = payload if isinstance(payload, str) else self._decoder.decode(payload)
+        start = len(self._carry)
+        text = self._carry + chunk
+
+        cut, self._carry_state = self._scan(text, start, self._carry_state)
+        if cut >= 0:
+            complete, self._carry = text[:cut + 1], text[cut + 1:]
+        else:
+            complete, self._carry = "", text
+        if len(self._carry) > self._max_record_size:
+            oversized, self._carry, self._carry_state = self._carry, "", _UNQUOTED
+            self._malformed([oversized[:256]], ValueError(f"Record exceeds max_record_size ({self._max_record_size})"))
+        return complete
+
+    def _scan(self, text: str, start: int, state: int) -> Tuple[int, int]:
+        """
+        Walks the quote chars of text[start:] from 'state' and returns
+        (index of the last newline outside quotes or -1, state at the end).
+
+        As in the csv module, a quote char opens a quoted field only at the
+        start of a field; elsewhere (e.g. 12" screen) it is a literal char.
+        A doubled quote char inside a quoted field is an escaped quote.
+        """
+        quote, field_starts = self._quotechar, (self._delimiter, "\n", "\r")
+        cut, unquoted_from = -1, start
+        i = text.find(quote, start)
+        while i >= 0:
+            if state == _QUOTED:
+                state, unquoted_from = _CLOSED, i + 1
+            elif state == _CLOSED and i == unquoted_from:
+                state = _QUOTED      # Doubled quote char: still inside the field
+            elif i == 0 or text[i - 1] in field_starts:
+                newline = text.rfind("\n", unquoted_from, i)
+                if newline >= 0:
+                    cut = newline
+                state = _QUOTED
+            else:
+                state = _UNQUOTED
+            i = text.find(quote, i + 1)
+
+        if state != _QUOTED:
+            newline = text.rfind("\n", unquoted_from)
+            if newline >= 0:
+                cut = newline
+            if state == _CLOSED and unquoted_from < len(text):
+                state = _UNQUOTED
+        return cut, state
+
+    def _parse(self, text: str) -> List[Dict[str, Any]]:
+        if not text:
+            return []
+
+        rows = csv.reader(io.StringIO(text, newline=""), delimiter=self._delimiter, quotechar=self._quotechar)
+        if self._fields is None:
+            header = next(rows, None)
+            if header is None:
+                return []
+            self._fields = header
+
+        fields, width, schema = self._fields, len(self._fields), self._schema
+        records = []
+        for row in rows:
+            if not row:
+                continue
+            if len(row) != width:
+                self._malformed(row, ValueError(f"Expected {width} fields, got {len(row)}"))
+                continue
+            record = dict(zip(fields, row))
+            if schema:
+                try:
+                    for field, coerce in schema.items():
+                        value = record.get(field)
+                        record[field] = coerce(value) if value else None
+                except (TypeError, ValueError) as e:
+                    self._malformed(row, e)
+                    continue
+            records.append(record)
+        return records
+
+    def _malformed(self, row: List[str], error: Exception) -> None:
+        self.malformed_count += 1
+        if self._on_malformed == "raise":
+            raise ValueError(f"Malformed {self.name} row: {row!r}") from error
+        if callable(self._on_malformed):
+            self._on_malformed(row, error)
+
+    def _columns(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        columns: Dict[str, Any] = {field: [record[field] for record in records] for field in self._fields}
+        if self._arrays:
+            for field, coerce in self._schema.items():
+                typecode = _ARRAY_TYPECODES.get(coerce)
+                values = columns.get(field)
+                if typecode and values is not None and None not in values:
+                    try:
+                        columns[field] = array(typecode, values)
+                    except OverflowError:
+                        # Python ints beyond int64: keep the plain list
+                        pass
+        return columns
+
+    def _emit(self, origin: Packet, records: List[Dict[str, Any]]) -> Iterator[Packet]:
+        if not records:
+            return iter(())
+        if self._batch is None:
+            return (
+                origin.spawn(record, subject=PayloadSubject.DICT, signal=FlowSignal.STREAM_DATA, completeness=Completeness.COMPLETE)
+                for record in records
+            )
+
+        payload = records if self._batch == "rows" else self._columns(records)
+        return iter((origin.spawn(
+            payload,
+            subject=self.output_subject,
+            signal=FlowSignal.STREAM_DATA,
+            completeness=Completeness.BULK
+        ),))
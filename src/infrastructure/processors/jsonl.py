@@ -0,0 +1,173 @@
+# src/infrastructure/processors/jsonl.py
+import json
+from typing import Any, Callable, Iterator, List, Optional, Union
+
+from src.app.domain.models.packet import Completeness, FlowSignal, Packet, PayloadSubject, PayloadType
+from src.app.ports.output.middleware_processor import MiddlewareProcessor
+
+# Decodes one JSON document (bytes) into a Python object
+JsonDecoder = Callable[[bytes], Any]
+
+# Receives (raw_line, error) for every line that could not be decoded
+MalformedHandler = Callable[[bytes, Exception], None]
+
+
+def default_decoder() -> JsonDecoder:
+    """orjson.loads when installed (several times faster), json.loads otherwise."""
+    try:
+        import orjson
+        return orjson.loads
+    except ImportError:
+        return json.loads
+
+
+class JsonLinesDecoder(MiddlewareProcessor):
+    """
+    Framing + Decoding for JSON Lines (NDJSON).
+
+    Turns PARTIAL byte chunks (e.g. PosixFileStream / HttpStream in BYTES mode)
+    into one DICT Packet per line:
+    - Lines split across chunks are carried over to the next chunk
+    - The last line is emitted on flush() even without a trailing newline
+    - Every complete line of a chunk (or of a whole batch) is decoded in one pass
+    - Malformed lines are skipped, raised, or routed to a handler; a line longer
+      than 'max_line_size' counts once and is discarded up to its newline
+
+    With batch=True it emits one RECORDS Packet (a list of dicts) per chunk
+    instead, which keeps downstream batch processors free of per-record Packets.
+    """
+    def __init__(
+            self,
+            decoder: Optional[JsonDecoder] = None,
+            on_malformed: Union[str, MalformedHandler] = "skip",
+            batch: bool = False,
+            max_line_size: int = 16 * 1024 * 1024
+    ) -> None:
+        """
+        :param decoder: Callable decoding one line (defaults to orjson.loads / json.loads).
+        :param on_malformed: 'skip', 'raise', or a callable receiving (line, error).
+        :param batch: Emit one RECORDS Packet per chunk instead of one DICT Packet per line.
+        :param max_line_size: Upper bound (bytes) for a carried partial line.
+        """
+        if not callable(on_malformed) and on_malformed not in ("skip", "raise"):
+            raise ValueError(f"on_malformed must be 'skip', 'raise' or a callable, got: {on_malformed!r}")
+
+        self._decoder = decoder or default_decoder()
+        self._on_malformed = on_malformed
+        self._batch = batch
+        self._max_line_size = max_line_size
+
+        self._carry = b""
+        self._discarding = False    # Inside an oversized line: skip up to the next newline
+        self._last: Optional[Packet] = None
+        self.malformed_count = 0
+
+    # --- IDENTITY & HANDSHAKE ---
+
+    @property
+    def name(self) -> str:
+        return "jsonl_decoder"
+
+    @property
+    def input_subject(self) -> PayloadType:
+        return PayloadSubject.BYTES
+
+    @property
+    def output_subject(self) -> PayloadType:
+        return PayloadSubject.RECORDS if self._batch else PayloadSubject.DICT
+
+    # --- LIFECYCLE ---
+
+    def open(self) -> None:
+        self._carry = b""
+        self._discarding = False
+        self._last = None
+        self.malformed_count = 0
+
+    # --- TRANSFORMATION ---
+
+    def process(self, packet: Packet) -> Iterator[Packet]:
+        self._last = packet
+        return self._emit(packet, self._frame(self._as_bytes(packet.payload)))
+
+    def process_batch(self, packets: List[Packet]) -> Iterator[Packet]:
+        # One split + decode pass over the whole batch
+        self._last = packets[-1]
+        buffer = b"".join([self._as_bytes(packet.payload) for packet in packets])
+        return self._emit(packets[-1], self._frame(buffer))
+
+    def flush(self) -> Iterator[Packet]:
+        tail, self._carry = self._carry, b""
+        self._discarding = False
+        if self._last is None or not tail.strip():
+            return iter(())
+        return self._emit(self._last, self._decode([tail]))
+
+    # --- CHECKPOINT ---
+
+    def snapshot(self) -> Any:
+        return self._carry, self._discarding, self._last, self.malformed_count
+
+    def restore(self, state: Any) -> None:
+        self._carry, self._discarding, self._last, self.malformed_count = state
+
+    # --- Private Helpers ---
+
+    @staticmethod
+    def _as_bytes(payload: Any) -> bytes:
+        # TEXT read modes deliver str chunks
+        return payload.encode("utf-8") if isinstance(payload, str) else payload
+
+    def _frame(self, chunk: bytes) -> List[Any]:
+        """Splits carry + chunk into complete lines, keeps the remainder, decodes."""
+        if self._discarding:
+            # The rest of an oversized line (already counted as malformed)
+            newline = chunk.find(b"\n")
+            if newline == -1:
+                return []
+            chunk = chunk[newline + 1:]
+            self._discarding = False
+
+        lines = (self._carry + chunk).split(b"\n") if self._carry else chunk.split(b"\n")
+        self._carry = lines.pop()
+
+        if len(self._carry) > self._max_line_size:
+            oversized, self._carry = self._carry, b""
+            self._discarding = True
+            self._malformed(oversized[:256], ValueError(f"Line exceeds max_line_size ({self._max_line_size} bytes)"))
+
+        return self._decode(lines)
+
+    def _decode(self, lines: List[bytes]) -> List[Any]:
+        decoder = self._decoder
+        records = []
+        for line in lines:
+            if not line or line.isspace():
+                continue
+            try:
+                records.append(decoder(line))
+            except ValueError as e:  # json.JSONDecodeError and orjson.JSONDecodeError
+                self._malformed(line, e)
+        return records
+
+    def _malformed(self, line: bytes, error: Exception) -> None:
+        self.malformed_count += 1
+        if self._on_malformed == "raise":
+            raise ValueError(f"Malformed JSON line: {line[:120]!r}") from error
+        if callable(self._on_malformed):
+            self._on_malformed(line, error)
+
+    def _emit(self, origin: Packet, records: List[Any]) -> Iterator[Packet]:
+        if not records:
+            return iter(())
+        if self._batch:
+            return iter((origin.spawn(
+                records,
+                subject=PayloadSubject.RECORDS,
+                signal=FlowSignal.STREAM_DATA,
+                completeness=Completeness.BULK
+            ),))
+        return (
+            origin.spawn(record, subject=PayloadSubject.DICT, signal=FlowSignal.STREAM_DATA, completeness=Completeness.COMPLETE)
+            for record in records
+        )
@@ -0,0 +1,248 @@
+# src/infrastructure/processors/sort.py
+import heapq
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+from operator import itemgetter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterator, List, Optional, Tuple, Union
+
+from src.app.domain.models.packet import FlowSignal, Packet, PayloadSubject, PayloadType
+from src.app.ports.output.middleware_processor import MiddlewareProcessor
+
+if TYPE_CHECKING:
+    from src.app.use_cases.memory import MemoryGovernor, Reservation
+
+# Extracts the sort key from a payload
+SortKey = Callable[[Any], Any]
+
+# (sort_key, payload)
+SortEntry = Tuple[Any, Any]
+
+_FIRST = itemgetter(0)
+
+# Largest block by which the buffer grows its memory reservation
+RESERVE_BLOCK = 1024 * 1024
+
+
+def estimate_size(payload: Any) -> int:
+    """Cheap, shallow estimate (bytes) of a payload's memory footprint."""
+    if isinstance(payload, dict):
+        return sys.getsizeof(payload) + sum(sys.getsizeof(value) for value in payload.values())
+    return sys.getsizeof(payload)
+
+
+class ExternalSort(MiddlewareProcessor):
+    """
+    External-Memory Sort (N:N, emits on flush).
+
+    - Buffers payloads until 'memory_limit' is reached, then sorts the buffer and
+      spills it as a sorted run (pickle stream) under 'spill_dir'
+    - On STREAM_END / exhaustion, k-way merges the runs with heapq.merge and
+      emits the payloads in key order; nothing is spilled if the data fits
+    - Stable: equal keys keep their arrival order (runs are merged oldest-first)
+    - Bounded fan-in: at most 'fan_in' runs are open at once; older runs are
+      pre-merged into larger runs when more exist
+    - Memory budget: once bound to a MemoryGovernor, the buffer is reserved
+      against it block by block; a denied block or memory pressure spills the
+      run early, before 'memory_limit' is reached
+
+    Point 'spill_dir' at a registered anchor to keep scratch data inside the
+    catalog, e.g. spill_dir=client.resolve("posix://scratch/sort").
+    """
+    def __init__(
+            self,
+            key: Optional[SortKey] = None,
+            memory_limit: int = 64 * 1024 * 1024,
+            spill_dir: Union[str, os.PathLike, None] = None,
+            fan_in: int = 64,
+            reverse: bool = False,
+            subject: PayloadType = PayloadSubject.DICT,
+            sizeof: Callable[[Any], int] = estimate_size
+    ) -> None:
+        """
+        :param key: Sort key over the payload (defaults to the payload itself).
+        :param memory_limit: Approximate in-memory budget (bytes) before a run is spilled.
+        :param spill_dir: Parent directory of the run files (defaults to the system temp dir).
+        :param fan_in: Maximum number of runs merged at once (>= 2).
+        :param reverse: Sort in descending order.
+        :param subject: PayloadType consumed and emitted.
+        :param sizeof: Payload size estimator used against memory_limit.
+        """
+        if fan_in < 2:
+            raise ValueError(f"fan_in must be >= 2, got: {fan_in}")
+
+        self._key = key or (lambda payload: payload)
+        self._memory_limit = memory_limit
+        self._spill_root = Path(spill_dir) if spill_dir is not None else None
+        self._fan_in = fan_in
+        self._reverse = reverse
+        self._subject = subject
+        self._sizeof = sizeof
+
+        self._buffer: List[SortEntry] = []
+        self._buffered_bytes = 0
+        self._runs: List[Path] = []
+        self._workdir: Optional[Path] = None
+        self._last: Optional[Packet] = None
+        self._governor: Optional['MemoryGovernor'] = None
+        self._reservation: Optional['Reservation'] = None
+        self.spilled_runs = 0
+
+    # --- IDENTITY & HANDSHAKE ---
+
+    @property
+    def name(self) -> str:
+        return "external_sort"
+
+    @property
+    def input_subject(self) -> PayloadType:
+        return self._subject
+
+    @property
+    def output_subject(self) -> PayloadType:
+        return self._subject
+
+    # --- LIFECYCLE ---
+
+    def bind_memory(self, governor: 'MemoryGovernor') -> None:
+        self._governor = governor
+
+    def open(self) -> None:
+        self._reset()
+        self.spilled_runs = 0
+        if self._governor is not None:
+            self._reservation = self._governor.reserve(self.name)
+
+    def close(self) -> None:
+        self._reset()
+        self._reservation = None
+        if self._workdir is not None:
+            shutil.rmtree(self._workdir, ignore_errors=True)
+            self._workdir = None
+
+    # --- TRANSFORMATION ---
+
+    def process(self, packet: Packet) -> Iterator[Packet]:
+        self._last = packet
+        payload = packet.payload
+        self._buffer.append((self._key(payload), payload))
+        self._buffered_bytes += self._sizeof(payload)
+        if self._buffered_bytes >= self._memory_limit:
+            self._spill()
+        elif self._reservation is not None and self._buffered_bytes > self._reservation.size:
+            self._reserve()
+        return iter(())
+
+    def flush(self) -> Iterator[Packet]:
+        origin = self._last
+        if origin is None:
+            return
+
+        if not self._runs:
+            # Fits in memory: no I/O at all
+            self._buffer.sort(key=_FIRST, reverse=self._reverse)
+            entries, self._buffer, self._buffered_bytes = self._buffer, [], 0
+            self._release()
+            for _, payload in entries:
+                yield origin.spawn(payload, subject=self._subject, signal=FlowSignal.STREAM_DATA)
+        else:
+            self._spill()
+            self._reduce_runs(self._fan_in)
+            runs, self._runs = self._runs, []
+            try:
+                for _, payload in self._merge(runs):
+                    yield origin.spawn(payload, subject=self._subject, signal=FlowSignal.STREAM_DATA)
+            finally:
+                for run in runs:
+                    run.unlink(missing_ok=True)
+        self._last = None
+
+    # --- CHECKPOINT ---
+
+    @property
+    def checkpointable(self) -> bool:
+        # The state is the whole input so far (spilled runs are scratch files)
+        return False
+
+    def snapshot(self) -> Any:
+        raise RuntimeError(f"'{self.name}' cannot be checkpointed: checkpoint the pipeline before or after the sort.")
+
+    # --- Private Helpers ---
+
+    def _reset(self) -> None:
+        for run in self._runs:
+            run.unlink(missing_ok=True)
+        self._runs = []
+        self._buffer = []
+        self._buffered_bytes = 0
+        self._last = None
+        self._release()
+
+    def _reserve(self) -> None:
+        """Grows the reservation by one block; spills instead when denied or under pressure."""
+        reservation, block = self._reservation, min(RESERVE_BLOCK, self._memory_limit)
+        if not reservation.size:
+            # The first block is the minimum run size (no runs of a single payload)
+            reservation.resize(block, force=True)
+        elif self._governor.pressured or not reservation.resize(reservation.size + block):
+            self._governor.forced_spills += 1
+            self._spill()
+
+    def _release(self) -> None:
+        if self._reservation is not None:
+            self._reservation.release()
+
+    def _spill(self) -> None:
+        """Sorts the buffer and writes it as a new run."""
+        if not self._buffer:
+            return
+        self._buffer.sort(key=_FIRST, reverse=self._reverse)
+        self._runs.append(self._write_run(self._buffer))
+        self._buffer, self._buffered_bytes = [], 0
+        self._release()
+        self.spilled_runs += 1
+
+        # Keep the number of runs (open files at merge time) bounded as we go
+        if len(self._runs) >= 2 * self._fan_in:
+            self._reduce_runs(self._fan_in)
+
+    def _reduce_runs(self, limit: int) -> None:
+        """Pre-merges the oldest runs until at most 'limit' remain (keeps stability)."""
+        while len(self._runs) > limit:
+            oldest, rest = self._runs[:self._fan_in], self._runs[self._fan_in:]
+            merged = self._write_run(self._merge(oldest))
+            for run in oldest:
+                run.unlink(missing_ok=True)
+            self._runs = [merged] + rest
+
+    def _merge(self, runs: List[Path]) -> Iterator[SortEntry]:
+        # heapq.merge resolves ties in favour of earlier iterables (older runs)
+        return heapq.merge(*(self._read_run(run) for run in runs), key=_FIRST, reverse=self._reverse)
+
+    def _write_run(self, entries) -> Path:
+        if self._workdir is None:
+            if self._spill_root is not None:
+                self._spill_root.mkdir(parents=True, exist_ok=True)
+            self._workdir = Path(tempfile.mkdtemp(prefix="streamflow-sort-", dir=self._spill_root))
+
+        descriptor, name = tempfile.mkstemp(suffix=".run", dir=self._workdir)
+        with os.fdopen(descriptor, "wb", buffering=1024 * 1024) as handle:
+            pickler = pickle.Pickler(handle, protocol=pickle.HIGHEST_PROTOCOL)
+            for entry in entries:
+                pickler.dump(entry)
+                # Without this, the memo would keep every spilled object alive
+                pickler.clear_memo()
+        return Path(name)
+
+    @staticmethod
+    def _read_run(path: Path) -> Iterator[SortEntry]:
+        with open(path, "rb", buffering=1024 * 1024) as handle:
+            unpickler = pickle.Unpickler(handle)
+            while True:
+                try:
+                    yield unpickler.load()
+                except EOFError:
+                    return
@@ -0,0 +1,464 @@
+# src/infrastructure/processors/window.py
+import heapq
+import math
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+
+from src.app.domain.models.packet import FlowSignal, Packet, PayloadSubject, PayloadType
+from src.app.ports.output.middleware_processor import MiddlewareProcessor
+
+# Extracts the event time (seconds, any epoch) from a payload
+TimestampFunction = Callable[[Any], float]
+
+# Extracts the grouping key from a payload
+KeyFunction = Callable[[Any], Hashable]
+
+# ("count",) | ("sum"|"min"|"max"|"mean", field) | ("quantile", field, q)
+AggregateSpec = Tuple[Any, ...]
+
+# (key, window_start) identifies one open window
+WindowId = Tuple[Hashable, float]
+
+_FIELD_AGGREGATES = ("sum", "min", "max", "mean", "quantile")
+
+
+class LogHistogram:
+    """
+    Approximate quantiles with bounded memory.
+
+    Values are counted in logarithmic buckets (relative width 2 * 'precision'),
+    so any reported quantile is within 'precision' of a true sample value and
+    the number of buckets grows with the dynamic range, not with the sample count.
+    """
+    __slots__ = ("_base", "_log_base", "_positive", "_negative", "_zeros", "count")
+
+    def __init__(self, precision: float = 0.01) -> None:
+        self._base = (1 + precision) / (1 - precision)
+        self._log_base = math.log(self._base)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self._zeros = 0
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        if value == 0:
+            self._zeros += 1
+            return
+        buckets = self._positive if value > 0 else self._negative
+        index = math.ceil(math.log(abs(value)) / self._log_base)
+        buckets[index] = buckets.get(index, 0) + 1
+
+    def merge(self, other: 'LogHistogram') -> None:
+        """Adds the counts of another histogram of the same precision."""
+        for index, count in other._positive.items():
+            self._positive[index] = self._positive.get(index, 0) + count
+        for index, count in other._negative.items():
+            self._negative[index] = self._negative.get(index, 0) + count
+        self._zeros += other._zeros
+        self.count += other.count
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        # Ascending order: most negative, zeros, then positives
+        for index in sorted(self._negative, reverse=True):
+            seen += self._negative[index]
+            if seen > rank:
+                return -self._value(index)
+        seen += self._zeros
+        if seen > rank:
+            return 0.0
+        for index in sorted(self._positive):
+            seen += self._positive[index]
+            if seen > rank:
+                return self._value(index)
+        return self._value(max(self._positive)) if self._positive else 0.0
+
+    def _value(self, index: int) -> float:
+        # Midpoint of the bucket (base^(i-1), base^i]
+        return 2 * self._base ** index / (self._base + 1)
+
+
+class _Accumulator:
+    """Running aggregates for one window."""
+    __slots__ = ("count", "counts", "sums", "mins", "maxs", "histograms", "last_time", "partial")
+
+    def __init__(self, fields: Sequence[str], quantile_fields: Sequence[str], precision: float) -> None:
+        self.count = 0
+        self.counts = dict.fromkeys(fields, 0)
+        self.sums = dict.fromkeys(fields, 0)
+        self.mins: Dict[str, Any] = dict.fromkeys(fields)
+        self.maxs: Dict[str, Any] = dict.fromkeys(fields)
+        self.histograms = {field: LogHistogram(precision) for field in quantile_fields}
+        self.last_time = -math.inf
+        self.partial = False    # Re-opened after an earlier part of it was evicted
+
+    def add(self, payload: Any, event_time: float) -> None:
+        self.count += 1
+        self.last_time = max(self.last_time, event_time)
+        for field in self.sums:
+            value = payload.get(field)
+            if value is None:
+                continue
+            self.counts[field] += 1
+            self.sums[field] += value
+            if self.mins[field] is None or value < self.mins[field]:
+                self.mins[field] = value
+            if self.maxs[field] is None or value > self.maxs[field]:
+                self.maxs[field] = value
+            histogram = self.histograms.get(field)
+            if histogram is not None:
+                histogram.add(value)
+
+    def merge(self, other: '_Accumulator') -> None:
+        """Folds another window's aggregates into this one (merging sessions)."""
+        self.count += other.count
+        self.last_time = max(self.last_time, other.last_time)
+        self.partial = self.partial or other.partial
+        for field in self.sums:
+            self.counts[field] += other.counts[field]
+            self.sums[field] += other.sums[field]
+            if other.mins[field] is not None and (self.mins[field] is None or other.mins[field] < self.mins[field]):
+                self.mins[field] = other.mins[field]
+            if other.maxs[field] is not None and (self.maxs[field] is None or other.maxs[field] > self.maxs[field]):
+                self.maxs[field] = other.maxs[field]
+        for field, histogram in self.histograms.items():
+            histogram.merge(other.histograms[field])
+
+
+class WindowAggregator(MiddlewareProcessor):
+    """
+    Event-time Windowed Aggregation (DICT -> DICT).
+
+    Window kinds:
+    - 'tumbling': fixed, non-overlapping windows of 'size'
+    - 'sliding':  windows of 'size' starting every 'slide'
+    - 'session':  per-key activity bursts separated by more than 'gap'
+
+    Aggregates (output name -> spec):
+        {"n": ("count",), "total": ("sum", "amount"), "p95": ("quantile", "latency", 0.95)}
+    'min', 'max' and 'mean' work like 'sum'; quantiles are approximate (LogHistogram).
+
+    Time & Completeness:
+    - The watermark is the highest event time seen minus 'allowed_lateness'
+    - A window is emitted as soon as the watermark passes its end
+    - Events whose window ends at or before the watermark are counted in 'late_count'
+      and dropped (for sessions: events whose own session, event_time + gap, ends at or
+      before the watermark and that fall into no open session)
+    - An event within 'gap' of two open sessions of its key merges them
+    - emit_watermarks=True also yields {"watermark": t} whenever it advances
+
+    Bounded State: at most 'max_open_windows' are kept; beyond that the oldest
+    window is emitted early (flagged "evicted": True). Later events of an evicted
+    window re-open it, and that second, also partial result is flagged the same way.
+    flush() emits every open window.
+    """
+    def __init__(
+            self,
+            timestamp: TimestampFunction,
+            aggregates: Dict[str, AggregateSpec],
+            window: str = "tumbling",
+            size: float = 60.0,
+            slide: Optional[float] = None,
+            gap: Optional[float] = None,
+            key: Optional[KeyFunction] = None,
+            allowed_lateness: float = 0.0,
+            max_open_windows: int = 100_000,
+            emit_watermarks: bool = False,
+            precision: float = 0.01
+    ) -> None:
+        """
+        :param timestamp: Event time extractor over the payload.
+        :param aggregates: Output name -> aggregate spec.
+        :param window: 'tumbling', 'sliding' or 'session'.
+        :param size: Window length (tumbling/sliding).
+        :param slide: Distance between sliding window starts.
+        :param gap: Inactivity gap closing a session.
+        :param key: Optional grouping key over the payload.
+        :param allowed_lateness: How far the watermark trails the highest event time.
+        :param max_open_windows: Upper bound of windows held in memory.
+        :param emit_watermarks: Also emit watermark Packets.
+        :param precision: Relative error of approximate quantiles.
+        """
+        if window not in ("tumbling", "sliding", "session"):
+            raise ValueError(f"Unsupported window: '{window}'. Use 'tumbling', 'sliding' or 'session'.")
+        if window == "sliding" and not (slide and 0 < slide <= size):
+            raise ValueError("Sliding windows require 0 < slide <= size.")
+        if window == "session" and not (gap and gap > 0):
+            raise ValueError("Session windows require gap > 0.")
+        for output, spec in aggregates.items():
+            if not spec or spec[0] not in ("count",) + _FIELD_AGGREGATES:
+                raise ValueError(f"Unsupported aggregate for '{output}': {spec!r}")
+
+        self._timestamp = timestamp
+        self._aggregates = dict(aggregates)
+        self._window = window
+        self._size = size
+        self._slide = slide
+        self._gap = gap
+        self._key = key
+        self._allowed_lateness = allowed_lateness
+        self._max_open_windows = max_open_windows
+        self._emit_watermarks = emit_watermarks
+        self._precision = precision
+
+        self._fields = sorted({spec[1] for spec in aggregates.values() if spec[0] in _FIELD_AGGREGATES})
+        self._quantile_fields = sorted({spec[1] for spec in aggregates.values() if spec[0] == "quantile"})
+        self._reset_state()
+
+    # --- IDENTITY & HANDSHAKE ---
+
+    @property
+    def name(self) -> str:
+        return f"{self._window}_window"
+
+    @property
+    def input_subject(self) -> PayloadType:
+        return PayloadSubject.DICT
+
+    @property
+    def output_subject(self) -> PayloadType:
+        return PayloadSubject.DICT
+
+    @property
+    def watermark(self) -> float:
+        return self._watermark
+
+    @property
+    def open_windows(self) -> int:
+        return len(self._windows)
+
+    # --- LIFECYCLE ---
+
+    def open(self) -> None:
+        self._reset_state()
+
+    # --- TRANSFORMATION ---
+
+    def process(self, packet: Packet) -> Iterator[Packet]:
+        self._last = packet
+        payload = packet.payload
+        event_time = self._timestamp(payload)
+        group = self._key(payload) if self._key is not None else None
+
+        # 1. ASSIGN: update every window the event belongs to
+        if self._window == "session":
+            self._add_to_session(group, payload, event_time)
+        else:
+            for start in self._window_starts(event_time):
+                if start + self._size <= self._watermark:
+                    self.late_count += 1
+                    continue
+                self._accumulator((group, start)).add(payload, event_time)
+
+        # 2. ADVANCE: move the watermark, close what it has passed, bound the state
+        results: List[Dict[str, Any]] = []
+        watermark = event_time - self._allowed_lateness
+        if watermark > self._watermark:
+            self._watermark = watermark
+            results.extend(self._close_until(watermark))
+            if self._emit_watermarks:
+                results.append({"watermark": watermark})
+
+        while len(self._windows) > self._max_open_windows:
+            window_id, accumulator = self._windows.popitem(last=False)
+            self._forget_session(window_id)
+            self._remember_eviction(window_id, accumulator)
+            results.append(self._result(window_id, accumulator, evicted=True))
+
+        return self._emit(packet, results)
+
+    def flush(self) -> Iterator[Packet]:
+        if self._last is None:
+            return iter(())
+        results = [self._result(window_id, accumulator) for window_id, accumulator in self._windows.items()]
+        self._windows.clear()
+        self._sessions.clear()
+        self._deadlines.clear()
+        self._evicted.clear()
+        return self._emit(self._last, results)
+
+    # --- CHECKPOINT ---
+
+    def snapshot(self) -> Any:
+        return (
+            self._windows, self._sessions, self._deadlines, self._evicted, self._tiebreak,
+            self._watermark, self._last, self.late_count
+        )
+
+    def restore(self, state: Any) -> None:
+        (
+            self._windows, self._sessions, self._deadlines, self._evicted, self._tiebreak,
+            self._watermark, self._last, self.late_count
+        ) = state
+
+    # --- Private Helpers ---
+
+    def _reset_state(self) -> None:
+        # Insertion order ~ creation order, which makes eviction "oldest first"
+        self._windows: "OrderedDict[WindowId, _Accumulator]" = OrderedDict()
+        self._sessions: Dict[Hashable, List[float]] = {}  # key -> starts of its open sessions
+        # Min-heap of (window_end, tiebreak, window_id); stale entries are skipped lazily
+        self._deadlines: List[Tuple[float, int, WindowId]] = []
+        # Evicted windows still ahead of the watermark: window_id (sessions: key) -> (start, end)
+        self._evicted: Dict[Hashable, Tuple[float, float]] = {}
+        self._tiebreak = 0
+        self._watermark = -math.inf
+        self._last: Optional[Packet] = None
+        self.late_count = 0
+
+    def _accumulator(self, window_id: WindowId) -> _Accumulator:
+        accumulator = self._windows.get(window_id)
+        if accumulator is None:
+            accumulator = _Accumulator(self._fields, self._quantile_fields, self._precision)
+            accumulator.partial = self._was_evicted(window_id)
+            self._windows[window_id] = accumulator
+            self._schedule(window_id, self._initial_end(window_id))
+        return accumulator
+
+    def _schedule(self, window_id: WindowId, end: float) -> None:
+        self._tiebreak += 1
+        heapq.heappush(self._deadlines, (end, self._tiebreak, window_id))
+
+    def _initial_end(self, window_id: WindowId) -> float:
+        # Sessions start with a single event: end = start + gap
+        return window_id[1] + (self._gap if self._window == "session" else self._size)
+
+    def _window_starts(self, event_time: float) -> List[float]:
+        if self._window == "tumbling":
+            return [math.floor(event_time / self._size) * self._size]
+        slide = self._slide
+        last = math.floor(event_time / slide)
+        first = math.floor((event_time - self._size) / slide) + 1
+        return [index * slide for index in range(first, last + 1)]
+
+    def _add_to_session(self, group: Hashable, payload: Any, event_time: float) -> None:
+        gap = self._gap
+        starts = self._sessions.get(group, [])
+        touched = [
+            start for start in starts
+            if start - gap <= event_time <= self._windows[(group, start)].last_time + gap
+        ]
+
+        # 1. NEW SESSION: unless it would already be over (emitted out of order)
+        if not touched:
+            if event_time + gap <= self._watermark:
+                self.late_count += 1
+                return
+            self._sessions.setdefault(group, []).append(event_time)
+            self._accumulator((group, event_time)).add(payload, event_time)
+            return
+
+        # 2. EXTEND: one session, not backwards (its deadline is re-checked lazily)
+        first = min(touched)
+        if len(touched) == 1 and event_time >= first:
+            self._windows[(group, first)].add(payload, event_time)
+            return
+
+        # 3. MERGE: backwards extensions re-key the session under its new start,
+        # and an event bridging several sessions folds them into the earliest
+        accumulator = self._windows.pop((group, first))
+        for start in touched:
+            if start != first:
+                accumulator.merge(self._windows.pop((group, start)))
+            starts.remove(start)
+        accumulator.add(payload, event_time)
+        start = min(first, event_time)
+        starts.append(start)
+        self._windows[(group, start)] = accumulator
+        self._schedule((group, start), accumulator.last_time + gap)
+
+    def _forget_session(self, window_id: WindowId) -> None:
+        if self._window != "session":
+            return
+        group, start = window_id
+        starts = self._sessions.get(group)
+        if starts is not None and start in starts:
+            starts.remove(start)
+            if not starts:
+                del self._sessions[group]
+
+    def _remember_eviction(self, window_id: WindowId, accumulator: _Accumulator) -> None:
+        # Kept until the watermark passes the window: later events of it re-open a partial window
+        start, end = window_id[1], self._window_end(window_id, accumulator)
+        key = window_id[0] if self._window == "session" else window_id
+        if key in self._evicted:
+            first, last = self._evicted[key]
+            start, end = min(start, first), max(end, last)
+        self._evicted[key] = (start, end)
+        if self._window == "session":
+            self._schedule(window_id, end)  # Its pending deadline may predate later extensions
+
+    def _was_evicted(self, window_id: WindowId) -> bool:
+        if self._window != "session":
+            return window_id in self._evicted
+        # A new session overlapping an evicted one of its key continues it
+        span = self._evicted.get(window_id[0])
+        return span is not None and span[0] - self._gap <= window_id[1] <= span[1]
+
+    def _forget_eviction(self, window_id: WindowId, watermark: float) -> None:
+        key = window_id[0] if self._window == "session" else window_id
+        span = self._evicted.get(key)
+        if span is not None and span[1] <= watermark:
+            del self._evicted[key]
+
+    def _window_end(self, window_id: WindowId, accumulator: _Accumulator) -> float:
+        if self._window == "session":
+            return accumulator.last_time + self._gap
+        return window_id[1] + self._size
+
+    def _close_until(self, watermark: float) -> List[Dict[str, Any]]:
+        deadlines = self._deadlines
+        results = []
+        while deadlines and deadlines[0][0] <= watermark:
+            _, _, window_id = heapq.heappop(deadlines)
+            accumulator = self._windows.get(window_id)
+            if accumulator is None:
+                self._forget_eviction(window_id, watermark)
+                continue  # already emitted (evicted / re-keyed)
+            end = self._window_end(window_id, accumulator)
+            if end > watermark:
+                self._schedule(window_id, end)  # session extended since scheduling
+                continue
+
+            del self._windows[window_id]
+            self._forget_session(window_id)
+            self._forget_eviction(window_id, watermark)
+            results.append(self._result(window_id, accumulator))
+        return results
+
+    def _result(self, window_id: WindowId, accumulator: _Accumulator, evicted: bool = False) -> Dict[str, Any]:
+        group, start = window_id
+        result: Dict[str, Any] = {
+            "window_start": start,
+            "window_end": self._window_end(window_id, accumulator),
+        }
+        if self._key is not None:
+            result["key"] = group
+        for output, spec in self._aggregates.items():
+            kind = spec[0]
+            if kind == "count":
+                result[output] = accumulator.count
+            elif kind == "sum":
+                result[output] = accumulator.sums[spec[1]]
+            elif kind == "min":
+                result[output] = accumulator.mins[spec[1]]
+            elif kind == "max":
+                result[output] = accumulator.maxs[spec[1]]
+            elif kind == "mean":
+                counted = accumulator.counts[spec[1]]
+                result[output] = accumulator.sums[spec[1]] / counted if counted else None
+            else:
+                result[output] = accumulator.histograms[spec[1]].quantile(spec[2])
+        if evicted or accumulator.partial:
+            result["evicted"] = True
+        return result
+
+    def _emit(self, origin: Packet, results: List[Dict[str, Any]]) -> Iterator[Packet]:
+        return (
+            origin.spawn(result, subject=PayloadSubject.DICT, signal=FlowSignal.STREAM_DATA)
+            for result in results
+        )
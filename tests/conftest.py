@@ -0,0 +1,22 @@
+# tests/conftest.py
+import pytest
+
+from src.app import StreamClient
+from tests.support import write_records
+
+RECORDS = 1000
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """A 'posix://data' resource holding in.jsonl ({'id': 0..RECORDS-1})."""
+    write_records(tmp_path / "in.jsonl", RECORDS)
+    return tmp_path
+
+
+@pytest.fixture
+def client(data_dir):
+    client = StreamClient({"log_level": "NONE"})
+    client.add_resource("data", "posix", str(data_dir))
+    yield client
+    client.close()
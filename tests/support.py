@@ -0,0 +1,154 @@
+# tests/support.py
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from src.app.domain.models.packet import Packet, PayloadSubject
+from src.app.ports.output.middleware_processor import FilterProcessor, MapProcessor, MiddlewareProcessor
+
+
+class Encode(MapProcessor):
+    """DICT -> one JSON Lines record (BYTES)."""
+    name = "encode"
+    input_subject = PayloadSubject.DICT
+    output_subject = PayloadSubject.BYTES
+
+    def transform(self, payload: Any) -> Any:
+        return (json.dumps(payload) + "\n").encode()
+
+
+class Count(MiddlewareProcessor):
+    """Swallows every record and emits {'count': n} on flush()."""
+    name = "count"
+    input_subject = PayloadSubject.DICT
+    output_subject = PayloadSubject.DICT
+
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        self.seen = 0
+        self.flushed = 0
+        self._last: Optional[Packet] = None
+        self._delay = delay
+        self._fail = fail
+
+    def process(self, packet: Packet) -> Iterator[Packet]:
+        self.seen += 1
+        self._last = packet
+        return iter(())
+
+    def flush(self) -> Iterator[Packet]:
+        self.flushed += 1
+        time.sleep(self._delay)
+        if self._fail:
+            raise ValueError("flush failed")
+        if self._last is not None:
+            yield self._last.spawn({"count": self.seen})
+
+
+class FailAfter(MiddlewareProcessor):
+    """Passes records through and raises once more than 'limit' went by (None: never)."""
+    name = "fail_after"
+    input_subject = PayloadSubject.DICT
+    output_subject = PayloadSubject.DICT
+
+    def __init__(self, limit: Optional[int]) -> None:
+        self.limit = limit
+        self.seen = 0
+
+    def process(self, packet: Packet) -> Iterator[Packet]:
+        self.seen += 1
+        if self.limit is not None and self.seen > self.limit:
+            raise ValueError(f"failed after {self.limit} records")
+        yield packet
+
+    def flush(self) -> Iterator[Packet]:
+        yield from ()
+
+
+class Jitter(MapProcessor):
+    """Tags the record with the worker pid; every 7th record is slow (scrambles completion order)."""
+    name = "jitter"
+    input_subject = PayloadSubject.DICT
+    output_subject = PayloadSubject.DICT
+
+    def transform(self, payload: Any) -> Any:
+        if payload["id"] % 7 == 0:
+            time.sleep(0.002)
+        return {**payload, "pid": os.getpid()}
+
+
+class Square(MapProcessor):
+    name = "square"
+    input_subject = PayloadSubject.DICT
+    output_subject = PayloadSubject.DICT
+
+    def transform(self, payload: Any) -> Any:
+        return {**payload, "square": payload["id"] ** 2}
+
+
+class Even(FilterProcessor):
+    name = "even"
+    input_subject = PayloadSubject.DICT
+
+    def accept(self, payload: Any) -> bool:
+        return payload["id"] % 2 == 0
+
+
+class CountByKey(MiddlewareProcessor):
+    """Counts records per payload['key'] and emits {'key': k, 'count': n, 'ids': [...]} on flush()."""
+    name = "count_by_key"
+    input_subject = PayloadSubject.DICT
+    output_subject = PayloadSubject.DICT
+
+    def __init__(self) -> None:
+        self._ids: Dict[Any, List[int]] = {}
+        self._last: Optional[Packet] = None
+
+    def process(self, packet: Packet) -> Iterator[Packet]:
+        self._last = packet
+        self._ids.setdefault(packet.payload["key"], []).append(packet.payload["id"])
+        return iter(())
+
+    def flush(self) -> Iterator[Packet]:
+        for key, ids in self._ids.items():
+            yield self._last.spawn({"key": key, "count": len(ids), "ids": ids})
+        self._ids.clear()
+
+
+class ExitSpy(MiddlewareProcessor):
+    """Passes records through and records the exception type every __exit__ receives."""
+    name = "exit_spy"
+    input_subject = PayloadSubject.DICT
+    output_subject = PayloadSubject.DICT
+
+    def __init__(self) -> None:
+        self.exits: List[Optional[type]] = []
+
+    def process(self, packet: Packet) -> Iterator[Packet]:
+        yield packet
+
+    def flush(self) -> Iterator[Packet]:
+        yield from ()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.exits.append(exc_type)
+        super().__exit__(exc_type, exc_val, exc_tb)
+
+
+def payloads(pipeline, **engine) -> List[Any]:
+    return [packet.payload for packet in pipeline.stream(**engine)]
+
+
+def write_records(path: Path, count: int) -> Path:
+    with open(path, "w") as handle:
+        for index in range(count):
+            handle.write(json.dumps({"id": index}) + "\n")
+    return path
+
+
+def read_records(path: Path) -> List[dict]:
+    if not path.exists():
+        return []
+    with open(path) as handle:
+        return [json.loads(line) for line in handle if line.strip()]
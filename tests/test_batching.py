@@ -0,0 +1,52 @@
+# tests/test_batching.py
+import pytest
+
+from src.app.use_cases.pipeline import PipelineError
+from src.infrastructure.processors import JsonLinesDecoder
+from tests.conftest import RECORDS
+from tests.support import Count, Square, payloads
+
+
+class Sizes(Square):
+    """Records the size of every process_batch() call."""
+    name = "sizes"
+
+    def __init__(self, fail_at=None):
+        self.sizes = []
+        self.fail_at = fail_at
+
+    def process_batch(self, packets):
+        self.sizes.append(len(packets))
+        if self.fail_at is not None and any(packet.payload["id"] == self.fail_at for packet in packets):
+            raise ValueError("bad batch")
+        return iter([packet.spawn(self.transform(packet.payload)) for packet in packets])
+
+
+def pipeline(client, *stages, chunk_size=4096):
+    built = client.pipeline("posix://data/in.jsonl", chunk_size=chunk_size).pipe(JsonLinesDecoder())
+    for stage in stages:
+        built = built.pipe(stage)
+    return built
+
+
+@pytest.mark.parametrize("threaded", [False, True])
+def test_batched_run_matches_the_per_packet_run(client, threaded):
+    batched = payloads(pipeline(client, Square(), Count()), batch_size=32, threaded=threaded)
+    plain = payloads(pipeline(client, Square(), Count()), threaded=threaded)
+    assert batched == plain == [{"count": RECORDS}]
+
+
+def test_process_batch_is_called_once_per_upstream_batch(client):
+    stage = Sizes()
+    output = payloads(pipeline(client, stage, chunk_size=256), batch_size=8, fuse=False)
+
+    assert [record["square"] for record in output] == [i * i for i in range(RECORDS)]
+    # 256-byte chunks, 8 per batch: each call receives the records decoded from ~2 KB
+    assert sum(stage.sizes) == RECORDS
+    assert 1 < len(stage.sizes) < RECORDS // 10
+
+
+def test_batch_failure_names_the_stage(client):
+    with pytest.raises(PipelineError, match="while processing a batch") as failure:
+        payloads(pipeline(client, Sizes(fail_at=500)), batch_size=32, fuse=False)
+    assert failure.value.stage == "sizes"
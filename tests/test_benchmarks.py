@@ -0,0 +1,64 @@
+# tests/test_benchmarks.py
+import json
+
+import pytest
+
+from benchmarks.suite import compare, load, main, metric, run_suite, save
+
+
+def document(**results):
+    return {"meta": {"python": "3", "groups": ["packet"], "size_mb": 1, "runs": 1}, "results": results}
+
+
+def test_compare_follows_the_direction_of_each_metric():
+    baseline = document(
+        latency=metric(100.0, "ns/op", "lower"),
+        speed=metric(100.0, "MB/s", "higher"),
+        steady=metric(100.0, "ms", "lower"),
+        dropped=metric(1.0, "ms", "lower"),
+    )
+    current = document(
+        latency=metric(120.0, "ns/op", "lower"),
+        speed=metric(120.0, "MB/s", "higher"),
+        steady=metric(105.0, "ms", "lower"),
+        added=metric(1.0, "ms", "lower"),
+    )
+    rows = {row["name"]: row for row in compare(baseline, current, threshold=10.0)}
+
+    assert rows["latency"]["status"] == "regression" and rows["latency"]["change"] == -20.0
+    assert rows["speed"]["status"] == "improved" and rows["speed"]["change"] == 20.0
+    assert rows["steady"]["status"] == "ok"
+    assert rows["dropped"]["status"] == "missing"
+    assert rows["added"]["status"] == "new"
+
+
+def test_save_and_load_round_trip(tmp_path):
+    stored = document(latency=metric(1.5, "ns/op", "lower"))
+    path = save(stored, tmp_path / "nested" / "base.json")
+
+    assert load(str(path)) == stored
+    assert not path.with_name("base.json.tmp").exists()
+
+
+@pytest.mark.parametrize("value, code", [(100.0, 0), (105.0, 0), (150.0, 1)])
+def test_compare_command_exits_on_regression(tmp_path, capsys, value, code):
+    baseline = save(document(latency=metric(100.0, "ns/op", "lower")), tmp_path / "baseline.json")
+    current = save(document(latency=metric(value, "ns/op", "lower")), tmp_path / "current.json")
+
+    assert main(["compare", str(baseline), str(current), "--threshold", "10"]) == code
+    assert ("[FAIL]" in capsys.readouterr().out) == bool(code)
+
+
+def test_run_stores_a_baseline_document(tmp_path, capsys):
+    path = tmp_path / "packet.json"
+    assert main(["run", "--only", "packet", "--size-mb", "1", "--runs", "1", "--output", str(path)]) == 0
+
+    stored = json.loads(path.read_text())
+    assert stored["meta"]["groups"] == ["packet"]
+    assert stored["results"]
+    assert all({"value", "unit", "better"} <= set(result) for result in stored["results"].values())
+
+
+def test_unknown_group_is_rejected():
+    with pytest.raises(ValueError, match="Unknown benchmark groups"):
+        run_suite(["nope"])
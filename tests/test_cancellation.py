@@ -0,0 +1,24 @@
+# tests/test_cancellation.py
+import pytest
+
+from src.app.use_cases.pipeline import PipelineError
+from src.infrastructure.processors import JsonLinesDecoder
+from tests.support import Count, Encode, FailAfter, read_records
+
+
+@pytest.mark.parametrize("engine", [{}, {"threaded": True}, {"threaded": True, "batch_size": 16}])
+def test_failed_run_does_not_flush_downstream_stages(client, data_dir, engine):
+    count = Count()
+    pipeline = (
+        client.pipeline("posix://data/in.jsonl", chunk_size=256)
+        .pipe(JsonLinesDecoder())
+        .pipe(FailAfter(100))
+        .pipe(count)
+        .pipe(Encode())
+        .write("posix://data/out.jsonl")
+    )
+    with pytest.raises(PipelineError):
+        pipeline.run(**engine)
+
+    assert count.flushed == 0
+    assert read_records(data_dir / "out.jsonl") == []
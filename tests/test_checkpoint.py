@@ -0,0 +1,116 @@
+# tests/test_checkpoint.py
+import pytest
+
+from src.app.use_cases.pipeline import PipelineError
+from src.infrastructure.processors import Deduplicator, ExternalSort, JsonLinesDecoder
+from tests.conftest import RECORDS
+from tests.support import Encode, FailAfter, read_records
+
+
+def build(client, data_dir, limit, interval=100):
+    return (
+        client.pipeline("posix://data/in.jsonl", chunk_size=256)
+        .pipe(JsonLinesDecoder())
+        .pipe(FailAfter(limit))
+        .pipe(Encode())
+        .write("posix://data/out.jsonl")
+        .checkpoint(data_dir / "run.ckpt", interval=interval)
+        .build()
+    )
+
+
+def checkpointed(client, data_dir, stage):
+    return (
+        client.pipeline("posix://data/in.jsonl")
+        .pipe(JsonLinesDecoder())
+        .pipe(stage)
+        .pipe(Encode())
+        .write("posix://data/out.jsonl")
+        .checkpoint(data_dir / "run.ckpt", interval=100)
+    )
+
+
+def test_rerun_after_crash_resumes_from_the_last_checkpoint(client, data_dir):
+    with pytest.raises(PipelineError):
+        build(client, data_dir, limit=650).run()
+    assert (data_dir / "run.ckpt").exists()
+    # Records written after the last checkpoint are still on disk at this point
+    assert len(read_records(data_dir / "out.jsonl")) >= 600
+
+    resumed = build(client, data_dir, limit=None)
+    resumed.run()
+
+    assert [record["id"] for record in read_records(data_dir / "out.jsonl")] == list(range(RECORDS))
+    assert resumed.checkpoint_stats.restored_from is not None
+    assert not (data_dir / "run.ckpt").exists()
+
+
+def test_completed_run_starts_the_next_one_from_scratch(client, data_dir):
+    build(client, data_dir, limit=None).run()
+    assert not (data_dir / "run.ckpt").exists()
+
+    again = build(client, data_dir, limit=None)
+    again.run()
+    assert again.checkpoint_stats.restored_from is None
+    assert len(read_records(data_dir / "out.jsonl")) == RECORDS
+
+
+def test_resume_rejects_a_different_pipeline(client, data_dir):
+    with pytest.raises(PipelineError):
+        build(client, data_dir, limit=650).run()
+
+    other = (
+        client.pipeline("posix://data/in.jsonl", chunk_size=256)
+        .pipe(JsonLinesDecoder())
+        .pipe(Encode())
+        .write("posix://data/out.jsonl")
+        .checkpoint(data_dir / "run.ckpt", interval=100)
+    )
+    with pytest.raises(ValueError, match="Checkpoint Error"):
+        other.run()
+
+
+def test_sink_seek_truncates_to_the_committed_offset(client, data_dir):
+    target = data_dir / "sink.txt"
+    target.write_bytes(b"committed|uncommitted")
+
+    handle = client.get_handle("posix://data/sink.txt", as_sink=True, file_mode="w")
+    assert handle.seek(len(b"committed|"))
+    with handle:
+        assert handle.tell() == len(b"committed|")
+    assert target.read_bytes() == b"committed|"
+
+
+def test_source_seek_skips_to_the_checkpointed_offset(client, data_dir):
+    data = (data_dir / "in.jsonl").read_bytes()
+    with client.get_handle("posix://data/in.jsonl", chunk_size=16) as handle:
+        chunks = handle.read()
+        next(chunks)
+        next(chunks)
+        offset = handle.tell()
+    assert offset == 32
+
+    handle = client.get_handle("posix://data/in.jsonl", chunk_size=16)
+    assert handle.seek(offset)
+    with handle:
+        assert next(iter(handle.read())).payload == data[32:48]
+
+
+@pytest.mark.parametrize("stage", [
+    lambda data_dir: ExternalSort(key=lambda payload: payload["id"]),
+    lambda data_dir: Deduplicator(key=lambda payload: payload["id"]),
+])
+def test_non_checkpointable_stage_is_rejected_before_the_run(client, data_dir, stage):
+    with pytest.raises(ValueError, match="cannot be checkpointed"):
+        checkpointed(client, data_dir, stage(data_dir)).run()
+    assert not (data_dir / "out.jsonl").exists()
+    assert not (data_dir / "run.ckpt").exists()
+
+
+@pytest.mark.parametrize("stage", [
+    lambda data_dir: Deduplicator(key=lambda payload: payload["id"], state_path=data_dir / "seen.db"),
+    lambda data_dir: Deduplicator(key=lambda payload: payload["id"], mode="bloom"),
+])
+def test_dedup_with_persistent_state_is_checkpointable(client, data_dir, stage):
+    assert checkpointed(client, data_dir, stage(data_dir)).run() == RECORDS
+    assert len(read_records(data_dir / "out.jsonl")) == RECORDS
@@ -0,0 +1,82 @@
+# tests/test_dead_letter.py
+import pytest
+
+from src.app.use_cases.pipeline import PipelineError
+from src.infrastructure.processors import JsonLinesDecoder
+from tests.conftest import RECORDS
+from tests.support import Encode, ExitSpy, FailAfter, Square, read_records
+
+
+class Picky(Square):
+    """Fails on every tenth record; with 'flaky', only on the first attempt."""
+    name = "picky"
+
+    def __init__(self, flaky: bool = False) -> None:
+        self.flaky = flaky
+        self.failed = set()
+
+    def transform(self, payload):
+        if payload["id"] % 10 == 0 and not (self.flaky and payload["id"] in self.failed):
+            self.failed.add(payload["id"])
+            raise ValueError(f"bad record {payload['id']}")
+        return super().transform(payload)
+
+
+def guarded(client, stage, **policy):
+    return (
+        client.pipeline("posix://data/in.jsonl")
+        .pipe(JsonLinesDecoder())
+        .pipe(stage, **policy)
+        .pipe(Encode())
+        .write("posix://data/out.jsonl")
+    )
+
+
+def test_default_policy_fails_the_run(client):
+    with pytest.raises(PipelineError) as failure:
+        guarded(client, Picky()).run()
+    assert failure.value.stage == "picky"
+
+
+@pytest.mark.parametrize("engine", [{}, {"threaded": True}, {"batch_size": 16}])
+def test_skip_drops_only_the_failing_records(client, data_dir, engine):
+    assert guarded(client, Picky(), on_error="skip").run(**engine) == RECORDS - RECORDS // 10
+    assert all(record["id"] % 10 for record in read_records(data_dir / "out.jsonl"))
+
+
+def test_retries_recover_transient_failures(client):
+    assert guarded(client, Picky(flaky=True), retries=1).run() == RECORDS
+
+
+def test_dead_letters_keep_payload_lineage_and_error(client, data_dir):
+    delivered = (
+        guarded(client, Picky(), on_error="dead_letter")
+        .dead_letter("posix://data/dead.jsonl", batch_size=7, buffer_size=5, spill_dir=str(data_dir))
+        .run()
+    )
+    dead = read_records(data_dir / "dead.jsonl")
+
+    assert delivered == RECORDS - RECORDS // 10
+    assert sorted(record["packet"]["payload"]["id"] for record in dead) == list(range(0, RECORDS, 10))
+    assert {record["stage"] for record in dead} == {"picky"}
+    assert dead[0]["error"]["type"] == "ValueError" and dead[0]["packet"]["trace_id"]
+
+
+def test_dead_letter_action_requires_a_queue(client):
+    with pytest.raises(ValueError, match="no DeadLetterQueue was given"):
+        guarded(client, Picky(), on_error="dead_letter").run()
+
+
+def test_guarded_stage_receives_the_failure(client):
+    spy = ExitSpy()
+    pipeline = (
+        client.pipeline("posix://data/in.jsonl")
+        .pipe(JsonLinesDecoder())
+        .pipe(spy, on_error="skip")
+        .pipe(FailAfter(100))
+        .pipe(Encode())
+        .write("posix://data/out.jsonl")
+    )
+    with pytest.raises(PipelineError):
+        pipeline.run()
+    assert spy.exits == [PipelineError]
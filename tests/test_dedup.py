@@ -0,0 +1,74 @@
+# tests/test_dedup.py
+import sqlite3
+
+import pytest
+
+from src.app.use_cases.pipeline import PipelineError
+from src.infrastructure.processors import Deduplicator, JsonLinesDecoder
+from src.infrastructure.processors.dedup import HashIndex, digest
+from tests.conftest import RECORDS
+from tests.support import Encode, FailAfter
+
+
+def run(client, data_dir, mode, limit=None, **engine):
+    return (
+        client.pipeline("posix://data/in.jsonl")
+        .pipe(JsonLinesDecoder())
+        .pipe(Deduplicator(lambda record: record["id"], mode=mode, state_path=data_dir / f"{mode}.state"))
+        .pipe(FailAfter(limit))
+        .pipe(Encode())
+        .write("posix://data/out.jsonl")
+        .run(**engine)
+    )
+
+
+@pytest.mark.parametrize("mode", ["exact", "bloom"])
+def test_successful_run_persists_seen_keys(client, data_dir, mode):
+    assert run(client, data_dir, mode) == RECORDS
+    assert run(client, data_dir, mode) == 0
+
+
+@pytest.mark.parametrize("mode", ["exact", "bloom"])
+@pytest.mark.parametrize("engine", [{}, {"threaded": True}, {"threaded": True, "batch_size": 16}])
+def test_failed_run_keeps_the_previous_state(client, data_dir, mode, engine):
+    with pytest.raises(PipelineError):
+        run(client, data_dir, mode, limit=100, **engine)
+
+    # None of the keys of the failed run were committed: every record is delivered again
+    assert run(client, data_dir, mode, **engine) == RECORDS
+
+
+def stored(path):
+    with sqlite3.connect(path) as connection:
+        return connection.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+
+def test_hash_index_commits_in_batches_but_rolls_back_the_run(tmp_path):
+    path = str(tmp_path / "index.sqlite")
+    index = HashIndex(path, batch_size=10)
+    assert index.add_many([digest(i) for i in range(15)]) == [True] * 15
+    assert all(index.add(digest(i)) for i in range(15, 20))
+    # The open transaction never holds a full batch: the first 15 keys are already durable
+    assert stored(path) == 15
+
+    index.rollback()
+    assert stored(path) == 0
+    assert index.add(digest(0))
+    index.commit()
+    index.close()
+    assert stored(path) == 1
+
+
+def test_hash_index_discards_the_keys_of_a_killed_run(tmp_path):
+    path = str(tmp_path / "index.sqlite")
+    index = HashIndex(path, batch_size=10)
+    index.add_many([digest(i) for i in range(5)])
+    index.commit()
+    index.add_many([digest(i) for i in range(5, 30)])
+    # Killed: no rollback(), no close()
+    index._connection.close()
+    index._undo.close()
+
+    reopened = HashIndex(path, batch_size=10)
+    assert reopened.add_many([digest(i) for i in range(30)]) == [False] * 5 + [True] * 25
+    reopened.close()
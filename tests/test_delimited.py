@@ -0,0 +1,71 @@
+# tests/test_delimited.py
+import csv
+import io
+import random
+
+import pytest
+
+from src.app.domain.models.packet import Packet
+from src.app.domain.models.streams.stream_context import StreamContext
+from src.infrastructure.processors import DelimitedDecoder
+
+
+def chunk(payload):
+    return Packet(payload, StreamContext("mem://in.csv", "mem://in.csv", "test"))
+
+
+def decode(data: bytes, size: int, decoder=None):
+    decoder = decoder or DelimitedDecoder()
+    decoder.open()
+    rows = []
+    for start in range(0, len(data), size):
+        rows.extend(packet.payload for packet in decoder.process(chunk(data[start:start + size])))
+    rows.extend(packet.payload for packet in decoder.flush())
+    return rows, decoder
+
+
+def expected(data: bytes):
+    return list(csv.DictReader(io.StringIO(data.decode(), newline="")))
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, 4096])
+def test_quote_inside_an_unquoted_field_is_a_literal_char(size):
+    lines = ["id,name,note"] + [f'{i},{i}" screen,"a, ""b""\nc"' for i in range(500)]
+    data = ("\n".join(lines) + "\n").encode()
+
+    rows, decoder = decode(data, size, DelimitedDecoder(max_record_size=1024))
+
+    assert rows == expected(data)
+    assert len(rows) == 500 and rows[0]["name"] == '0" screen'
+    assert decoder.malformed_count == 0
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_chunking_matches_the_csv_module(seed):
+    rng = random.Random(seed)
+    pieces = ["x", '"', '""', ",", "\n", "y z"]
+    fields = ["".join(rng.choice(pieces) for _ in range(rng.randint(0, 4))) for _ in range(600)]
+    # Quote every field that would otherwise change the row shape
+    fields = [f'"{f.replace(chr(34), chr(34) * 2)}"' if ("," in f or "\n" in f or f.startswith('"')) else f for f in fields]
+    lines = ["a,b,c"] + [",".join(fields[i:i + 3]) for i in range(0, len(fields), 3)]
+    data = ("\n".join(lines) + "\n").encode()
+
+    rows, decoder = decode(data, rng.randint(1, 40))
+
+    assert rows == expected(data)
+    assert decoder.malformed_count == 0
+
+
+def test_restore_resumes_inside_a_quoted_field():
+    data = b'id,note\n1,"multi\nline ""quoted"""\n2,3" wide\n'
+    first = DelimitedDecoder()
+    first.open()
+    rows = [packet.payload for packet in first.process(chunk(data[:16]))]
+
+    second = DelimitedDecoder()
+    second.open()
+    second.restore(first.snapshot())
+    rows += [packet.payload for packet in second.process(chunk(data[16:]))]
+    rows += [packet.payload for packet in second.flush()]
+
+    assert rows == expected(data)
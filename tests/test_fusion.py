@@ -0,0 +1,45 @@
+# tests/test_fusion.py
+import pytest
+
+from src.app.use_cases.pipeline import PipelineError
+from src.app.use_cases.pipeline.fusion import FusedProcessor
+from src.infrastructure.processors import JsonLinesDecoder
+from tests.conftest import RECORDS
+from tests.support import Count, Even, Square, payloads
+
+
+class Broken(Square):
+    name = "broken"
+
+    def transform(self, payload):
+        if payload["id"] == 10:
+            raise ValueError("bad record")
+        return payload
+
+
+def chain(client, *stages):
+    pipeline = client.pipeline("posix://data/in.jsonl").pipe(JsonLinesDecoder())
+    for stage in stages:
+        pipeline = pipeline.pipe(stage)
+    return pipeline
+
+
+def test_consecutive_map_and_filter_stages_are_fused(client):
+    orchestrator = chain(client, Even(), Square(), Count()).build()
+    assert [type(stage) for stage in orchestrator.stages][1:] == [FusedProcessor, Count]
+    assert orchestrator.stages[1].name == "even+square"
+    assert len(orchestrator.processors) == 4
+
+
+@pytest.mark.parametrize("engine", [{}, {"threaded": True}, {"batch_size": 16}])
+def test_fused_chain_matches_the_unfused_one(client, engine):
+    fused = payloads(chain(client, Even(), Square(), Even()), **engine)
+    plain = payloads(chain(client, Even(), Square(), Even()), fuse=False, **engine)
+    assert fused == plain
+    assert [record["square"] for record in fused] == [i * i for i in range(0, RECORDS, 2)]
+
+
+def test_failure_names_the_original_stage(client):
+    with pytest.raises(PipelineError) as failure:
+        payloads(chain(client, Even(), Broken(), Square()))
+    assert failure.value.stage == "broken"
@@ -0,0 +1,107 @@
+# tests/test_graph.py
+import pytest
+
+from src.app.domain.models.packet import PayloadSubject
+from src.app.ports.output.middleware_processor import FilterProcessor
+from src.app.use_cases.pipeline import HashJoin, PipelineError
+from src.infrastructure.processors import JsonLinesDecoder
+from tests.support import Count, Encode, FailAfter, read_records, write_records
+
+IN = "posix://data/in.jsonl"
+OUT = "posix://data/out.jsonl"
+
+
+class Where(FilterProcessor):
+    name = "where"
+    input_subject = PayloadSubject.DICT
+
+    def __init__(self, predicate) -> None:
+        self._predicate = predicate
+
+    def accept(self, payload) -> bool:
+        return self._predicate(payload)
+
+
+def join():
+    return HashJoin(lambda record: record["id"])
+
+
+@pytest.mark.parametrize("layout", [
+    lambda graph: graph.source("s", IN).join("j", "s", "s", join()),
+    lambda graph: graph.source("s", IN).stage("a", "s", []).stage("b", "s", []).join("j", "a", "b", join()),
+    lambda graph: graph.source("s", IN).route("r", "s", {PayloadSubject.DICT: "x"}, default="y").join("j", "r.x", "r.y", join()),
+    lambda graph: graph.source("s", IN).source("t", IN).merge("m", ["s", "t"]).join("j", "m", "t", join()),
+], ids=["same-node", "diamond", "route-ports", "merged-build"])
+def test_join_sides_sharing_an_upstream_are_rejected(client, layout):
+    graph = layout(client.graph()).sink("out", "j", OUT)
+    with pytest.raises(ValueError, match="join 'j' reads probe and build from a common upstream"):
+        graph.validate()
+
+
+def test_join_of_independent_sources_is_accepted(client):
+    graph = client.graph().source("s", IN).source("t", IN).stage("a", "s", []).join("j", "a", "t", join()).sink("out", "j", OUT)
+    assert graph.validate() == ["s", "t", "a", "j", "out"]
+
+
+def split(graph):
+    """dec -> a (id >= 900) / b (id < 900): both sides descend from 'dec'."""
+    return (
+        graph.source("s", IN)
+        .stage("dec", "s", [JsonLinesDecoder()])
+        .stage("a", "dec", [Where(lambda record: record["id"] >= 900)])
+        .stage("b", "dec", [Where(lambda record: record["id"] < 900)])
+    )
+
+
+def test_keyed_merge_of_a_shared_upstream_is_rejected(client):
+    graph = split(client.graph(queue_size=8)).merge("m", ["a", "b"], key=lambda record: record["id"]).sink("out", "m", OUT)
+    with pytest.raises(ValueError, match="merge 'm' reads 'a' and 'b' from a common upstream"):
+        graph.validate()
+
+
+def test_interleaving_merge_of_a_shared_upstream_runs(client, data_dir):
+    graph = split(client.graph(queue_size=8)).merge("m", ["a", "b"]).stage("enc", "m", [Encode()]).sink("out", "enc", OUT)
+    assert graph.run() == {"out": 1000}
+    assert sorted(record["id"] for record in read_records(data_dir / "out.jsonl")) == list(range(1000))
+
+
+def test_zip_of_a_shared_upstream_is_rejected(client):
+    graph = split(client.graph()).zip("z", ["a", "b"]).sink("out", "z", OUT)
+    with pytest.raises(ValueError, match="zip 'z' reads 'a' and 'b' from a common upstream"):
+        graph.validate()
+
+
+def test_zip_pairs_inputs_and_drops_the_unpaired_tail(client, data_dir):
+    write_records(data_dir / "short.jsonl", 10)
+    graph = (
+        client.graph(queue_size=4)
+        .source("long", IN).source("short", "posix://data/short.jsonl")
+        .stage("l", "long", [JsonLinesDecoder()]).stage("r", "short", [JsonLinesDecoder()])
+        .zip("z", ["l", "r"], combine=lambda left, right: {"left": left["id"], "right": right["id"]}, subject=PayloadSubject.DICT)
+        .stage("enc", "z", [Encode()])
+        .sink("out", "enc", OUT)
+    )
+    assert graph.run() == {"out": 10}
+    assert read_records(data_dir / "out.jsonl") == [{"left": index, "right": index} for index in range(10)]
+    assert graph.dropped["z"] == 990
+
+
+def test_zip_requires_two_inputs(client):
+    with pytest.raises(ValueError, match="requires at least 2 inputs"):
+        client.graph().source("s", IN).zip("z", ["s"])
+
+
+def test_failed_graph_does_not_flush_downstream_nodes(client, data_dir):
+    count = Count()
+    graph = (
+        client.graph()
+        .source("source", IN)
+        .stage("decode", "source", [JsonLinesDecoder(), FailAfter(100)])
+        .stage("count", "decode", [count, Encode()])
+        .sink("out", "count", OUT)
+    )
+    with pytest.raises(PipelineError):
+        graph.run()
+
+    assert count.flushed == 0
+    assert read_records(data_dir / "out.jsonl") == []
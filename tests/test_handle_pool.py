@@ -0,0 +1,57 @@
+# tests/test_handle_pool.py
+import pytest
+
+from src.infrastructure.adapters.posix_file.adapter import PosixFileStream
+from src.infrastructure.adapters.posix_file.policy import PosixFilePolicy
+
+
+class Lockable(PosixFilePolicy):
+    """Refuses every location once locked."""
+    def __init__(self) -> None:
+        self.locked = False
+        self.checks = 0
+
+    def validate_access(self, resolved_config):
+        self.checks += 1
+        if self.locked:
+            raise PermissionError(f"Access to {resolved_config} is locked")
+        return super().validate_access(resolved_config)
+
+
+def checkout(client):
+    handle = client.get_handle("posix://data/in.jsonl", pooled=True)
+    with handle as stream:
+        next(stream.read())
+    return handle
+
+
+@pytest.fixture
+def policy(client):
+    policy = Lockable()
+    client._manager._registry.register("posix", adapter_cls=PosixFileStream, policy=policy)
+    return policy
+
+
+def test_pool_hit_reuses_the_adapter_with_a_new_passport(client, policy):
+    first, second = checkout(client), checkout(client)
+    assert first._adapter is second._adapter
+    assert first.context.trace_id != second.context.trace_id
+
+
+def test_pool_hit_runs_the_policy_check(client, policy):
+    checkout(client)
+    checkout(client)
+    assert policy.checks == 2
+
+    policy.locked = True
+    with pytest.raises(PermissionError):
+        client.get_handle("posix://data/in.jsonl", pooled=True)
+
+
+def test_reregistered_protocol_discards_the_idle_adapter(client, policy):
+    stale = checkout(client)._adapter
+    client._manager._registry.register("posix", adapter_cls=PosixFileStream, policy=Lockable())
+
+    fresh = checkout(client)._adapter
+    assert fresh is not stale
+    assert not stale.is_open
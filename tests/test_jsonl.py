@@ -0,0 +1,60 @@
+# tests/test_jsonl.py
+import json
+
+import pytest
+
+from src.app.domain.models.packet import Packet, PayloadSubject
+from src.app.domain.models.streams import StreamContext
+from src.infrastructure.processors import JsonLinesDecoder
+
+CONTEXT = StreamContext("memory://in.jsonl", "memory://in.jsonl", "trace")
+
+
+def decode(data: bytes, size: int, decoder=None):
+    decoder = decoder or JsonLinesDecoder()
+    decoder.open()
+    packets = [Packet(data[start:start + size], CONTEXT) for start in range(0, len(data), size)]
+    output = []
+    for packet in packets:
+        output += decoder.process(packet)
+    output += decoder.flush()
+    return [packet.payload for packet in output], decoder
+
+
+RECORDS = [{"id": index, "text": "x" * (index % 40)} for index in range(300)]
+DATA = b"".join(json.dumps(record).encode() + b"\n" for record in RECORDS)
+
+
+@pytest.mark.parametrize("size", [1, 13, 4096, len(DATA)])
+def test_lines_split_across_chunks_are_reassembled(size):
+    assert decode(DATA, size)[0] == RECORDS
+
+
+def test_last_line_without_newline_is_emitted_on_flush():
+    assert decode(DATA.rstrip(b"\n"), 100)[0] == RECORDS
+
+
+def test_batch_mode_emits_one_records_packet_per_chunk():
+    decoder = JsonLinesDecoder(batch=True)
+    decoder.open()
+    packets = list(decoder.process(Packet(DATA, CONTEXT)))
+    assert len(packets) == 1
+    assert packets[0].subject == PayloadSubject.RECORDS and packets[0].payload == RECORDS
+
+
+def test_malformed_lines_are_skipped_or_raised():
+    data = b'{"id": 1}\nnot json\n{"id": 2}\n'
+    records, decoder = decode(data, 7)
+    assert records == [{"id": 1}, {"id": 2}] and decoder.malformed_count == 1
+
+    with pytest.raises(ValueError, match="Malformed JSON line"):
+        decode(data, 7, JsonLinesDecoder(on_malformed="raise"))
+
+
+def test_oversized_line_is_discarded_up_to_its_newline():
+    data = b'{"id": 1}\n{"blob": "' + b"y" * 500 + b'"}\n{"id": 2}\n'
+    seen = []
+    records, decoder = decode(data, 16, JsonLinesDecoder(max_line_size=64, on_malformed=lambda line, error: seen.append(line)))
+
+    assert records == [{"id": 1}, {"id": 2}]
+    assert decoder.malformed_count == 1 and len(seen) == 1
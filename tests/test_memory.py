@@ -0,0 +1,40 @@
+# tests/test_memory.py
+from itertools import chain, repeat
+
+from src.app.use_cases.memory import CRITICAL, NORMAL, MemoryGovernor
+
+MB = 1024 * 1024
+
+
+def governor_with_rss(samples, budget=200 * MB):
+    """A governor whose RSS readings come from 'samples', the last one repeating (refreshed on every level query)."""
+    governor = MemoryGovernor(budget, poll_seconds=0.0, max_throttle_seconds=0.05)
+    readings = chain(samples, repeat(samples[-1]))
+    governor._rss = lambda: next(readings)
+    return governor
+
+
+def test_host_footprint_above_the_budget_is_not_pressure():
+    governor = governor_with_rss([500 * MB, 520 * MB])
+    assert governor.level is NORMAL
+    assert governor.level is NORMAL
+    assert governor.usage()["rss_baseline"] == 500 * MB
+
+
+def test_rss_growth_above_the_baseline_is_pressure():
+    governor = governor_with_rss([500 * MB, 720 * MB])
+    assert governor.level is NORMAL
+    assert governor.level is CRITICAL
+
+
+def test_small_queues_are_not_throttled():
+    governor = MemoryGovernor(MB, watch_rss=False, poll_seconds=0.0, max_throttle_seconds=0.05)
+    hog = governor.reserve("hog", 2 * MB, force=True)
+    assert governor.level is CRITICAL
+
+    governor.throttle(lambda: 1, held=lambda: 1024)
+    assert governor.throttled == 0
+
+    governor.throttle(lambda: 1, held=lambda: MB // 2)
+    assert governor.throttled == 1
+    hog.release()
@@ -0,0 +1,49 @@
+# tests/test_partitioned.py
+import pytest
+
+from src.app.domain.models.packet import PayloadSubject
+from src.app.ports.output.middleware_processor import MapProcessor
+from src.app.use_cases.pipeline import PipelineError
+from src.app.use_cases.pipeline.executors import PartitionedProcessor
+from src.infrastructure.processors import JsonLinesDecoder
+from tests.conftest import RECORDS
+from tests.support import CountByKey, payloads
+
+KEYS = 10
+
+
+class Keyed(MapProcessor):
+    name = "keyed"
+    input_subject = PayloadSubject.DICT
+    output_subject = PayloadSubject.DICT
+
+    def transform(self, payload):
+        return {**payload, "key": payload["id"] % KEYS}
+
+
+def keyed(client):
+    return client.pipeline("posix://data/in.jsonl").pipe(JsonLinesDecoder()).pipe(Keyed())
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_every_key_is_counted_by_a_single_instance(client, executor):
+    pipeline = keyed(client).partition(CountByKey, key=lambda payload: payload["key"], partitions=4, executor=executor, batch_size=16)
+    output = payloads(pipeline)
+
+    # One row per key: no key was split across instances
+    assert sorted(row["key"] for row in output) == list(range(KEYS))
+    assert all(row["count"] == RECORDS // KEYS for row in output)
+    # Order is preserved within a partition
+    assert all(row["ids"] == sorted(row["ids"]) for row in output)
+
+
+def test_partition_of_is_stable():
+    stage = PartitionedProcessor(CountByKey, key=lambda payload: payload["key"], partitions=4)
+    assert {stage.partition_of({"key": "a"}) for _ in range(10)} == {stage.partition_of({"key": "a"})}
+    assert stage.name == "count_by_key[by key x4]"
+
+
+def test_key_function_failure_is_labelled(client):
+    pipeline = keyed(client).partition(CountByKey, key=lambda payload: payload["missing"], partitions=2)
+    with pytest.raises(PipelineError, match="computing the partition key"):
+        payloads(pipeline)
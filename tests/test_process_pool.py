@@ -0,0 +1,44 @@
+# tests/test_process_pool.py
+import pytest
+
+from src.app.use_cases.pipeline import PipelineError
+from src.app.use_cases.pipeline.executors import ProcessPoolProcessor
+from src.infrastructure.processors import JsonLinesDecoder
+from tests.conftest import RECORDS
+from tests.support import Count, Jitter, payloads
+
+
+class Boom(Jitter):
+    def transform(self, payload):
+        if payload["id"] == 500:
+            raise ValueError("bad record")
+        return payload
+
+
+def test_ordered_pool_preserves_the_input_order(client):
+    pipeline = client.pipeline("posix://data/in.jsonl").pipe(JsonLinesDecoder()).parallel(Jitter, workers=3, batch_size=8)
+    output = payloads(pipeline)
+
+    assert [record["id"] for record in output] == list(range(RECORDS))
+    assert len({record["pid"] for record in output}) == 3
+
+
+def test_unordered_pool_delivers_every_record(client):
+    pipeline = client.pipeline("posix://data/in.jsonl").pipe(JsonLinesDecoder()).parallel(Jitter, workers=3, batch_size=8, ordered=False)
+    assert sorted(record["id"] for record in payloads(pipeline)) == list(range(RECORDS))
+
+
+def test_flush_reaches_every_worker_instance(client):
+    pipeline = client.pipeline("posix://data/in.jsonl").pipe(JsonLinesDecoder()).parallel(Count, workers=3, batch_size=8)
+    counts = [record["count"] for record in payloads(pipeline)]
+    assert len(counts) == 3 and sum(counts) == RECORDS
+
+
+def test_worker_failure_fails_the_run(client):
+    pipeline = client.pipeline("posix://data/in.jsonl").pipe(JsonLinesDecoder()).parallel(Boom, workers=2, batch_size=8)
+    with pytest.raises(PipelineError):
+        payloads(pipeline)
+
+
+def test_pool_stage_is_not_checkpointable():
+    assert not ProcessPoolProcessor(Jitter, workers=1).checkpointable
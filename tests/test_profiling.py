@@ -0,0 +1,74 @@
+# tests/test_profiling.py
+import cProfile
+
+import pytest
+
+from src.app.use_cases.pipeline import PipelineError
+from src.infrastructure.processors import JsonLinesDecoder
+from tests.conftest import RECORDS
+from tests.support import Encode, ExitSpy, FailAfter
+
+
+class SingleActiveProfile(cProfile.Profile):
+    """Python 3.12+ semantics on any version: only one profiler may be active per process."""
+    active = None
+
+    def enable(self, *args, **kwargs):
+        if SingleActiveProfile.active not in (None, self):
+            raise ValueError("Another profiling tool is already active")
+        SingleActiveProfile.active = self
+        super().enable(*args, **kwargs)
+
+    def disable(self):
+        super().disable()
+        SingleActiveProfile.active = None
+
+
+@pytest.fixture
+def single_profiler(monkeypatch):
+    monkeypatch.setattr(cProfile, "Profile", SingleActiveProfile)
+
+
+@pytest.mark.parametrize("engine", [{}, {"threaded": True}, {"threaded": True, "batch_size": 16}])
+def test_cprofile_runs_with_concurrent_stages(client, data_dir, single_profiler, engine):
+    report = data_dir / "run.folded"
+    written = (
+        client.pipeline("posix://data/in.jsonl", chunk_size=256)
+        .pipe(JsonLinesDecoder())
+        .pipe(Encode())
+        .write("posix://data/out.jsonl")
+        .profile(report, cprofile=True)
+        .run(**engine)
+    )
+    assert written == RECORDS
+    assert "jsonl.py" in report.read_text()
+
+
+def test_cprofile_runs_with_tee_branches(client, data_dir, single_profiler):
+    delivered = (
+        client.pipeline("posix://data/in.jsonl")
+        .pipe(JsonLinesDecoder())
+        .pipe(Encode())
+        .write("posix://data/out.jsonl")
+        .tee("posix://data/copy.jsonl", processors=[])
+        .profile(data_dir / "tee.folded", cprofile=True)
+        .run()
+    )
+    assert set(delivered.values()) == {RECORDS}
+
+
+@pytest.mark.parametrize("engine", [{}, {"threaded": True}, {"batch_size": 16}])
+def test_profiled_stage_receives_the_failure(client, data_dir, engine):
+    spy = ExitSpy()
+    pipeline = (
+        client.pipeline("posix://data/in.jsonl")
+        .pipe(JsonLinesDecoder())
+        .pipe(spy)
+        .pipe(FailAfter(100))
+        .pipe(Encode())
+        .write("posix://data/out.jsonl")
+        .profile(data_dir / "failed.folded")
+    )
+    with pytest.raises(PipelineError):
+        pipeline.run(**engine)
+    assert spy.exits == [PipelineError]
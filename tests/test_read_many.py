@@ -0,0 +1,80 @@
+# tests/test_read_many.py
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from src.app.use_cases.concurrent_reader import ConcurrentReader
+from tests.support import write_records
+
+SOURCES = 6
+
+
+@pytest.fixture
+def uris(data_dir):
+    for index in range(SOURCES):
+        write_records(data_dir / f"part-{index}.jsonl", 50 + index)
+    return [f"posix://data/part-{index}.jsonl" for index in range(SOURCES)]
+
+
+def test_ordered_read_concatenates_the_sources(client, data_dir, uris):
+    data = b"".join(packet.payload for packet in client.read_many(uris, max_concurrency=3, ordered=True, chunk_size=64))
+    assert data == b"".join((data_dir / f"part-{index}.jsonl").read_bytes() for index in range(SOURCES))
+
+
+def test_unordered_read_keeps_each_source_in_order(client, data_dir, uris):
+    per_source = {}
+    for packet in client.read_many(uris, max_concurrency=3, chunk_size=64):
+        per_source.setdefault(packet.context.origin, []).append(packet.payload)
+
+    assert len(per_source) == SOURCES
+    for index, uri in enumerate(uris):
+        assert b"".join(per_source[uri]) == (data_dir / f"part-{index}.jsonl").read_bytes()
+
+
+class Slow:
+    """Stand-in handle factory tracking how many handles are open at once."""
+    def __init__(self, fail=None):
+        self.active = 0
+        self.peak = 0
+        self.fail = fail
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def __call__(self, uri):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def read(self):
+        for index in range(3):
+            time.sleep(0.005)
+            if index == 1 and self.fail:
+                raise self.fail
+            yield index
+
+
+def test_concurrency_is_bounded():
+    handles = Slow()
+    items = list(ConcurrentReader(handles, max_concurrency=2).read([str(index) for index in range(8)]))
+    assert len(items) == 24
+    assert handles.peak == 2
+
+
+def test_source_error_reaches_the_consumer():
+    with pytest.raises(OSError, match="disk gone"):
+        list(ConcurrentReader(Slow(fail=OSError("disk gone")), max_concurrency=2).read(["a", "b"]))
+
+
+def test_early_exit_releases_every_handle():
+    handles = Slow()
+    packets = ConcurrentReader(handles, max_concurrency=4, queue_size=1).read([str(index) for index in range(8)])
+    next(packets)
+    packets.close()
+    assert handles.active == 0
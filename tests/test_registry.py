@@ -0,0 +1,46 @@
+# tests/test_registry.py
+import pytest
+
+from benchmarks.startup import measure
+from src.app.registry.streams import LazyRegistration, ProtocolRegistration, StreamRegistry
+from src.infrastructure.adapters.posix_file.adapter import PosixFileStream
+
+ADAPTER_PATH = "src.infrastructure.adapters.posix_file.adapter:PosixFileStream"
+
+
+def test_lazy_registration_resolves_once_on_first_use():
+    registry = StreamRegistry()
+    registry.register("local", ADAPTER_PATH)
+    assert isinstance(registry._protocols["local"], LazyRegistration)
+
+    registration = registry.get_registration("local")
+    assert registration.adapter_cls is PosixFileStream
+    assert registry.get_registration("local") is registration
+    assert isinstance(registry._protocols["local"], ProtocolRegistration)
+
+
+def test_lazy_target_must_be_an_adapter():
+    registry = StreamRegistry()
+    registry.register("broken", "pathlib:Path")
+    with pytest.raises(TypeError, match="must resolve to a DataStream subclass"):
+        registry.get_registration("broken")
+
+    registry.register("malformed", "no_attribute")
+    with pytest.raises(ValueError, match="Invalid import path"):
+        registry.get_registration("malformed")
+
+
+def test_entry_points_are_scanned_once_on_the_first_unknown_protocol(monkeypatch):
+    registry = StreamRegistry(discover_entry_points=True)
+    scans = []
+    monkeypatch.setattr(registry, "discover", lambda: scans.append(1))
+
+    assert not registry.is_supported("s3")
+    assert not registry.is_supported("gcs")
+    assert scans == [1]
+    with pytest.raises(ValueError, match="No adapter registered"):
+        registry.get_registration("s3")
+
+
+def test_startup_does_not_import_deferred_modules():
+    assert measure(runs=1)["leaked_modules"] == []
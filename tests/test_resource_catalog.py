@@ -0,0 +1,59 @@
+# tests/test_resource_catalog.py
+import os
+import shutil
+
+import pytest
+
+from src.app import StreamClient
+
+
+def read_bytes(client, uri):
+    return b"".join(packet.payload for packet in client.read(uri))
+
+
+@pytest.fixture
+def tree(tmp_path):
+    anchor = tmp_path / "anchor"
+    (anchor / "sub").mkdir(parents=True)
+    (anchor / "sub" / "f.txt").write_bytes(b"public")
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "f.txt").write_bytes(b"secret")
+    return anchor, outside
+
+
+@pytest.fixture
+def registry_client(tree):
+    client = StreamClient({"log_level": "NONE"})
+    client.add_resource("data", "posix", str(tree[0]))
+    yield client
+    client.close()
+
+
+def test_cached_resolution_rechecks_the_boundary_after_a_symlink_swap(registry_client, tree):
+    anchor, outside = tree
+    assert read_bytes(registry_client, "registry://data/sub/f.txt") == b"public"
+
+    shutil.rmtree(anchor / "sub")
+    os.symlink(outside, anchor / "sub")
+
+    with pytest.raises(PermissionError, match="Boundary Violation"):
+        read_bytes(registry_client, "registry://data/sub/f.txt")
+
+
+def test_traversal_is_refused_on_every_attempt(registry_client):
+    for _ in range(2):
+        with pytest.raises(PermissionError, match="Boundary Violation"):
+            registry_client.resolve("registry://data/../outside/f.txt")
+
+
+def test_add_anchor_invalidates_cached_resolutions(registry_client, tree, tmp_path):
+    first = registry_client.resolve("registry://data/sub/f.txt")
+
+    moved = tmp_path / "moved"
+    shutil.copytree(tree[0], moved)
+    registry_client.add_resource("data", "posix", str(moved))
+
+    second = registry_client.resolve("registry://data/sub/f.txt")
+    assert str(first) != str(second)
+    assert str(second).startswith(str(moved.resolve()))
@@ -0,0 +1,32 @@
+# tests/test_resource_identity.py
+import sys
+
+import pytest
+
+from src.app.domain.models.resource_identity import LogicalURI, PhysicalURI, RemoteURL
+
+
+def test_logical_uri_components_are_parsed_at_construction():
+    uri = LogicalURI("posix://data/reports/2024.csv?rev=3")
+    assert (uri.protocol, uri.key, uri.path, uri.query) == ("posix", "data", "reports/2024.csv", "rev=3")
+    assert uri == "posix://data/reports/2024.csv?rev=3"
+    # Components live in slots: no per-instance __dict__
+    assert not hasattr(uri, "__dict__")
+
+
+def test_physical_uri_components_are_parsed_at_construction():
+    uri = RemoteURL("https://example.com/a/b.json?page=2")
+    assert (uri.protocol, uri.key, uri.address, uri.query) == ("https", "example.com", "example.com/a/b.json?page=2", "page=2")
+    assert PhysicalURI("file:///srv/data/a.csv").address == "/srv/data/a.csv"
+
+
+def test_schemes_are_interned():
+    scheme = "".join(["po", "six"])
+    assert LogicalURI(scheme + "://data/a").protocol is sys.intern("posix")
+    assert PhysicalURI(scheme + "://data/a").protocol is sys.intern("posix")
+
+
+@pytest.mark.parametrize("cls", [LogicalURI, PhysicalURI])
+def test_uri_without_a_scheme_is_rejected(cls):
+    with pytest.raises(ValueError):
+        cls("data/a.csv")
@@ -0,0 +1,42 @@
+# tests/test_settings.py
+import pytest
+
+from src.app.domain.models.app_config import AppConfig
+from src.app.domain.models.settings_signature import settings_signature
+from src.app.domain.services.settings_resolver import SettingsResolver
+from src.infrastructure.adapters.posix_file.contract import PosixFileContract
+
+
+def test_signature_keeps_value_types_apart():
+    assert len({settings_signature({"x": value}) for value in (1, 1.0, True)}) == 3
+    assert settings_signature({"headers": {"a": "b"}}) is None
+
+
+def test_identical_settings_reuse_the_validated_contract():
+    spec = PosixFileContract.spec()
+    first = spec.hydrate({"chunk_size": 64, "unrelated": "ignored"})
+    assert first.chunk_size == 64
+    assert spec.hydrate({"chunk_size": 64}) is first
+    assert spec.hydrate({"chunk_size": 128}) is not first
+
+
+def test_contract_type_checks_still_run():
+    with pytest.raises(TypeError, match="Contract Violation"):
+        PosixFileContract.spec().hydrate({"chunk_size": "64"})
+
+
+def test_resolution_layers_overrides_over_the_app_config():
+    config = AppConfig()
+    settings = SettingsResolver.resolve(config, {"chunk_size": 64})
+    assert settings["chunk_size"] == 64 and settings["pool_ttl"] == config.pool_ttl
+    assert SettingsResolver.resolve(config, {"chunk_size": 64}) is settings
+    with pytest.raises(TypeError):
+        settings["chunk_size"] = 1
+
+
+def test_unhashable_overrides_are_merged_every_time():
+    config = AppConfig()
+    headers = {"Accept": "application/json"}
+    settings = SettingsResolver.resolve(config, {"headers": headers})
+    assert settings["headers"] is headers
+    assert SettingsResolver.resolve(config, {"headers": headers}) is not settings
@@ -0,0 +1,56 @@
+# tests/test_sort.py
+import random
+
+import pytest
+
+from src.app.domain.models.packet import Packet, PayloadSubject
+from src.app.domain.models.streams import StreamContext
+from src.infrastructure.processors import ExternalSort
+
+CONTEXT = StreamContext("memory://events", "memory://events", "trace")
+
+
+def sort(payloads, **options):
+    sorter = ExternalSort(**options)
+    sorter.open()
+    for payload in payloads:
+        assert list(sorter.process(Packet(payload, CONTEXT, subject=PayloadSubject.DICT))) == []
+    output = [packet.payload for packet in sorter.flush()]
+    sorter.close()
+    return output, sorter
+
+
+def shuffled(count, seed=0):
+    records = [{"id": index, "group": index % 17} for index in range(count)]
+    random.Random(seed).shuffle(records)
+    return records
+
+
+def test_small_input_is_sorted_in_memory():
+    output, sorter = sort(shuffled(500), key=lambda payload: payload["id"])
+    assert [record["id"] for record in output] == list(range(500))
+    assert sorter.spilled_runs == 0
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_spilled_runs_are_merged_in_order(tmp_path, reverse):
+    records = shuffled(2000)
+    output, sorter = sort(records, key=lambda payload: payload["id"], memory_limit=8 * 1024, fan_in=2, reverse=reverse, spill_dir=tmp_path)
+
+    assert [record["id"] for record in output] == sorted(range(2000), reverse=reverse)
+    assert sorter.spilled_runs > 4
+    # Run files and the scratch directory are gone after close()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_equal_keys_keep_their_arrival_order(tmp_path):
+    records = shuffled(2000)
+    output, _ = sort(records, key=lambda payload: payload["group"], memory_limit=8 * 1024, fan_in=2, spill_dir=tmp_path)
+    assert output == sorted(records, key=lambda payload: payload["group"])
+
+
+def test_sort_cannot_be_checkpointed():
+    sorter = ExternalSort()
+    assert not sorter.checkpointable
+    with pytest.raises(RuntimeError, match="cannot be checkpointed"):
+        sorter.snapshot()
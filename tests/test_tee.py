@@ -0,0 +1,96 @@
+# tests/test_tee.py
+import time
+
+import pytest
+
+from src.app.use_cases.pipeline import PipelineError
+from src.infrastructure.processors import JsonLinesDecoder
+from tests.conftest import RECORDS
+from tests.support import Count, Encode, FailAfter, Square, read_records
+
+
+class Slow(Encode):
+    def transform(self, payload):
+        time.sleep(0.0005)
+        return super().transform(payload)
+
+
+def decoded(client, **settings):
+    return client.pipeline("posix://data/in.jsonl", **settings).pipe(JsonLinesDecoder())
+
+
+def test_every_branch_receives_every_packet(client, data_dir):
+    delivered = (
+        decoded(client)
+        .tee("posix://data/plain.jsonl", processors=[Encode()], name="plain")
+        .tee("posix://data/squares.jsonl", processors=[Square(), Encode()], name="squares")
+        .tee(processors=[Count()], name="count")
+        .run()
+    )
+
+    assert delivered == {"plain": RECORDS, "squares": RECORDS, "count": 1}
+    assert read_records(data_dir / "plain.jsonl") == [{"id": i} for i in range(RECORDS)]
+    assert [record["square"] for record in read_records(data_dir / "squares.jsonl")] == [i * i for i in range(RECORDS)]
+
+
+def test_write_becomes_the_sink_branch(client, data_dir):
+    delivered = decoded(client).pipe(Encode()).tee(processors=[], name="other").write("posix://data/out.jsonl").run()
+    assert delivered == {"other": RECORDS, "sink": RECORDS}
+    assert len(read_records(data_dir / "out.jsonl")) == RECORDS
+
+
+def test_drop_policy_only_skips_the_slow_branch(client, data_dir):
+    tee = (
+        decoded(client, chunk_size=64)
+        .tee("posix://data/fast.jsonl", processors=[Encode()], name="fast")
+        .tee("posix://data/slow.jsonl", processors=[Slow()], name="slow", policy="drop", buffer_size=1)
+        .build_tee()
+    )
+    delivered = tee.run()
+
+    assert delivered["fast"] == RECORDS
+    assert delivered["slow"] + tee.dropped["slow"] == RECORDS
+    assert tee.dropped["slow"] > 0 and tee.dropped["fast"] == 0
+
+
+def test_spill_policy_keeps_every_packet_in_order(client, data_dir):
+    tee = (
+        decoded(client, chunk_size=64)
+        .tee("posix://data/fast.jsonl", processors=[Encode()], name="fast")
+        .tee("posix://data/slow.jsonl", processors=[Slow()], name="slow", policy="spill", buffer_size=1, spill_dir=str(data_dir))
+        .build_tee()
+    )
+    assert tee.run() == {"fast": RECORDS, "slow": RECORDS}
+    assert read_records(data_dir / "slow.jsonl") == [{"id": i} for i in range(RECORDS)]
+
+
+def test_branch_names_must_be_unique(client):
+    with pytest.raises(ValueError, match="branch names must be unique"):
+        decoded(client).tee(processors=[Count()], name="a").tee(processors=[Count()], name="a").build_tee()
+
+
+def test_tee_source_failure_writes_nothing_more_to_the_branches(client, data_dir):
+    tee = (
+        client.pipeline("posix://data/in.jsonl", chunk_size=256)
+        .pipe(JsonLinesDecoder())
+        .pipe(FailAfter(100))
+        .tee("posix://data/counted.jsonl", processors=[Count(), Encode()], name="counted")
+    )
+    with pytest.raises(PipelineError):
+        tee.run()
+
+    assert read_records(data_dir / "counted.jsonl") == []
+
+
+def test_tee_branch_failure_discards_the_flush_of_the_others(client, data_dir):
+    # 'bad' fails in flush() while 'slow' is still flushing: its count must not be committed
+    tee = (
+        client.pipeline("posix://data/in.jsonl")
+        .pipe(JsonLinesDecoder())
+        .tee("posix://data/bad.jsonl", processors=[Count(fail=True), Encode()], name="bad")
+        .tee("posix://data/slow.jsonl", processors=[Count(delay=0.2), Encode()], name="slow")
+    )
+    with pytest.raises(PipelineError):
+        tee.build_tee().run()
+
+    assert read_records(data_dir / "slow.jsonl") == []
@@ -0,0 +1,83 @@
+# tests/test_telemetry.py
+import pytest
+
+from src.app.domain.models.telemetry import StageMetrics
+from src.app.use_cases.pipeline import PipelineError
+from src.app.use_cases.pipeline.metering import MeteredProcessor
+from src.infrastructure.processors import JsonLinesDecoder
+from tests.conftest import RECORDS
+from tests.support import Encode, ExitSpy, FailAfter
+
+ENGINES = [{}, {"threaded": True}, {"batch_size": 16}]
+
+
+def components(client):
+    merged = {}
+    for trace in client.metrics().values():
+        merged.update(trace["components"])
+    return merged
+
+
+def run(client, **engine):
+    return (
+        client.pipeline("posix://data/in.jsonl", chunk_size=256)
+        .pipe(JsonLinesDecoder())
+        .pipe(Encode())
+        .write("posix://data/out.jsonl")
+        .run(**engine)
+    )
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_stage_counters_match_the_records(client, engine):
+    assert run(client, **engine) == RECORDS
+    metrics = components(client)
+
+    decoder, encode = metrics["jsonl_decoder"], metrics["encode"]
+    assert decoder["kind"] == encode["kind"] == "stage"
+    assert decoder["packets_out"] == encode["packets_in"] == encode["packets_out"] == RECORDS
+    assert decoder["bytes_in"] == encode["bytes_out"] == metrics["posix://data/out.jsonl"]["bytes_in"]
+    assert encode["latency"]["samples"] > 0
+
+
+def test_failed_stage_counts_an_error(client):
+    pipeline = (
+        client.pipeline("posix://data/in.jsonl")
+        .pipe(JsonLinesDecoder())
+        .pipe(FailAfter(10))
+        .pipe(Encode())
+        .write("posix://data/out.jsonl")
+    )
+    with pytest.raises(PipelineError):
+        pipeline.run()
+    assert components(client)["fail_after"]["errors"] == 1
+
+
+def test_export_writes_prometheus_text(client, data_dir):
+    run(client)
+    path = client.export_metrics(str(data_dir / "metrics.prom"))
+    text = (data_dir / "metrics.prom").read_text()
+
+    assert str(path).endswith("metrics.prom")
+    assert "# TYPE streamflow_packets_in_total counter" in text
+    assert "# TYPE streamflow_latency_seconds histogram" in text
+    assert f'kind="stage",name="encode"}} {RECORDS}' in text
+
+
+def test_disabled_telemetry_records_nothing(data_dir):
+    from src.app import StreamClient
+    client = StreamClient({"log_level": "NONE", "enable_telemetry": False})
+    client.add_resource("data", "posix", str(data_dir))
+    try:
+        assert run(client) == RECORDS
+        assert client.metrics() == {}
+    finally:
+        client.close()
+
+
+def test_metered_stage_receives_the_failure():
+    spy = ExitSpy()
+    metered = MeteredProcessor(spy, StageMetrics("trace", spy.name))
+    metered.__exit__(ValueError, ValueError("boom"), None)
+    metered.__exit__(None, None, None)
+    assert spy.exits == [ValueError, None]
@@ -0,0 +1,71 @@
+# tests/test_tracing.py
+import json
+
+import pytest
+
+from src.app import StreamClient
+from src.app.use_cases.pipeline import PipelineError
+from src.infrastructure.processors import JsonLinesDecoder
+from tests.conftest import RECORDS
+from tests.support import Encode, ExitSpy, FailAfter
+
+
+@pytest.fixture
+def traced(data_dir):
+    client = StreamClient({"log_level": "NONE", "trace_path": str(data_dir / "spans.jsonl")})
+    client.add_resource("data", "posix", str(data_dir))
+    yield client
+    client.close()
+
+
+def spans(path):
+    exported = []
+    with open(path) as handle:
+        for line in handle:
+            for resource in json.loads(line)["resourceSpans"]:
+                for scope in resource["scopeSpans"]:
+                    exported.extend(scope["spans"])
+    return exported
+
+
+def pipeline(client, *stages):
+    builder = client.pipeline("posix://data/in.jsonl").pipe(JsonLinesDecoder())
+    for stage in stages:
+        builder = builder.pipe(stage)
+    return builder.pipe(Encode()).write("posix://data/out.jsonl")
+
+
+def test_run_exports_one_tree_per_pipeline(traced, data_dir):
+    assert pipeline(traced).run() == RECORDS
+    traced.close()
+
+    exported = spans(data_dir / "spans.jsonl")
+    by_id = {span["spanId"]: span for span in exported}
+    (root,) = [span for span in exported if span["name"] == "pipeline"]
+    stages = {span["name"]: span for span in exported if span.get("parentSpanId") == root["spanId"]}
+
+    assert {"jsonl_decoder", "encode", "handle"} <= set(stages)
+    assert all(span["traceId"] == root["traceId"] for span in stages.values())
+    # Sampled per-Packet spans hang below their stage
+    for span in exported:
+        if span["name"] == "process":
+            assert by_id[span["parentSpanId"]]["name"] in ("jsonl_decoder", "encode")
+
+
+def test_failed_run_span_carries_the_error(traced, data_dir):
+    with pytest.raises(PipelineError):
+        pipeline(traced, FailAfter(100)).run()
+    traced.close()
+
+    exported = {span["name"]: span for span in spans(data_dir / "spans.jsonl")}
+    assert exported["pipeline"]["status"]["code"] == 2
+    assert "fail_after" in exported["pipeline"]["status"]["message"]
+    assert "status" not in exported["jsonl_decoder"]
+
+
+@pytest.mark.parametrize("engine", [{}, {"threaded": True}, {"batch_size": 16}])
+def test_traced_stage_receives_the_failure(traced, engine):
+    spy = ExitSpy()
+    with pytest.raises(PipelineError):
+        pipeline(traced, spy, FailAfter(100)).run(**engine)
+    assert spy.exits == [PipelineError]
@@ -0,0 +1,101 @@
+# tests/test_window.py
+from src.app.domain.models.packet import Packet, PayloadSubject
+from src.app.domain.models.streams import StreamContext
+from src.infrastructure.processors import WindowAggregator
+
+CONTEXT = StreamContext("memory://events", "memory://events", "trace")
+
+
+def run(aggregator, times):
+    aggregator.open()
+    output = []
+    for time in times:
+        output += aggregator.process(Packet({"t": time, "v": time}, CONTEXT, subject=PayloadSubject.DICT))
+    output += aggregator.flush()
+    aggregator.close()
+    return [packet.payload for packet in output]
+
+
+def windows(times, window="tumbling", **options):
+    """Feeds one event per time into windows of size 10 and returns (start, count, evicted) per window, plus late_count."""
+    aggregator = WindowAggregator(
+        timestamp=lambda payload: payload["t"],
+        aggregates={"n": ("count",)},
+        window=window,
+        size=10,
+        **options
+    )
+    rows = run(aggregator, times)
+    return [(row["window_start"], row["n"], row.get("evicted", False)) for row in rows], aggregator.late_count
+
+
+def sessions(times, allowed_lateness=0.0, **options):
+    """Feeds one event per time ('v' = time) and returns (start, end, count, sum) per session, plus late_count."""
+    aggregator = WindowAggregator(
+        timestamp=lambda payload: payload["t"],
+        aggregates={"n": ("count",), "s": ("sum", "v")},
+        window="session",
+        gap=10,
+        allowed_lateness=allowed_lateness,
+        **options
+    )
+    rows = [(row["window_start"], row["window_end"], row["n"], row["s"]) for row in run(aggregator, times)]
+    return rows, aggregator.late_count
+
+
+def test_event_behind_the_watermark_does_not_open_a_window():
+    # No window was ever emitted for [10, 20), but the watermark (100) is already past it
+    assert windows([100, 10]) == ([(100, 1, False)], 1)
+
+
+def test_sliding_event_is_late_only_for_windows_behind_the_watermark():
+    # Watermark 64: t=56 is late for [50, 60) but still counts in [55, 65)
+    rows, late = windows([52, 70, 56], window="sliding", slide=5, allowed_lateness=6)
+    assert late == 1
+    assert (55, 1, False) in rows and (50, 1, False) in rows
+
+
+def test_allowed_lateness_keeps_windows_open():
+    rows, late = windows([100, 95], allowed_lateness=10)
+    assert sorted(rows) == [(90, 1, False), (100, 1, False)] and late == 0
+
+
+def test_reopened_evicted_window_is_flagged_again():
+    rows, late = windows([1, 11, 2], max_open_windows=1, allowed_lateness=100)
+    assert late == 0
+    # [0, 10) was evicted with one event, re-opened by t=2: both parts are flagged
+    assert sorted(rows) == [(0, 1, True), (0, 1, True), (10, 1, True)]
+
+
+def test_late_event_is_dropped_instead_of_opening_a_session():
+    # t=2 arrives after the watermark passed 2 + gap: its session was already emitted
+    assert sessions([0, 1, 45, 2]) == ([(0, 11, 2, 1), (45, 55, 1, 45)], 1)
+
+
+def test_event_bridging_two_sessions_merges_them():
+    assert sessions([0, 18, 9], allowed_lateness=100) == ([(0, 28, 3, 27)], 0)
+
+
+def test_backward_extension_merges_with_the_earlier_session():
+    assert sessions([20, 5, 12], allowed_lateness=100) == ([(5, 30, 3, 37)], 0)
+
+
+def test_session_reopened_after_eviction_is_flagged_again():
+    aggregator = WindowAggregator(
+        timestamp=lambda payload: payload["t"],
+        aggregates={"n": ("count",)},
+        window="session",
+        gap=10,
+        allowed_lateness=100,
+        max_open_windows=1
+    )
+    rows = run(aggregator, [0, 50, 5])
+    assert [(row["window_start"], row["n"], row.get("evicted", False)) for row in rows] == [
+        (0, 1, True), (50, 1, True), (5, 1, True)
+    ]
+
+
+def test_sessions_separated_by_the_gap_stay_apart():
+    rows, late = sessions([0, 5, 100, 3, 200])
+    assert rows == [(0, 15, 2, 5), (100, 110, 1, 100), (200, 210, 1, 200)]
+    assert late == 1